@@ -1,8 +1,8 @@
 #! /usr/bin/env python3
 
+import argparse
 import sys
 
-from ui import *
 from model import *
 from service import *
 from service.Physics import *
@@ -10,56 +10,154 @@ from service.Physics import *
 from time import sleep
 
 class Game:
-    def __init__(self, Player1, Player2):
+    def __init__(self, Player1, Player2, headless = False, map_file = './maps/map_01.txt', seed = None, record = None, timeline = None, pool = None, metrics = None, server = None, forkServer = None):
         Config.Initialize()
         Ruleset.Initialize()
 
         Physics.SetInstance(PythonPhysics())
-    
-        self.Model      = GameModel(Player1, Player2)
 
-        uiFactory = PygameFactory(self.Model)
+        # A headless game has no window and runs on its own clock, as fast as the players answer
+        self.Clock      = VirtualClock() if headless else None
 
-        self.View       = uiFactory.getView()
-        self.Controller = uiFactory.getController()
+        # Everything needed to play the game again is written in the record file
+        # The state of each tick is written in the timeline file, to watch the game afterwards
+        recorders       = list()
+
+        if record:
+            recorders.append(ReplayRecorder(record))
+        if timeline:
+            recorders.append(TimelineRecorder(timeline))
+
+        self.Model      = GameModel(Player1, Player2, map_file, clock = self.Clock, seed = seed, recorders = recorders, pool = pool, metrics = metrics, server = server, forkServer = forkServer)
+
+        self.View       = None
+        self.Controller = None
+
+        if not headless:
+            # pygame is only needed when the game is displayed
+            from ui import PygameFactory
+
+            uiFactory = PygameFactory(self.Model)
+
+            self.View       = uiFactory.getView()
+            self.Controller = uiFactory.getController()
 
 
     def gameLoop(self):
         print("Game starting")
-        
+
         running = True
 
-        runningStopwatch = TimeManager()
+        runningStopwatch = TimeManager() if self.Clock is None else VirtualTimeManager(self.Clock)
         runningStopwatch.StartTimer()
 
         while running:
 
             deltaTime = runningStopwatch.NextFrame()
-                
+
             runningStopwatch.Mark()
 
             self.Model.tick(deltaTime)
-            self.Controller.tick(deltaTime)
-            self.View.tick(deltaTime)
+
+            if self.Clock is None:
+                self.Controller.tick(deltaTime)
+                self.View.tick(deltaTime)
+            else:
+                # Nobody is watching a headless game, stop as soon as it is over
+                running = not self.Model.game_over
 
             # running = False # Game over
 
         runningStopwatch.StopTimer()
 
+        if self.Clock is not None:
+            self.Model.stop()
+
         print("Game closing")
-        pass
+        return self.Model.winner
+
+def replayGame(path, timeline = None):
+    """
+    Plays a recorded game again, without the players, and checks that it unfolds the same way.
+
+    When timeline is given, the game is written there as well, to be watched.
+    """
+    Config.Initialize()
+    Ruleset.Initialize()
+
+    Physics.SetInstance(PythonPhysics())
+
+    reader = ReplayReader(path)
+    model = reader.replay(recorders = [TimelineRecorder(timeline)] if timeline else None)
+
+    print("Replayed {} turns of seed {} on {}, winner : {}".format(model.turn, reader.header["seed"], reader.header["map"], model.winner))
+
+def watchGame(path):
+    """
+    Displays a timeline file, in which one can move freely. See TimelineController for the keys.
+    """
+    Config.Initialize()
+
+    Physics.SetInstance(PythonPhysics())
+
+    # pygame is only needed when the game is displayed
+    from ui import PygameView, TimelineController
+
+    model = TimelineModel(TimelineReader(path))
+    view = PygameView(model)
+    controller = TimelineController(model, view)
+
+    stopwatch = TimeManager()
+    stopwatch.StartTimer()
+
+    while True:
+        deltaTime = stopwatch.NextFrame()
+        stopwatch.Mark()
+
+        model.tick(deltaTime)
+        controller.tick(deltaTime)
+        view.tick(deltaTime)
 
 # Make this an executable file
 if __name__ == "__main__":
-    if len(sys.argv) == 1:
-        import ai.playerTest.myPlayer as PlayerPackage1
-        import ai.playerTest.myPlayer as PlayerPackage2
-    elif len(sys.argv) == 2:
-        exec("import {} as PlayerPackage1".format(sys.argv[1]))
-        import ai.playerTest.myPlayer as PlayerPackage2
-    else:
-        exec("import {} as PlayerPackage1".format(sys.argv[1]))
-        exec("import {} as PlayerPackage2".format(sys.argv[2]))
-
-    game = Game(PlayerPackage1.myPlayer,PlayerPackage2.myPlayer)
-    game.gameLoop() 
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("player1", nargs = "?", default = "ai.playerTest.myPlayer", help = "import statement of the Red player")
+    parser.add_argument("player2", nargs = "?", default = "ai.playerTest.myPlayer", help = "import statement of the Blue player")
+    parser.add_argument("--headless", action = "store_true", help = "run without a window, as fast as the players answer")
+    parser.add_argument("--map", default = "./maps/map_01.txt", help = "the map to play on")
+    parser.add_argument("--seed", type = int, help = "seed of the game, random by default")
+    parser.add_argument("--record", metavar = "FILE", help = "write the game in a replay file")
+    parser.add_argument("--replay", metavar = "FILE", help = "play a replay file again instead of a new game")
+    parser.add_argument("--timeline", metavar = "FILE", help = "write the state of each tick in a timeline file, from a new game or a replay")
+    parser.add_argument("--watch", metavar = "FILE", help = "display a timeline file instead of playing a game")
+    parser.add_argument("--listen", metavar = "ADDRESS", help = "let players connect with PlayerClient.py on host:port or unix:path, instead of running player1 and player2")
+    parser.add_argument("--fork-server", action = "store_true", help = "start the players from a process that imported them and prepared the map beforehand")
+    arguments = parser.parse_args()
+
+    if arguments.watch:
+        watchGame(arguments.watch)
+
+    if arguments.replay:
+        replayGame(arguments.replay, arguments.timeline)
+        sys.exit()
+
+    if arguments.listen:
+        server = PlayerServer(arguments.listen)
+        print("Waiting for players on {}".format(arguments.listen))
+
+        game = Game(None, None, arguments.headless, arguments.map, arguments.seed, arguments.record, arguments.timeline, server = server)
+        game.gameLoop()
+
+        server.close()
+        sys.exit()
+
+    exec("import {} as PlayerPackage1".format(arguments.player1))
+    exec("import {} as PlayerPackage2".format(arguments.player2))
+
+    forkServer = PlayerForkServer([arguments.player1, arguments.player2], [arguments.map]) if arguments.fork_server else None
+
+    game = Game(PlayerPackage1.myPlayer,PlayerPackage2.myPlayer, arguments.headless, arguments.map, arguments.seed, arguments.record, arguments.timeline, forkServer = forkServer)
+    game.gameLoop()
+
+    if forkServer is not None:
+        forkServer.close()
@@ -0,0 +1,92 @@
+#! /usr/bin/env python3
+
+import argparse
+import asyncio
+import configparser
+import importlib
+import random
+import traceback
+
+from model.Network.Framing import Framing
+from domain.Map.RegularMap import RegularMap
+
+class PlayerClient:
+    """
+    Runs any Player for a game it is connected to over a socket, see Game.py --listen. The player does not know it is
+    remote : it gets the same map data, ruleset and polling data as a player run by the game, except that tuples are
+    received as lists.
+
+    Attributes:
+        Player (class) : The class of the player.
+        address (string) : Where the game listens, see Framing.parseAddress.
+        player (Player) : The player, once the game gave it its team.
+    """
+
+    def __init__(self, Player, address):
+        self.Player = Player
+        self.address = address
+
+        self.player = None
+
+    async def run(self):
+        """
+        Plays one game, until the game closes the connection.
+        """
+        (kind, arguments) = Framing.parseAddress(self.address)
+
+        if kind == "unix":
+            (reader, writer) = await asyncio.open_unix_connection(*arguments)
+        else:
+            (reader, writer) = await asyncio.open_connection(*arguments)
+
+        writer.write(Framing.encode({ "type": "hello", "name": self.Player.__module__ }))
+
+        try:
+            while True:
+                message = await Framing.read(reader)
+
+                if message is None:
+                    break
+
+                if message["type"] == "init":
+                    writer.write(Framing.encode({ "type": "ready", "initialized": self.initialize(message) }))
+
+                elif message["type"] == "poll" and self.player is not None:
+                    # Computing blocks the loop, like a player blocks its process
+                    response = self.player.poll(message["data"])
+                    writer.write(Framing.encode({ "type": "response", "sequence": message["sequence"], "data": response }))
+
+                await writer.drain()
+        finally:
+            writer.close()
+
+    def initialize(self, message):
+        """
+        Creates the player the way the game does.
+
+        Returns:
+            initialized (bool) : Whether it was created.
+        """
+        # Players get a section of a parser, like the game gives them
+        parser = configparser.ConfigParser()
+        parser.read_dict({ "Ruleset": message["ruleset"] })
+
+        random.seed(message["seed"])
+
+        try:
+            self.player = self.Player(RegularMap.parseMapData(message["map"]), parser["Ruleset"], team = message["team"])
+        except:
+            traceback.print_exc()
+            return False
+
+        return True
+
+# Make this an executable file
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Plays a game started with Game.py --listen, from another process, user or machine.")
+    parser.add_argument("player", help = "import statement of the player, like ai.playerTest.myPlayer")
+    parser.add_argument("address", help = "where the game listens : host:port or unix:path")
+    arguments = parser.parse_args()
+
+    client = PlayerClient(importlib.import_module(arguments.player).myPlayer, arguments.address)
+    asyncio.run(client.run())
@@ -0,0 +1,331 @@
+#! /usr/bin/env python3
+
+import argparse
+import contextlib
+import csv
+import importlib
+import itertools
+import multiprocessing
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from Game import Game
+from model.PlayerPool import PlayerPool
+from model.ForkServer import PlayerForkServer
+from service import *
+
+class Tournament:
+    """
+    Plays many headless games between a list of players, in parallel.
+
+    Each match is a headless Game ran in a worker process of a pool, the same pool for every round until close. Matches of a round are independent and all sent to the pool at once.
+    Each of these processes keeps a PlayerPool hosting the players of its matches, so that players are not imported in a new process for every match.
+    With forkServer, it keeps a PlayerForkServer instead, which forks a fresh process for each player from the players and maps it already prepared.
+
+    Attributes:
+        players (list(string)) : Import statements of the players, see Game.py.
+        maps (list(string)) : Map files to play on.
+        workers (int) : Amount of matches played at the same time, a third of the cores by default : each match runs the game and its two players.
+        recycleMatches (int) : Matches played by a player worker before it is replaced, None for no limit.
+        recycleMemoryMb (int) : Memory used by a player worker before it is replaced, in megabytes, None for no limit.
+        forkServer (bool) : Whether each player gets a process of its own, forked by a PlayerForkServer, rather than a pool worker.
+        results (list(dict)) : One entry per finished match, see runMatch.
+    """
+
+    def __init__(self, players, maps, workers = None, recycleMatches = None, recycleMemoryMb = None, forkServer = False):
+        self._players = players
+        self._maps = maps
+        self._workers = workers or max(os.cpu_count() // 3, 1)
+        self._recycleMatches = recycleMatches
+        self._recycleMemoryMb = recycleMemoryMb
+        self._forkServer = forkServer
+        self._executor = None
+
+        self.results = list()
+
+    def roundRobin(self):
+        """
+        Every player meets every other player on every map, once as Red and once as Blue.
+        """
+        matches = list()
+
+        for mapFile in self._maps:
+            for (red, blue) in itertools.permutations(range(len(self._players)), 2):
+                matches.append((0, mapFile, red, blue))
+
+        self._play(matches)
+
+    def swiss(self, rounds):
+        """
+        Plays a number of rounds, pairing players with close scores who did not meet yet.
+
+        With an odd amount of players, the last one of the standings who was not left out yet is left out of the round
+        and scores a win, the last one of the standings once everybody was.
+        """
+        for roundNumber in range(1, rounds + 1):
+            standings = sorted(range(len(self._players)), key = lambda player: -self.points(player))
+            mapFile = self._maps[(roundNumber - 1) % len(self._maps)]
+
+            if len(standings) % 2 == 1:
+                bye = next((player for player in reversed(standings) if not self.hadBye(player)), standings[-1])
+
+                self.results.append({ "round": roundNumber, "map": mapFile, "red": bye, "blue": None, "winner": 1,
+                    "durationMs": 0, "turns": 0, "redMissedTicks": 0, "blueMissedTicks": 0, "wallSeconds": 0 })
+                standings.remove(bye)
+
+            matches = list()
+            while standings:
+                red = standings.pop(0)
+
+                # Closest opponent in the standings that was not met yet, or the closest one if all were met
+                opponents = [player for player in standings if not self.met(red, player)] or standings
+                blue = opponents[0]
+                standings.remove(blue)
+
+                # Alternate colors so that a high seed is not always Red
+                if roundNumber % 2 == 0:
+                    (red, blue) = (blue, red)
+
+                matches.append((roundNumber, mapFile, red, blue))
+
+            self._play(matches)
+
+    def _play(self, matches):
+        """
+        Plays a list of (round, map, red, blue) matches on the process pool and stores their results.
+        """
+        if self._executor is None:
+            # Workers are forked so that they share the Config and Ruleset already loaded here, and kept for the next
+            # rounds with the players they imported
+            context = multiprocessing.get_context("fork")
+            self._executor = ProcessPoolExecutor(max_workers = self._workers, mp_context = context)
+
+        futures = dict()
+
+        for (roundNumber, mapFile, red, blue) in matches:
+            future = self._executor.submit(runMatch, self._players[red], self._players[blue], mapFile,
+                self._recycleMatches, self._recycleMemoryMb, self._players if self._forkServer else None, self._maps)
+            futures[future] = (roundNumber, mapFile, red, blue)
+
+        for future in as_completed(futures):
+            (roundNumber, mapFile, red, blue) = futures[future]
+            result = future.result()
+            result.update({ "round": roundNumber, "map": mapFile, "red": red, "blue": blue })
+
+            self.results.append(result)
+            print("Round {} on {} : {} vs {} -> {}".format(
+                roundNumber, mapFile, self._players[red], self._players[blue], winnerName(result["winner"])))
+
+    def close(self):
+        """
+        Stops the worker processes, once every match was played.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def met(self, player1, player2):
+        """
+        Whether two players already played against each other.
+        """
+        return any({ result["red"], result["blue"] } == { player1, player2 } for result in self.results)
+
+    def hadBye(self, player):
+        """
+        Whether a player was already left out of a round of a swiss tournament.
+        """
+        return any(result["red"] == player and result["blue"] is None for result in self.results)
+
+    def points(self, player):
+        """
+        Score of a player : 1 point per win, 0.5 per draw.
+        """
+        points = 0
+
+        for result in self.results:
+            if player not in (result["red"], result["blue"]):
+                continue
+
+            if result["winner"] is None:
+                points += 0.5
+            elif (result["winner"] == 1) == (result["red"] == player):
+                points += 1
+
+        return points
+
+    def standings(self):
+        """
+        Returns:
+            standings (list(dict)) : One line per player, sorted by points.
+        """
+        lines = list()
+
+        for player in range(len(self._players)):
+            line = { "player": self._players[player], "played": 0, "wins": 0, "draws": 0, "losses": 0, "missedTicks": 0, "durationMs": 0 }
+
+            for result in self.results:
+                if player == result["red"]:
+                    team, missedTicks = 1, result["redMissedTicks"]
+                elif player == result["blue"]:
+                    team, missedTicks = 2, result["blueMissedTicks"]
+                else:
+                    continue
+
+                line["played"] += 1
+                line["missedTicks"] += missedTicks
+                line["durationMs"] += result["durationMs"]
+
+                if result["winner"] is None:
+                    line["draws"] += 1
+                elif result["winner"] == team:
+                    line["wins"] += 1
+                else:
+                    line["losses"] += 1
+
+            line["points"] = self.points(player)
+            lines.append(line)
+
+        return sorted(lines, key = lambda line: -line["points"])
+
+    def writeResults(self, path):
+        """
+        Writes every match in a CSV file.
+        """
+        columns = ["round", "map", "red", "blue", "winner", "durationMs", "turns", "redMissedTicks", "blueMissedTicks", "wallSeconds"]
+
+        with open(path, "w", newline = "") as resultsFile:
+            writer = csv.DictWriter(resultsFile, fieldnames = columns)
+            writer.writeheader()
+
+            for result in sorted(self.results, key = lambda result: result["round"]):
+                line = dict(result)
+                line["red"] = self._players[result["red"]]
+                line["blue"] = self._players[result["blue"]] if result["blue"] is not None else "(bye)"
+                line["winner"] = winnerName(result["winner"])
+                writer.writerow(line)
+
+    def printStandings(self):
+        print("{:<40} {:>6} {:>5} {:>5} {:>6} {:>7} {:>12} {:>14}".format(
+            "Player", "Played", "Wins", "Draws", "Losses", "Points", "Missed ticks", "Avg duration s"))
+
+        for line in self.standings():
+            averageDuration = line["durationMs"] / line["played"] / 1000 if line["played"] else 0
+
+            print("{:<40} {:>6} {:>5} {:>5} {:>6} {:>7} {:>12} {:>14.1f}".format(
+                line["player"], line["played"], line["wins"], line["draws"], line["losses"], line["points"], line["missedTicks"], averageDuration))
+
+def winnerName(winner):
+    return "draw" if winner is None else ("red" if winner == 1 else "blue")
+
+playerPool = None
+"""
+Hosts the players of the matches played by this process, created by its first match.
+"""
+
+playerForkServer = None
+"""
+Forks the processes of the players of the matches played by this process, when the tournament uses one, created by its
+first match.
+"""
+
+metrics = None
+"""
+Measures of the matches played by this process, created by its first match. Each process writes them in a file of its
+own, named after the Metrics Path of the Config followed by the process id.
+"""
+
+def runMatch(player1, player2, mapFile, recycleMatches = None, recycleMemoryMb = None, forkServerPlayers = None, forkServerMaps = None):
+    """
+    Plays one headless game. Runs inside a worker process of the pool.
+
+    Parameters:
+        player1 (string) : Import statement of the Red player.
+        player2 (string) : Import statement of the Blue player.
+        mapFile (string) : The map to play on.
+        recycleMatches (int) : Matches played by a player worker before it is replaced, None for no limit.
+        recycleMemoryMb (int) : Memory used by a player worker before it is replaced, in megabytes, None for no limit.
+        forkServerPlayers (list(string)) : Players prepared by a PlayerForkServer starting the players instead of a
+            PlayerPool, None to use a PlayerPool.
+        forkServerMaps (list(string)) : Maps prepared by the PlayerForkServer for these players.
+
+    Returns:
+        result (dict) : winner, durationMs, turns, redMissedTicks, blueMissedTicks and wallSeconds of the match.
+    """
+    global playerPool, playerForkServer, metrics
+
+    if forkServerPlayers is not None:
+        if playerForkServer is None:
+            playerForkServer = PlayerForkServer(forkServerPlayers, forkServerMaps or ())
+    elif playerPool is None:
+        playerPool = PlayerPool(2, recycleMatches, recycleMemoryMb)
+
+    if metrics is None:
+        Config.Initialize()
+        metrics = Metrics.FromConfig()
+
+        if metrics.path is not None:
+            (root, extension) = os.path.splitext(metrics.path)
+            metrics.path = "{}-{}{}".format(root, os.getpid(), extension)
+
+    Player1 = importlib.import_module(player1).myPlayer
+    Player2 = importlib.import_module(player2).myPlayer
+
+    stopwatch = time.time()
+
+    # Games are chatty, keep the tournament output readable
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        game = Game(Player1, Player2, headless = True, map_file = mapFile, pool = playerPool, metrics = metrics, forkServer = playerForkServer)
+        game.gameLoop()
+
+    results = game.Model.getResults()
+
+    return {
+        "winner": results["winner"],
+        "durationMs": results["durationMs"],
+        "turns": results["turns"],
+        "redMissedTicks": results["missedTicks"]["1"],
+        "blueMissedTicks": results["missedTicks"]["2"],
+        "wallSeconds": round(time.time() - stopwatch, 3),
+    }
+
+# Make this an executable file
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Plays headless games between players, several at a time.")
+    parser.add_argument("players", nargs = "+", help = "import statements of the players, like ai.playerTest.myPlayer")
+    parser.add_argument("--maps", nargs = "+", default = ["./maps/map_01.txt"], help = "map files to play on")
+    parser.add_argument("--swiss", type = int, metavar = "ROUNDS", help = "play a swiss tournament instead of a round-robin")
+    parser.add_argument("--workers", type = int, help = "matches played at the same time (default: a third of the cores)")
+    parser.add_argument("--duration", type = int, help = "maximum game time of a match in seconds (default: MaxDurationSeconds, or 300 when unlimited)")
+    parser.add_argument("--recycle-matches", type = int, default = 50, help = "matches hosted by a player process before it is replaced (default: 50)")
+    parser.add_argument("--recycle-memory", type = int, default = 1024, metavar = "MB", help = "memory used by a player process before it is replaced (default: 1024)")
+    parser.add_argument("--fork-server", action = "store_true", help = "fork a fresh process for each player, from one that prepared every player and map, instead of reusing processes")
+    parser.add_argument("--output", default = "results.csv", help = "CSV file receiving one line per match")
+    arguments = parser.parse_args()
+
+    if len(arguments.players) < 2:
+        parser.error("a tournament needs at least two players")
+
+    Config.Initialize()
+    Ruleset.Initialize()
+
+    if arguments.duration is not None:
+        Ruleset.SetRulesetValue("MaxDurationSeconds", arguments.duration)
+    elif int(Ruleset.GetRulesetValue("MaxDurationSeconds")) <= 0:
+        # A match that nobody wins would hold a worker forever
+        Ruleset.SetRulesetValue("MaxDurationSeconds", 300)
+
+    tournament = Tournament(arguments.players, arguments.maps, arguments.workers, arguments.recycle_matches, arguments.recycle_memory,
+        arguments.fork_server)
+
+    try:
+        if arguments.swiss:
+            tournament.swiss(arguments.swiss)
+        else:
+            tournament.roundRobin()
+    finally:
+        tournament.close()
+
+    tournament.writeResults(arguments.output)
+    tournament.printStandings()
@@ -0,0 +1,53 @@
+from ai.pathFinding.base.GridGraph import GridGraph
+from ai.pathFinding.SharedPathCache import SharedPathCache
+from ai.pathFinding.flowField.FlowFields import FlowFields
+
+class MapAnalysis:
+    """
+    What players compute from a map before playing on it : the pathfinding graph of its blocks, a cache for the paths
+    found on it, and the flow fields towards its strategic blocks. It only depends on the map, so it is computed once per process and map, and kept.
+
+    A PlayerForkServer computes it before forking the player processes (see Player.prepare), so that they share its
+    memory : searches only read the graph, and the paths found by the players of a team go to the cache of their team.
+    Each team has its own, so that a player can neither read the paths the other team looked for, nor fill them with
+    detours that would mislead it.
+
+    Attributes:
+        graph (GridGraph) : Which blocks can be walked through, and their costs.
+        paths (dict) : SharedPathCache of each team, paths found on the graph by its players, to give to their path
+            finders.
+        flowFields (FlowFields) : Next cell towards the flag zones, depots and spawns of each team, from any cell.
+    """
+
+    _analyses = dict()
+
+    def __init__(self, mapData):
+        self.graph = GridGraph(mapData)
+        self.paths = { team: SharedPathCache(self.graph) for team in mapData["flagZones"].keys() }
+        self.flowFields = FlowFields(self.graph, mapData)
+
+    @staticmethod
+    def Get(mapData):
+        """
+        Parameters:
+            mapData (dict) : The map, as given to a Player.
+
+        Returns:
+            analysis (MapAnalysis) : The analysis of this map, computed the first time it is asked for.
+        """
+        key = MapAnalysis.Key(mapData)
+
+        if key not in MapAnalysis._analyses:
+            MapAnalysis._analyses[key] = MapAnalysis(mapData)
+
+        return MapAnalysis._analyses[key]
+
+    @staticmethod
+    def Key(mapData):
+        """
+        Returns:
+            key (tuple) : The map as far as the analysis is concerned, its size and the type of each block.
+        """
+        blocks = tuple(type(block).__name__ for column in mapData["blocks"] for block in column)
+
+        return (mapData["blockWidth"], mapData["blockHeight"], blocks)
@@ -0,0 +1,115 @@
+from collections import OrderedDict
+
+class PathCache:
+    """
+    Paths already found by a PathFinder, between cells of one map, the least recently used ones being evicted beyond
+    a number of paths. The content hash of the graph is kept with them : when it changes, costs having changed, every
+    path is dropped.
+
+    Searches that found no path are kept too, they explore everything reachable from the start.
+
+    Attributes:
+        capacity (int) : Number of paths kept at most.
+        mapHash (int) : Content hash of the graph the paths were found on (see Graph.contentHash).
+        hits (int) : Number of lookups that found a path.
+        misses (int) : Number of lookups that did not.
+        evictions (int) : Number of paths evicted to keep the capacity.
+        invalidations (int) : Number of times the paths were dropped because the graph changed.
+    """
+
+    DEFAULT_CAPACITY = 4096
+
+    MISS = object()
+    """
+    Returned by get when no path is kept, None meaning that the goal can not be reached.
+    """
+
+    def __init__(self, capacity = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.mapHash = None
+
+        self._paths = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, graph, startCell, goalCell):
+        """
+        Parameters:
+            graph (Graph) : The graph searched.
+            startCell (tuple) : (x, y) cell the path starts from.
+            goalCell (tuple) : (x, y) cell the path goes to.
+
+        Returns:
+            path (list) : A copy of the path kept, that the caller may change. None when the goal can not be reached,
+                PathCache.MISS when nothing is kept.
+        """
+        self.checkGraph(graph)
+
+        path = self._paths.get((startCell, goalCell), PathCache.MISS)
+
+        if path is PathCache.MISS:
+            self.misses += 1
+            return path
+
+        self.hits += 1
+        self._paths.move_to_end((startCell, goalCell))
+
+        return None if path is None else list(path)
+
+    def put(self, graph, startCell, goalCell, path):
+        """
+        Keeps a path found on graph, evicting the least recently used one when full.
+        """
+        self.checkGraph(graph)
+
+        self._paths[(startCell, goalCell)] = None if path is None else tuple(path)
+        self._paths.move_to_end((startCell, goalCell))
+
+        while len(self._paths) > self.capacity:
+            self._paths.popitem(last = False)
+            self.evictions += 1
+
+    def checkGraph(self, graph):
+        """
+        Drops every path when the content of the graph is not the one they were found on.
+        """
+        mapHash = graph.contentHash()
+
+        if mapHash != self.mapHash:
+            if self._paths:
+                self.invalidations += 1
+
+            self.clear()
+            self.mapHash = mapHash
+
+    def clear(self):
+        self._paths.clear()
+
+    def __len__(self):
+        return len(self._paths)
+
+    def hitRate(self):
+        """
+        Returns:
+            rate (float) : Share of the lookups that found a path, 0 before the first one.
+        """
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """
+        Returns:
+            stats (dict) : The counters, with the number of paths kept and the hit rate.
+        """
+        return {
+            "size": len(self._paths),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hitRate": self.hitRate(),
+        }
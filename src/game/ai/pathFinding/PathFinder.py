@@ -1,12 +1,25 @@
+from ai.pathFinding.PathCache import PathCache
 from abc import ABC,abstractmethod 
 class PathFinder(ABC):
+    """
+    Attributes:
+        _graph (Graph) : The graph searched.
+        _cache (PathCache) : Paths already found on the graph, a PathCache of this finder unless one is given, a
+            SharedPathCache for instance.
+    """
 
     @abstractmethod
-    def __init__(self, graph):
+    def __init__(self, graph, cache = None):
         self._graph = graph
+        self._cache = cache if cache is not None else PathCache()
     
     @abstractmethod
     def getPath(self, start, goal):
         pass
 
-
+    def cacheStats(self):
+        """
+        Returns:
+            stats (dict) : Hits, misses and evictions of the path cache, see PathCache.stats.
+        """
+        return self._cache.stats()
@@ -0,0 +1,203 @@
+from ai.pathFinding.PathCache import PathCache
+import mmap
+import numpy
+
+class SharedPathCache:
+    """
+    Paths found on a GridGraph, kept in memory shared by the processes forked after its creation : created while
+    preparing a map in a PlayerForkServer (see MapAnalysis), it is read and filled by the players of a team.
+
+    The memory is a table of slots, a path going to the slot of its (start cell, goal cell) and replacing the one
+    there. Paths are kept as cell indices, up to maxLength cells, and only for the graph the table was created for :
+    a process whose graph changed (see GridGraph.setCost) neither reads nor fills it.
+
+    Processes write without locking each other. A slot has a sequence number, odd while it is written and increased
+    by each write : a path read while its slot changed is dropped, as is a path that is not a walk through free cells
+    from its start to its goal. Searches that found no path, which could not be checked this way, and paths that are
+    too long are kept by a PathCache of this process instead. Whether a path is the cheapest is not checked : the
+    processes sharing a table trust each other, a player could fill it with detours.
+
+    The counters are the ones of this process, for both.
+
+    Attributes:
+        slots (int) : Number of paths kept at most.
+        maxLength (int) : Number of cells of the longest path kept.
+        mapHash (int) : Content hash of the graph the table was created for.
+        hits (int) : Number of lookups that found a path.
+        misses (int) : Number of lookups that did not.
+        evictions (int) : Number of paths replaced by another one.
+        invalidations (int) : Number of lookups that did not use the table because the graph of the process changed.
+    """
+
+    DEFAULT_SLOTS = 2048
+    DEFAULT_MAX_LENGTH = 512
+
+    MISS = PathCache.MISS
+
+    def __init__(self, graph, slots = DEFAULT_SLOTS, maxLength = DEFAULT_MAX_LENGTH):
+        """
+        Parameters:
+            graph (GridGraph) : The graph the paths are found on.
+        """
+        self.slots = slots
+        self.maxLength = maxLength
+        self.mapHash = graph.contentHash()
+
+        # Anonymous and shared, the processes forked afterwards see the same pages
+        self._memory = mmap.mmap(-1, slots * 8 * 2 + slots * 4 + slots * maxLength * 4)
+
+        (offset, self._sequences) = self._view(0, numpy.int64, (slots,))
+        (offset, self._keys) = self._view(offset, numpy.int64, (slots,))
+        (offset, self._lengths) = self._view(offset, numpy.int32, (slots,))
+        (offset, self._cells) = self._view(offset, numpy.int32, (slots, maxLength))
+
+        self._size = graph.width * graph.height
+        self._local = PathCache()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _view(self, offset, dtype, shape):
+        array = numpy.ndarray(shape, dtype = dtype, buffer = self._memory, offset = offset)
+
+        return (offset + array.nbytes, array)
+
+    def _slot(self, graph, startCell, goalCell):
+        """
+        Returns:
+            slot (tuple) : (slot, key) of a path, the key never being 0, the one of empty slots.
+        """
+        key = graph.index(*startCell) * self._size + graph.index(*goalCell) + 1
+
+        return (hash(key) % self.slots, key)
+
+    def get(self, graph, startCell, goalCell):
+        """
+        Parameters:
+            graph (GridGraph) : The graph searched.
+            startCell (tuple) : (x, y) cell the path starts from.
+            goalCell (tuple) : (x, y) cell the path goes to.
+
+        Returns:
+            path (list) : A copy of the path kept, that the caller may change. None when the goal can not be reached,
+                SharedPathCache.MISS when nothing is kept.
+        """
+        if graph.contentHash() != self.mapHash:
+            self.invalidations += 1
+            path = self._getLocal(graph, startCell, goalCell)
+
+            if path is SharedPathCache.MISS:
+                self.misses += 1
+
+            return path
+
+        if len(self._local):
+            path = self._getLocal(graph, startCell, goalCell)
+
+            if path is not SharedPathCache.MISS:
+                return path
+
+        (slot, key) = self._slot(graph, startCell, goalCell)
+
+        sequence = int(self._sequences[slot])
+
+        if sequence % 2 == 1 or self._keys[slot] != key:
+            self.misses += 1
+            return SharedPathCache.MISS
+
+        cells = self._cells[slot, :self._lengths[slot]].copy()
+
+        if self._sequences[slot] != sequence or not self._isPath(graph, cells, startCell, goalCell):
+            self.misses += 1
+            return SharedPathCache.MISS
+
+        self.hits += 1
+
+        return [graph.cell(index) for index in cells.tolist()]
+
+    def _getLocal(self, graph, startCell, goalCell):
+        """
+        Looks a path up in the PathCache of this process, counting hits only.
+        """
+        path = self._local.get(graph, startCell, goalCell)
+
+        if path is not SharedPathCache.MISS:
+            self.hits += 1
+
+        return path
+
+    def _isPath(self, graph, cells, startCell, goalCell):
+        """
+        Returns:
+            isPath (bool) : Whether cells go from startCell to goalCell, one free cell at a time.
+        """
+        if len(cells) == 0 or cells[0] != graph.index(*startCell) or cells[-1] != graph.index(*goalCell):
+            return False
+
+        if not numpy.frombuffer(graph.walkable, dtype = numpy.uint8)[cells].all():
+            return False
+
+        steps = numpy.abs(numpy.diff(cells))
+        rows = cells // graph.width
+
+        # Vertical steps, or horizontal ones staying on their row
+        return bool(numpy.all((steps == graph.width) | ((steps == 1) & (rows[1:] == rows[:-1]))))
+
+    def put(self, graph, startCell, goalCell, path):
+        """
+        Keeps a path found on graph in its slot, in the PathCache of this process when it can not be shared.
+        """
+        if path is None or len(path) > self.maxLength or graph.contentHash() != self.mapHash:
+            self._local.put(graph, startCell, goalCell, path)
+            return
+
+        (slot, key) = self._slot(graph, startCell, goalCell)
+
+        if self._keys[slot] not in (0, key):
+            self.evictions += 1
+
+        self._sequences[slot] += 1
+
+        self._keys[slot] = key
+        self._lengths[slot] = len(path)
+        self._cells[slot, :len(path)] = [graph.index(x, y) for (x, y) in path]
+
+        self._sequences[slot] += 1
+
+    def clear(self):
+        """
+        Empties the table, for every process sharing it.
+        """
+        self._local.clear()
+
+        self._sequences += 1
+        self._keys[:] = 0
+        self._sequences += 1
+
+    def __len__(self):
+        return int(numpy.count_nonzero(self._keys)) + len(self._local)
+
+    def hitRate(self):
+        """
+        Returns:
+            rate (float) : Share of the lookups of this process that found a path, 0 before the first one.
+        """
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """
+        Returns:
+            stats (dict) : The counters of this process, with the number of paths kept and the hit rate.
+        """
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hitRate": self.hitRate(),
+        }
@@ -1,15 +1,29 @@
 from ai.pathFinding.PathFinder import PathFinder
+from ai.pathFinding.PathCache import PathCache
 from ai.pathFinding.base import AbstractNode,Heuristic
 from ai.pathFinding.aStar.NodeAstar import NodeAstar
+from ai.pathFinding.base.GridGraph import GridGraph
 from domain.GameObject.Block import *
 from domain.Map import Map
-import bisect
+from array import array
+import heapq
+import itertools
+import math
 
-PathMap = {}
 class Astar(PathFinder):
+    """
+    Attributes:
+        expanded (int) : Number of cells expanded by the last search of a GridGraph.
+    """
+
+    SOLID = (Wall, WallTransparent)
     
-    def __init__(self, graph):
-        super().__init__(graph)
+    def __init__(self, graph, heuristic = Heuristic.Heuristic.manhattanDistance, cache = None):
+        super().__init__(graph, cache)
+        self._heuristic = heuristic
+
+        self.expanded = 0
+
     # If need an other representation than the generic graph
     # Else remove this function
     def build_graph(self):
@@ -24,73 +38,186 @@ class Astar(PathFinder):
     
     #Override method
     def getPath(self, start, goal):
-        nodeStart, nodeGoal = self.getNodeStartGoal(start, goal)
+        """
+        Searches the shortest path between two points, through the blocks that are not solid.
+
+        The open set is a binary heap : a cell whose cost goes down is pushed again, and its older entries are skipped
+        when they come out (lazy decrease-key). On a GridGraph, costs, parents and closed cells are arrays indexed like
+        the graph, and no object is created per cell. On a graph of nodes, they are indexed by (x, y), so that the
+        nodes of the graph are only read, never written.
+
+        Paths are looked up in the cache of the finder before searching, and kept in it.
+
+        Parameters:
+            start (tuple) : (x, y) point the path starts from.
+            goal (tuple) : (x, y) point the path goes to.
+
+        Returns:
+            path (list) : (x, y) cells from the start to the goal, both included, the caller's own copy. None when the
+                goal can not be reached.
+        """
+        startCell = (int(start[0] // Map.BLOCKSIZE), int(start[1] // Map.BLOCKSIZE))
+        goalCell  = (int(goal[0] // Map.BLOCKSIZE), int(goal[1] // Map.BLOCKSIZE))
+
+        path = self._cache.get(self._graph, startCell, goalCell)
+
+        if path is not PathCache.MISS:
+            return path
+
+        if isinstance(self._graph, GridGraph):
+            path = self.searchGrid(startCell, goalCell)
+        else:
+            path = self.searchNodes(*self.getNodeStartGoal(start, goal))
+
+        self._cache.put(self._graph, startCell, goalCell, path)
+
+        return path
+
+    def searchGrid(self, startCell, goalCell):
+        """
+        A* on a GridGraph, with the Manhattan distance as heuristic : bots only move along the axes, through cells
+        costing at least 1.
+
+        Returns:
+            path (list) : (x, y) cells from startCell to goalCell, None when goalCell can not be reached.
+        """
+        graph = self._graph
+        self.expanded = 0
 
-        #First check if path already contained in pathMap (no need to recalculate it)
-        extremity = (int(nodeStart._x), int(nodeStart._y), nodeGoal._x, nodeGoal._y)
+        if not graph.contains(*startCell) or not graph.contains(*goalCell):
+            return None
 
-        if extremity in PathMap:
-            print("Find the Path ! " + str(extremity))
-            return PathMap[extremity]
+        (width, size) = (graph.width, graph.width * graph.height)
+        (walkable, cellCosts) = (graph.walkable, graph.costs)
+        (goalX, goalY) = goalCell
 
-        border = [nodeStart]
-        closed = []
+        start = graph.index(*startCell)
+        goal  = graph.index(*goalCell)
+
+        costs   = array("d", [math.inf]) * size
+        parents = array("l", [-1]) * size
+        closed  = bytearray(size)
+
+        costs[start] = 0
+
+        # (estimated total cost, -cost, order, index) : deeper cells first among equal estimates, then the oldest
+        order  = itertools.count()
+        border = [(abs(startCell[0] - goalX) + abs(startCell[1] - goalY), 0, next(order), start)]
 
         while border:
-            #print(border)
-            current = border[0] # Get node with least cost
-
-            if current == nodeGoal:
-                path = self.reconstructPath(current, nodeStart)
-                PathMap[(nodeStart._x, nodeStart._y, current._x, current._y)] = path
-                #print(path)
-                return path
-
-            # Remove current from border and add it to closed list
-            del border[0]
-            closed.insert(0,current)
-            current.createNeighbors(self._graph)
-            self.visitNeighbor(current, closed, border, nodeGoal)
-        
+            index = heapq.heappop(border)[3]
 
-    def totalCost(self, node, nodeGoal, heuristic):
-        return node._cost + heuristic(node, nodeGoal)
-    
-    def reconstructPath(self, node, nodeStart):
+            if closed[index]:
+                # A cheaper entry of this cell came out before
+                continue
+
+            if index == goal:
+                return self.reconstructGridPath(parents, index)
+
+            closed[index] = 1
+            self.expanded += 1
+
+            (y, x) = divmod(index, width)
+
+            # Same order as GridGraph.neighbors, without building a list
+            for neighbor in (
+                index - width if y > 0 else -1,
+                index - 1 if x > 0 else -1,
+                index + width if index + width < size else -1,
+                index + 1 if x < width - 1 else -1,
+            ):
+                if neighbor < 0 or closed[neighbor] or not walkable[neighbor]:
+                    continue
+
+                cost = costs[index] + cellCosts[neighbor]
+
+                if cost < costs[neighbor]:
+                    costs[neighbor]   = cost
+                    parents[neighbor] = index
+
+                    (neighborY, neighborX) = divmod(neighbor, width)
+                    heapq.heappush(border, (cost + abs(neighborX - goalX) + abs(neighborY - goalY), -cost, next(order), neighbor))
+
+        return None
+
+    def reconstructGridPath(self, parents, index):
+        """
+        Returns:
+            path (list) : (x, y) cells from the start to index, following the parent of each cell.
+        """
         path = []
-        path.append((node._x, node._y))
-        while node != nodeStart:
-            node = node._parent
-            if not node : break # Should not occurs but occurs
-            path.insert(0,(node._x, node._y))
+
+        while index >= 0:
+            path.append(self._graph.cell(index))
+            index = parents[index]
+
+        path.reverse()
         return path
-    
-    def setCurrentNeighbor(self, neighbor, current, nodeGoal):
-        neighbor._parent        = current
-        neighbor._cost          = current._cost + neighbor._cellCost
-        neighbor._estimatedCost = self.totalCost(neighbor, nodeGoal, Heuristic.Heuristic.manhattanDistance)
-        return neighbor
-
-
-    def visitNeighbor(self, current, closed, border, nodeGoal):
-        for neighbor in current._neighbors:
-            
-            if self.isSolid(neighbor):
-                closed.insert(0,neighbor)
-                continue
-        
-            if neighbor in closed or neighbor in border:
+
+    def searchNodes(self, nodeStart, nodeGoal):
+        """
+        A* on a graph of nodes, like NodeAstar.
+
+        Returns:
+            path (list) : (x, y) cells from nodeStart to nodeGoal, None when nodeGoal can not be reached.
+        """
+        startCell = (int(nodeStart._x), int(nodeStart._y))
+        goalCell  = (int(nodeGoal._x), int(nodeGoal._y))
+
+        costs   = { startCell: 0 }
+        parents = { startCell: None }
+        nodes   = { startCell: nodeStart }
+        closed  = set()
+
+        # (estimated total cost, -cost, order, cell) : deeper cells first among equal estimates, then the oldest
+        order  = itertools.count()
+        border = [(self._heuristic(nodeStart, nodeGoal), 0, next(order), startCell)]
+
+        while border:
+            cell = heapq.heappop(border)[3]
+
+            if cell in closed:
+                # A cheaper entry of this cell came out before
                 continue
 
-            neighbor = self.setCurrentNeighbor(neighbor, current, nodeGoal)
-            if neighbor not in border:
-                border.insert(0,neighbor) 
-                #bisect.insort(border,neighbor)
-        border.sort()
-    
+            if cell == goalCell:
+                return self.reconstructPath(parents, cell)
+
+            closed.add(cell)
+
+            current = nodes[cell]
+            current.createNeighbors(self._graph)
+
+            for neighbor in current._neighbors:
+                position = (neighbor._x, neighbor._y)
+
+                if position in closed or self.isSolid(neighbor):
+                    continue
+
+                neighborCost = costs[cell] + neighbor._cellCost
+
+                if neighborCost < costs.get(position, math.inf):
+                    costs[position]   = neighborCost
+                    parents[position] = cell
+                    nodes[position]   = neighbor
+
+                    heapq.heappush(border, (neighborCost + self._heuristic(neighbor, nodeGoal), -neighborCost, next(order), position))
+
+        return None
+
+    def reconstructPath(self, parents, cell):
+        """
+        Returns:
+            path (list) : (x, y) cells from the start to cell, following the parent of each cell.
+        """
+        path = []
+
+        while cell is not None:
+            path.append(cell)
+            cell = parents[cell]
+
+        path.reverse()
+        return path
+
     def isSolid(self, node):
-        solid = [Wall , WallTransparent]
-        for s in solid:
-            if isinstance(node._cellContent, s):
-                return True
-        return False                
\ No newline at end of file
+        return isinstance(node._cellContent, Astar.SOLID)                
\ No newline at end of file
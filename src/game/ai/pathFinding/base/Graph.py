@@ -22,3 +22,11 @@ class Graph:
 
     def setData(self, data):
         self._data = data
+
+    def contentHash(self):
+        """
+        Returns:
+            hash (int) : Changes when the content of the graph changes, see PathCache. The identity of the graph here,
+                its content not being known.
+        """
+        return id(self)
@@ -0,0 +1,144 @@
+from ai.pathFinding.base.Graph import Graph
+from domain.GameObject.Block import Wall, WallTransparent
+from array import array
+import hashlib
+
+class GridGraph(Graph):
+    """
+    Graph of the blocks of a map kept in flat arrays, cell (x, y) at index y * width + x, rather than as a node object
+    per block : the neighbors of a cell are found arithmetically, and searches only handle indices.
+
+    Attributes:
+        width (int) : Width of the map, in blocks.
+        height (int) : Height of the map, in blocks.
+        walkable (bytearray) : 1 for each cell that can be walked through, 0 for solid ones.
+        costs (array) : Cost of entering each cell, at least 1. Change them with setCost, so that the content hash
+            follows.
+    """
+
+    SOLID = (Wall, WallTransparent)
+
+    def __init__(self, mapData):
+        """
+        Parameters:
+            mapData (dict) : The map, as given to a Player.
+        """
+        super().__init__([], [], mapData)
+
+        self.width = 0
+        self.height = 0
+        self.walkable = bytearray()
+        self.costs = array("d")
+
+        self._contentHash = None
+
+        if mapData is not None:
+            self.buildGraph()
+
+    #Override method
+    def buildGraph(self):
+        """
+        Fills the arrays from the blocks of the map data.
+        """
+        blocks = self._data["blocks"]
+
+        self.width = self._data["blockWidth"]
+        self.height = self._data["blockHeight"]
+
+        self.walkable = bytearray(0 if isinstance(blocks[x][y], GridGraph.SOLID) else 1
+            for y in range(self.height) for x in range(self.width))
+
+        # Same cost for every block, like NodeAstar
+        self.costs = array("d", [1]) * (self.width * self.height)
+
+        self._contentHash = None
+
+    #Override method
+    def storeGraph(self):
+        """
+        Returns:
+            stored (dict) : The arrays as bytes, with the size of the grid, to pickle or share, see FromStored.
+        """
+        return {
+            "width": self.width,
+            "height": self.height,
+            "walkable": bytes(self.walkable),
+            "costs": self.costs.tobytes(),
+        }
+
+    @staticmethod
+    def FromStored(stored):
+        """
+        Returns:
+            graph (GridGraph) : The graph stored by storeGraph.
+        """
+        graph = GridGraph(None)
+
+        graph.width = stored["width"]
+        graph.height = stored["height"]
+        graph.walkable = bytearray(stored["walkable"])
+        graph.costs = array("d")
+        graph.costs.frombytes(stored["costs"])
+
+        return graph
+
+    #Override method
+    def contentHash(self):
+        """
+        Returns:
+            hash (int) : Hash of the size, walkable cells and costs of the grid, computed again after a setCost.
+        """
+        if self._contentHash is None:
+            digest = hashlib.blake2b(digest_size = 8)
+
+            digest.update(array("l", [self.width, self.height]).tobytes())
+            digest.update(self.walkable)
+            digest.update(self.costs.tobytes())
+
+            self._contentHash = int.from_bytes(digest.digest(), "little", signed = True)
+
+        return self._contentHash
+
+    def setCost(self, x, y, cost):
+        """
+        Parameters:
+            cost (float) : New cost of entering the cell (x, y), at least 1 for the Manhattan distance to stay a lower
+                bound.
+        """
+        self.costs[self.index(x, y)] = cost
+        self._contentHash = None
+
+    def contains(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self, x, y):
+        return y * self.width + x
+
+    def cell(self, index):
+        """
+        Returns:
+            cell (tuple) : (x, y) of an index.
+        """
+        (y, x) = divmod(index, self.width)
+
+        return (x, y)
+
+    def neighbors(self, index):
+        """
+        Returns:
+            neighbors (list(int)) : Walkable cells next to a cell, up, left, down then right, the order NodeAstar finds
+                them in.
+        """
+        (y, x) = divmod(index, self.width)
+        neighbors = list()
+
+        if y > 0 and self.walkable[index - self.width]:
+            neighbors.append(index - self.width)
+        if x > 0 and self.walkable[index - 1]:
+            neighbors.append(index - 1)
+        if y < self.height - 1 and self.walkable[index + self.width]:
+            neighbors.append(index + self.width)
+        if x < self.width - 1 and self.walkable[index + 1]:
+            neighbors.append(index + 1)
+
+        return neighbors
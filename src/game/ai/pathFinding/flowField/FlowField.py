@@ -0,0 +1,182 @@
+from array import array
+import collections
+import heapq
+import math
+import numpy
+
+class FlowField:
+    """
+    Distance from every cell of a GridGraph to the nearest of some target cells, and the next cell to go to from each
+    one to get there. Computed once, following the field from any cell is then a lookup per step, for every bot.
+
+    The distances are computed by a single search going backwards from the targets : a breadth-first search when every
+    walkable cell costs the same, Dijkstra's algorithm otherwise, each cell being settled once. The next steps are then
+    taken with arrays of the whole grid, every cell going to its first neighbor through which it is the cheapest.
+
+    The field is the one of the costs of the graph when it was computed.
+
+    Attributes:
+        width (int) : Width of the grid, in blocks.
+        targets (list(tuple)) : (x, y) cells the field goes to, the walkable ones.
+        distances (numpy.ndarray) : Float array indexed like the graph, cost of the cheapest path to a target, inf when
+            none can be reached.
+        nextSteps (numpy.ndarray) : Int array indexed like the graph, next cell of the cheapest path to a target, the
+            cell itself on a target, -1 when no target can be reached.
+    """
+
+    # (dy, dx) of the neighbors, in the order Astar tries them
+    DIRECTIONS = ((-1, 0), (0, -1), (1, 0), (0, 1))
+
+    def __init__(self, graph, targets):
+        """
+        Parameters:
+            graph (GridGraph) : The graph of the map.
+            targets (list(tuple)) : (x, y) cells to go to.
+        """
+        self.width = graph.width
+        self.targets = [(x, y) for (x, y) in targets if graph.contains(x, y) and graph.walkable[graph.index(x, y)]]
+
+        (self.distances, self.nextSteps) = FlowField.Compute(graph, self.targets)
+
+        # Lookups through lists, faster than numpy for one item
+        self._distances = self.distances.tolist()
+        self._nextSteps = self.nextSteps.tolist()
+
+    @staticmethod
+    def Compute(graph, targets):
+        """
+        Returns:
+            field (tuple) : (distances, nextSteps) of targets on graph, see the attributes.
+        """
+        distances = FlowField._search(graph, targets)
+
+        (height, width) = (graph.height, graph.width)
+
+        walkable = numpy.frombuffer(graph.walkable, dtype = numpy.uint8).reshape(height, width).astype(bool)
+        costs = numpy.frombuffer(graph.costs, dtype = numpy.float64).reshape(height, width)
+
+        # Cost of entering each cell, inf for the solid ones
+        entering = numpy.where(walkable, costs, math.inf)
+
+        distances = numpy.frombuffer(distances, dtype = numpy.float64).reshape(height, width)
+
+        through = numpy.empty((len(FlowField.DIRECTIONS), height, width))
+        FlowField._throughNeighbors(distances + entering, through)
+
+        # The first cheapest neighbor, then the cell itself on a target
+        choices = through.argmin(axis = 0)
+
+        indices = numpy.arange(height * width).reshape(height, width)
+        offsets = numpy.array([dy * width + dx for (dy, dx) in FlowField.DIRECTIONS])
+
+        nextSteps = numpy.where(numpy.isfinite(distances), indices + offsets[choices], -1)
+        nextSteps[distances == 0] = indices[distances == 0]
+
+        return (distances.ravel(), nextSteps.ravel())
+
+    @staticmethod
+    def _search(graph, targets):
+        """
+        Returns:
+            distances (array) : Cost of the cheapest path from each cell to a target, indexed like the graph, inf when
+                none can be reached.
+        """
+        (width, size) = (graph.width, graph.width * graph.height)
+        (walkable, cellCosts) = (graph.walkable, graph.costs)
+
+        distances = array("d", [math.inf]) * size
+
+        for (x, y) in targets:
+            distances[y * width + x] = 0
+
+        border = [y * width + x for (x, y) in targets]
+        uniform = len({ cellCosts[index] for index in range(size) if walkable[index] }) <= 1
+
+        if uniform:
+            # Settled in the order they are found, each one a cell further than the one it was found from
+            border = collections.deque(border)
+        else:
+            border = [(0, index) for index in border]
+            heapq.heapify(border)
+
+        while border:
+            if uniform:
+                index = border.popleft()
+                distance = distances[index]
+            else:
+                (distance, index) = heapq.heappop(border)
+
+                if distance > distances[index]:
+                    # A cheaper entry of this cell came out before
+                    continue
+
+            # Going to this cell from a neighbor costs entering it
+            cost = distance + cellCosts[index]
+            (y, x) = divmod(index, width)
+
+            for neighbor in (
+                index - width if y > 0 else -1,
+                index - 1 if x > 0 else -1,
+                index + width if index + width < size else -1,
+                index + 1 if x < width - 1 else -1,
+            ):
+                if neighbor < 0 or not walkable[neighbor] or cost >= distances[neighbor]:
+                    continue
+
+                distances[neighbor] = cost
+
+                if uniform:
+                    border.append(neighbor)
+                else:
+                    heapq.heappush(border, (cost, neighbor))
+
+        return distances
+
+    @staticmethod
+    def _throughNeighbors(costs, through):
+        """
+        Fills through[direction][y, x] with costs of the neighbor of (x, y) in that direction, inf out of the grid.
+        """
+        (height, width) = costs.shape
+
+        through.fill(math.inf)
+
+        for (direction, (dy, dx)) in enumerate(FlowField.DIRECTIONS):
+            source = costs[max(dy, 0):height + min(dy, 0), max(dx, 0):width + min(dx, 0)]
+            through[direction, max(-dy, 0):height + min(-dy, 0), max(-dx, 0):width + min(-dx, 0)] = source
+
+    def distance(self, cell):
+        """
+        Returns:
+            distance (float) : Cost of the cheapest path from an (x, y) cell to a target, inf when none can be reached.
+        """
+        return self._distances[cell[1] * self.width + cell[0]]
+
+    def nextCell(self, cell):
+        """
+        Returns:
+            cell (tuple) : (x, y) cell to go to from an (x, y) cell, the cell itself on a target. None when no target
+                can be reached.
+        """
+        index = self._nextSteps[cell[1] * self.width + cell[0]]
+
+        return None if index < 0 else (index % self.width, index // self.width)
+
+    def path(self, cell):
+        """
+        Returns:
+            path (list) : (x, y) cells from an (x, y) cell to the nearest target, both included, like Astar.getPath.
+                None when no target can be reached.
+        """
+        index = cell[1] * self.width + cell[0]
+
+        if self._nextSteps[index] < 0:
+            return None
+
+        path = [cell]
+
+        while self._nextSteps[index] != index:
+            index = self._nextSteps[index]
+            path.append((index % self.width, index // self.width))
+
+        return path
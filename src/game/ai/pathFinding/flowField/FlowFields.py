@@ -0,0 +1,34 @@
+from ai.pathFinding.flowField.FlowField import FlowField
+from domain.Map import Map
+
+class FlowFields:
+    """
+    The flow fields of a map towards its strategic blocks : the flag zones, depots and spawns of each team, a field
+    going to the nearest block of each kind and team.
+
+    Attributes:
+        fields (dict) : FlowField of each (kind, team), kind being "flagZones", "depots" or "spawns".
+    """
+
+    KINDS = ("flagZones", "depots", "spawns")
+
+    def __init__(self, graph, mapData):
+        """
+        Parameters:
+            graph (GridGraph) : The graph of the map.
+            mapData (dict) : The map, as given to a Player.
+        """
+        self.fields = dict()
+
+        for kind in FlowFields.KINDS:
+            for (team, blocks) in mapData[kind].items():
+                cells = [(int(block.x // Map.BLOCKSIZE), int(block.y // Map.BLOCKSIZE)) for block in blocks]
+
+                self.fields[(kind, team)] = FlowField(graph, cells)
+
+    def get(self, kind, team):
+        """
+        Returns:
+            field (FlowField) : The field towards the blocks of a kind, "flagZones", "depots" or "spawns", of a team.
+        """
+        return self.fields[(kind, team)]
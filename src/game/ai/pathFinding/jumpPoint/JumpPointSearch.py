@@ -0,0 +1,248 @@
+from ai.pathFinding.PathFinder import PathFinder
+from ai.pathFinding.PathCache import PathCache
+from ai.pathFinding.aStar.Astar import Astar
+from ai.pathFinding.base.GridGraph import GridGraph
+from domain.Map import Map
+from array import array
+import heapq
+import itertools
+import math
+
+class JumpPointSearch(PathFinder):
+    """
+    Jump Point Search on a GridGraph whose cells all cost the same, like NodeAstar makes them, bots moving along the
+    axes only.
+
+    It is A* where a cell is only put in the open set when a shortest path has to turn there : from a cell, the
+    search jumps along a line as long as the cells next to the line are reachable as cheaply some other way, and
+    stops at the goal or at a jump point. Moving horizontally, the jump stops next to an obstacle that ends, the cell
+    past it being only reachable from here (a forced neighbor). Moving vertically, horizontal jumps start from each
+    cell, and the vertical jump stops where one of them finds a jump point. Long empty corridors are crossed in one
+    expansion.
+
+    When the costs of the graph are not uniform (see GridGraph.setCost), or when it is a single column, paths are
+    searched by Astar instead.
+
+    Attributes:
+        expanded (int) : Number of jump points expanded by the last search.
+    """
+
+    def __init__(self, graph, cache = None):
+        """
+        Parameters:
+            graph (GridGraph) : The graph searched.
+            cache (PathCache) : Paths already found, a PathCache of this finder when None.
+        """
+        if not isinstance(graph, GridGraph):
+            raise Exception("JumpPointSearch searches a GridGraph, not a {}".format(type(graph).__name__))
+
+        super().__init__(graph, cache)
+
+        self.expanded = 0
+
+        self._astar = Astar(graph)
+        self._uniformHash = None
+        self._uniform = True
+
+    #Override method
+    def getPath(self, start, goal):
+        """
+        Parameters:
+            start (tuple) : (x, y) point the path starts from.
+            goal (tuple) : (x, y) point the path goes to.
+
+        Returns:
+            path (list) : (x, y) cells from the start to the goal, both included, each next to the previous one, like
+                Astar.getPath. None when the goal can not be reached.
+        """
+        startCell = (int(start[0] // Map.BLOCKSIZE), int(start[1] // Map.BLOCKSIZE))
+        goalCell  = (int(goal[0] // Map.BLOCKSIZE), int(goal[1] // Map.BLOCKSIZE))
+
+        path = self._cache.get(self._graph, startCell, goalCell)
+
+        if path is not PathCache.MISS:
+            return path
+
+        # On a single column, the vertical moves (+-width) are the horizontal ones (+-1) and jumps can not tell them apart
+        if self.isUniform() and self._graph.width > 1:
+            path = self.searchGrid(startCell, goalCell)
+        else:
+            path = self._astar.searchGrid(startCell, goalCell)
+            self.expanded = self._astar.expanded
+
+        self._cache.put(self._graph, startCell, goalCell, path)
+
+        return path
+
+    def isUniform(self):
+        """
+        Returns:
+            uniform (bool) : Whether every cell of the graph costs the same, checked again when its content changed.
+        """
+        contentHash = self._graph.contentHash()
+
+        if contentHash != self._uniformHash:
+            costs = self._graph.costs
+
+            self._uniform = len(costs) == 0 or min(costs) == max(costs)
+            self._uniformHash = contentHash
+
+        return self._uniform
+
+    def searchGrid(self, startCell, goalCell):
+        """
+        Returns:
+            path (list) : (x, y) cells from startCell to goalCell, None when goalCell can not be reached.
+        """
+        graph = self._graph
+        self.expanded = 0
+
+        if not graph.contains(*startCell) or not graph.contains(*goalCell):
+            return None
+
+        (width, size) = (graph.width, graph.width * graph.height)
+        (goalX, goalY) = goalCell
+
+        start = graph.index(*startCell)
+        goal  = graph.index(*goalCell)
+
+        # A cell is as far as the number of cells in between, and reached moving by one of -width, -1, width, 1
+        costs   = array("d", [math.inf]) * size
+        parents = array("l", [-1]) * size
+        moves   = array("l", [0]) * size
+        closed  = bytearray(size)
+
+        costs[start] = 0
+
+        # (estimated total cost, -cost, order, index) : deeper cells first among equal estimates, then the oldest
+        order  = itertools.count()
+        border = [(abs(startCell[0] - goalX) + abs(startCell[1] - goalY), 0, next(order), start)]
+
+        while border:
+            index = heapq.heappop(border)[3]
+
+            if closed[index]:
+                # A cheaper entry of this cell came out before
+                continue
+
+            if index == goal:
+                return self.reconstructGridPath(parents, index)
+
+            closed[index] = 1
+            self.expanded += 1
+
+            for (jumpPoint, move) in self._successors(index, moves[index], goal):
+                if closed[jumpPoint]:
+                    continue
+
+                # Along a line : the number of steps
+                cost = costs[index] + abs(jumpPoint - index) // (1 if move in (1, -1) else width)
+
+                if cost < costs[jumpPoint]:
+                    costs[jumpPoint]   = cost
+                    parents[jumpPoint] = index
+                    moves[jumpPoint]   = move
+
+                    (jumpY, jumpX) = divmod(jumpPoint, width)
+                    heapq.heappush(border, (cost + abs(jumpX - goalX) + abs(jumpY - goalY), -cost, next(order), jumpPoint))
+
+        return None
+
+    def _successors(self, index, move, goal):
+        """
+        Returns:
+            successors (list(tuple)) : (jump point, move) found from a cell reached by a move, 0 for the start.
+        """
+        (walkable, width, height) = (self._graph.walkable, self._graph.width, self._graph.height)
+
+        if move == 0:
+            moves = (-width, -1, width, 1)
+        elif move in (1, -1):
+            y = index // width
+            moves = [move]
+
+            # Forced neighbors : past an obstacle that ended, above or below
+            if y > 0 and walkable[index - width] and not walkable[index - width - move]:
+                moves.append(-width)
+            if y < height - 1 and walkable[index + width] and not walkable[index + width - move]:
+                moves.append(width)
+        else:
+            moves = (move, -1, 1)
+
+        successors = list()
+
+        for nextMove in moves:
+            if nextMove in (1, -1):
+                jumpPoint = self._jumpHorizontal(index, nextMove, goal)
+            else:
+                jumpPoint = self._jumpVertical(index, nextMove, goal)
+
+            if jumpPoint >= 0:
+                successors.append((jumpPoint, nextMove))
+
+        return successors
+
+    def _jumpHorizontal(self, index, move, goal):
+        """
+        Returns:
+            jumpPoint (int) : The first jump point from a cell along its row, -1 when an obstacle or the border of the
+                grid comes first.
+        """
+        (walkable, width, height) = (self._graph.walkable, self._graph.width, self._graph.height)
+        (y, x) = divmod(index, width)
+
+        (above, below) = (y > 0, y < height - 1)
+
+        while True:
+            x += move
+            index += move
+
+            if not 0 <= x < width or not walkable[index]:
+                return -1
+
+            if index == goal:
+                return index
+
+            if above and walkable[index - width] and not walkable[index - width - move]:
+                return index
+            if below and walkable[index + width] and not walkable[index + width - move]:
+                return index
+
+    def _jumpVertical(self, index, move, goal):
+        """
+        Returns:
+            jumpPoint (int) : The first jump point from a cell along its column, a cell from which a horizontal jump
+                finds one. -1 when an obstacle or the border of the grid comes first.
+        """
+        (walkable, size) = (self._graph.walkable, self._graph.width * self._graph.height)
+
+        while True:
+            index += move
+
+            if not 0 <= index < size or not walkable[index]:
+                return -1
+
+            if index == goal:
+                return index
+
+            if self._jumpHorizontal(index, 1, goal) >= 0 or self._jumpHorizontal(index, -1, goal) >= 0:
+                return index
+
+    def reconstructGridPath(self, parents, index):
+        """
+        Returns:
+            path (list) : (x, y) cells from the start to index, every cell between two jump points included.
+        """
+        graph = self._graph
+        path = [graph.cell(index)]
+
+        while parents[index] >= 0:
+            parent = parents[index]
+            step = (1 if parent < index else -1) * (1 if parent // graph.width == index // graph.width else graph.width)
+
+            while index != parent:
+                index -= step
+                path.append(graph.cell(index))
+
+        path.reverse()
+        return path
@@ -1,10 +1,10 @@
 from domain.Player import Player
+from domain.PollingView import PollingView
 from domain.Map.RegularMap import RegularMap
 
 from ai.pathFinding.PathFinder import PathFinder
 from ai.pathFinding.aStar.Astar import Astar
-from ai.pathFinding.aStar.NodeAstar import NodeAstar
-from ai.pathFinding.base.Graph import Graph
+from ai.pathFinding.MapAnalysis import MapAnalysis
 
 from domain.Map import Map
 
@@ -37,6 +37,8 @@ def convertPath(path):
 
 
 class myPlayer(Player):
+
+    DELTA_POLLING = True
     
     def debug(self, botId, message):
         """
@@ -56,30 +58,25 @@ class myPlayer(Player):
         self._team         = team
         self._map          = RegularMap(gameMap)
         self._rules        = rules
-        self._pathFinder   = Astar(Graph(self.buildNodeList(), [], None))
+        self._pathFinder   = Astar(MapAnalysis.Get(gameMap).graph, cache = MapAnalysis.Get(gameMap).paths[team])
+        self._depotField   = MapAnalysis.Get(gameMap).flowFields.get("depots", team)
 
         self._init = True
 
+        self._view = PollingView()
+
 
         self._botData = {"bots": dict()}
 
 
-    def buildNodeList(self):
+    @classmethod
+    def prepare(cls, gameMap):
         """
-        Build the node list for pathfinding.
-
-        Return:
-            NodeList (list): node list for pathfinding.
+        Override the Player prepare method : the pathfinding graph, path cache and flow fields are built before the
+        player processes are forked.
         """
+        MapAnalysis.Get(gameMap)
 
-        Nodelist = []
-        for y in range(self._map.blockHeight):
-            for x in range(self._map.blockWidth):
-                    Nodelist.insert(
-                        0,
-                        NodeAstar(x, y, self._map.blocks[x][y]))
-        return Nodelist
-    
 
     def _build_response(self):
         """
@@ -126,6 +123,7 @@ class myPlayer(Player):
         """
         Override the Player poll method.
         """
+        pollingData = self._view.update(pollingData)
 
         if self._init:
             for botId in pollingData["bots"]:
@@ -165,16 +163,11 @@ class myPlayer(Player):
             f (function()) : Function that take in parameters dt, the delta time used by NodeTree.tick().
         """
         def f(dt):
-            randomDepotPos = self._map.GetRandomPositionInDepot(self._team, margin = 20)
-
-            
-            path = self._pathFinder.getPath(
-                (
-                    int(self._botData["bots"][botId]["currentPosition"][0]),
-                    int(self._botData["bots"][botId]["currentPosition"][1])
-                ),
-                randomDepotPos
-            )
+            # Towards the nearest block of the depot, followed in the flow field of the map
+            path = self._depotField.path((
+                int(self._botData["bots"][botId]["currentPosition"][0] // Map.BLOCKSIZE),
+                int(self._botData["bots"][botId]["currentPosition"][1] // Map.BLOCKSIZE)
+            ))
 
 
             self._botData["bots"][botId]["path"]        = convertPath(path)
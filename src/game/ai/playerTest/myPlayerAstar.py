@@ -2,8 +2,7 @@ from domain.Player import Player
 from domain.Map.RegularMap import RegularMap
 from ai.pathFinding.PathFinder import PathFinder
 from ai.pathFinding.aStar.Astar import Astar
-from ai.pathFinding.aStar.NodeAstar import NodeAstar
-from ai.pathFinding.base.Graph import Graph
+from ai.pathFinding.MapAnalysis import MapAnalysis
 from domain.Map import Map
 import math
 import random
@@ -43,7 +42,8 @@ class myPlayer(Player):
         # map and rules are python objects, need to make them JSON
         self._map          = _map
         self._rules        = rules
-        self._graph        = Graph(self.buildNodeList(), [], None)
+        self._graph        = MapAnalysis.Get(_map).graph
+        self._paths        = MapAnalysis.Get(_map).paths[team]
         self._pathFinder   = None
         self._currentPath  = {}
         self._currentIndex = {}
@@ -55,23 +55,12 @@ class myPlayer(Player):
         #print("Bonjour! Je suis un joueur :))) avec {} bots".format(rules["BotsCount"]))
 
     """
-        Build a list of NodeAstar representing each block of the map
-
-        A nodeAstar is represented by (x, y, cellContent)
-        For exemple: NodeAstar(1, 1, WallObject)
-
-        Returns:
-            The NodeList representing each block ofthe map
+        The graph of the map and its path cache are built once, before the player processes are forked when they can share it.
     """
 
-    def buildNodeList(self):
-        Nodelist = []
-        for y in range(self._map["blockHeight"]):
-            for x in range(self._map["blockWidth"]):
-                    Nodelist.insert(
-                        0,
-                        NodeAstar(x, y, self._map["blocks"][x][y]))
-        return Nodelist
+    @classmethod
+    def prepare(cls, _map):
+        MapAnalysis.Get(_map)
     
     """ Returns the distance beetween coordinates """
 
@@ -87,7 +76,7 @@ class myPlayer(Player):
 
     def initPathFinder(self):
         if not self._pathFinder:
-            self._pathFinder = Astar(self._graph)
+            self._pathFinder = Astar(self._graph, cache = self._paths)
 
     """
         Initialize the current index (in order to be able to know on which position of the path we are)
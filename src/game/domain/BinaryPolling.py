@@ -0,0 +1,248 @@
+import struct
+
+class Field:
+    """
+    A number of an entry of binary polling data, read from the buffer each time it is accessed.
+    """
+
+    def __init__(self, entry, index):
+        """
+        Parameters:
+            entry (Struct) : Layout of the entry.
+            index (int) : Position of the number in the entry.
+        """
+        codes = entry.format.lstrip("<")
+
+        self._struct = struct.Struct("<" + codes[index])
+        self._offset = struct.calcsize("<" + codes[:index])
+
+    def __get__(self, view, owner = None):
+        if view is None:
+            return self
+
+        return self._struct.unpack_from(view._buffer, view._offset + self._offset)[0]
+
+class BinaryPolling:
+    """
+    Reads polling data built by BinaryBuilder, without copying it : bots and seen objects are views whose fields are
+    read from the buffer when accessed. Only needs the struct module, so that players written outside of this repo
+    can copy it.
+
+    The buffer must not change while it is read, BinaryBuilder writes the next polling data in the same buffer.
+
+    Layout, little-endian without padding :
+        HEADER, then for each bot BOT followed by SEEN for each object it sees, then FLAG for each flag event, then
+        STRING for each string, each followed by its UTF-8 bytes. Bot identifiers and object types are written by
+        their index among the strings.
+
+    Attributes:
+        missedTicks (int) : Number of ticks missed by the player.
+        strings (list(string)) : Bot identifiers and type names used by the polling data.
+        bots (list(BotView)) : The bots of the player, in order.
+        flags (list((team, x, y))) : The flag events.
+    """
+
+    MAGIC = b"CTFP"
+
+    VERSION = 1
+
+    HEADER = struct.Struct("<4sBxHHIq")
+    """
+    MAGIC, VERSION, number of bots, number of flag events, offset of the strings, missed ticks.
+    """
+
+    BOT = struct.Struct("<HdddddidH")
+    """
+    Identifier, x, y, angle, speed, life, flag, cooldown, number of objects seen.
+    """
+
+    SEEN = struct.Struct("<H?dddddid")
+    """
+    Type, whether it is a bot, x, y, then angle, speed, life, flag and cooldown for bots only.
+    """
+
+    FLAG = struct.Struct("<idd")
+    """
+    Team, x, y.
+    """
+
+    STRING = struct.Struct("<H")
+    """
+    Number of strings at the strings offset, then length of each string in bytes.
+    """
+
+    def __init__(self, buffer):
+        """
+        Parameters:
+            buffer (bytes-like) : The polling data, bytes, bytearray, memoryview or shared memory.
+        """
+        self._buffer = memoryview(buffer)
+
+        (magic, version, self._botsCount, self._flagsCount, stringsOffset, self.missedTicks) = \
+            BinaryPolling.HEADER.unpack_from(self._buffer, 0)
+
+        if magic != BinaryPolling.MAGIC or version != BinaryPolling.VERSION:
+            raise Exception("Not binary polling data of version {}".format(BinaryPolling.VERSION))
+
+        self.strings = list()
+
+        (count,) = BinaryPolling.STRING.unpack_from(self._buffer, stringsOffset)
+        offset = stringsOffset + BinaryPolling.STRING.size
+
+        for i in range(count):
+            (length,) = BinaryPolling.STRING.unpack_from(self._buffer, offset)
+            offset += BinaryPolling.STRING.size
+            self.strings.append(str(self._buffer[offset : offset + length], "utf-8"))
+            offset += length
+
+        self._bots = None
+        self._flagsOffset = None
+
+    @property
+    def bots(self):
+        if self._bots is None:
+            self._bots = list()
+            offset = BinaryPolling.HEADER.size
+
+            for i in range(self._botsCount):
+                bot = BotView(self, offset)
+                self._bots.append(bot)
+                offset += BinaryPolling.BOT.size + bot.seenCount * BinaryPolling.SEEN.size
+
+            self._flagsOffset = offset
+
+        return self._bots
+
+    def bot(self, botId):
+        """
+        Returns:
+            bot (BotView) : The bot with this identifier, None if it is not in the polling data.
+        """
+        for bot in self.bots:
+            if bot.id == botId:
+                return bot
+
+        return None
+
+    @property
+    def flags(self):
+        self.bots
+
+        return list(BinaryPolling.FLAG.iter_unpack(
+            self._buffer[self._flagsOffset : self._flagsOffset + self._flagsCount * BinaryPolling.FLAG.size]))
+
+    def toDict(self):
+        """
+        Returns:
+            pollingData (dict) : The same polling data, as DictBuilder builds it. Numbers are floats, except
+                counts, flags and teams.
+        """
+        events = dict()
+
+        if self._flagsCount > 0:
+            events["flags"] = [{"team": team, "position": (x, y)} for (team, x, y) in self.flags]
+
+        return {
+            "bots": { bot.id: dict(bot.toDict(), seen = [seen.toDict() for seen in bot.seen]) for bot in self.bots },
+            "events": events,
+            "missedTicks": self.missedTicks,
+        }
+
+class BotView:
+    """
+    A bot of binary polling data, see BinaryPolling.
+
+    Attributes:
+        id (string) : Identifier of the bot.
+        seen (list(SeenView)) : The objects it sees.
+    """
+
+    x = Field(BinaryPolling.BOT, 1)
+    y = Field(BinaryPolling.BOT, 2)
+    angle = Field(BinaryPolling.BOT, 3)
+    speed = Field(BinaryPolling.BOT, 4)
+    life = Field(BinaryPolling.BOT, 5)
+    flag = Field(BinaryPolling.BOT, 6)
+    cooldown = Field(BinaryPolling.BOT, 7)
+    seenCount = Field(BinaryPolling.BOT, 8)
+
+    _idIndex = Field(BinaryPolling.BOT, 0)
+
+    def __init__(self, polling, offset):
+        self._polling = polling
+        self._buffer = polling._buffer
+        self._offset = offset
+
+    @property
+    def id(self):
+        return self._polling.strings[self._idIndex]
+
+    @property
+    def currentPosition(self):
+        return (self.x, self.y, self.angle, self.speed)
+
+    @property
+    def seen(self):
+        offset = self._offset + BinaryPolling.BOT.size
+
+        return [SeenView(self._polling, offset + i * BinaryPolling.SEEN.size) for i in range(self.seenCount)]
+
+    def toDict(self):
+        return {
+            "currentPosition": self.currentPosition,
+            "life": self.life,
+            "flag": self.flag,
+            "cooldown": self.cooldown,
+        }
+
+class SeenView:
+    """
+    An object seen by a bot in binary polling data, see BinaryPolling. Only bots have an angle, a speed, a life, a
+    flag and a cooldown, they are 0 for other objects.
+
+    Attributes:
+        type (string) : Name of the class of the object.
+        isBot (bool) : Whether the object is a bot.
+    """
+
+    isBot = Field(BinaryPolling.SEEN, 1)
+    x = Field(BinaryPolling.SEEN, 2)
+    y = Field(BinaryPolling.SEEN, 3)
+    angle = Field(BinaryPolling.SEEN, 4)
+    speed = Field(BinaryPolling.SEEN, 5)
+    life = Field(BinaryPolling.SEEN, 6)
+    flag = Field(BinaryPolling.SEEN, 7)
+    cooldown = Field(BinaryPolling.SEEN, 8)
+
+    _typeIndex = Field(BinaryPolling.SEEN, 0)
+
+    def __init__(self, polling, offset):
+        self._polling = polling
+        self._buffer = polling._buffer
+        self._offset = offset
+
+    @property
+    def type(self):
+        return self._polling.strings[self._typeIndex]
+
+    @property
+    def currentPosition(self):
+        if self.isBot:
+            return (self.x, self.y, self.angle, self.speed)
+
+        return (self.x, self.y)
+
+    def toDict(self):
+        if self.isBot:
+            return {
+                "type": self.type,
+                "currentPosition": self.currentPosition,
+                "life": self.life,
+                "flag": self.flag,
+                "cooldown": self.cooldown,
+            }
+
+        return {
+            "type": self.type,
+            "currentPosition": self.currentPosition,
+        }
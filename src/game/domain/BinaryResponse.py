@@ -0,0 +1,119 @@
+import struct
+
+class BinaryResponse:
+    """
+    Writes the response of a player in a preallocated buffer, with a fixed binary layout, and reads it back on the
+    other side. Like BinaryPolling, only needs the struct module.
+
+    Layout, little-endian without padding :
+        HEADER, then for each bot ordered ORDER followed by the UTF-8 bytes of its identifier.
+
+    Attributes:
+        buffer (bytearray) : Where responses are encoded, grown when a response does not fit.
+    """
+
+    MAGIC = b"CTFR"
+
+    VERSION = 1
+
+    HEADER = struct.Struct("<4sBBH")
+    """
+    MAGIC, VERSION, status, number of orders.
+    """
+
+    ORDER = struct.Struct("<dddqH")
+    """
+    Target x, target y, target speed, actions, length of the identifier of the bot in bytes.
+    """
+
+    ORDERS = 0
+    """
+    Status of a response giving orders to bots.
+    """
+
+    PASS = 1
+    """
+    Status of an empty response : the player passes its turn.
+    """
+
+    def __init__(self, capacity = 512):
+        """
+        Parameters:
+            capacity (int) : Size of the buffer at first, in bytes.
+        """
+        self.buffer = bytearray(capacity)
+
+    def encode(self, response):
+        """
+        Writes a response in the buffer, replacing the previous one.
+
+        Parameters:
+            response (dict) : The response, as Player.poll returns it.
+
+        Returns:
+            data (memoryview) : The response written, a view over the buffer.
+        """
+        if response == {}:
+            self._reserve(BinaryResponse.HEADER.size)
+            BinaryResponse.HEADER.pack_into(self.buffer, 0, BinaryResponse.MAGIC, BinaryResponse.VERSION,
+                BinaryResponse.PASS, 0)
+
+            return memoryview(self.buffer)[:BinaryResponse.HEADER.size]
+
+        offset = BinaryResponse.HEADER.size
+
+        for (botId, order) in response["bots"].items():
+            name = str(botId).encode("utf-8")
+            (x, y, speed) = order["targetPosition"]
+
+            self._reserve(offset + BinaryResponse.ORDER.size + len(name))
+
+            BinaryResponse.ORDER.pack_into(self.buffer, offset, x, y, speed, order["actions"], len(name))
+            offset += BinaryResponse.ORDER.size
+            self.buffer[offset : offset + len(name)] = name
+            offset += len(name)
+
+        BinaryResponse.HEADER.pack_into(self.buffer, 0, BinaryResponse.MAGIC, BinaryResponse.VERSION,
+            BinaryResponse.ORDERS, len(response["bots"]))
+
+        return memoryview(self.buffer)[:offset]
+
+    def _reserve(self, size):
+        # A new buffer rather than extending this one, results still viewed keep the old one
+        if len(self.buffer) < size:
+            buffer = bytearray(max(size, 2 * len(self.buffer)))
+            buffer[:len(self.buffer)] = self.buffer
+            self.buffer = buffer
+
+    @staticmethod
+    def decode(buffer):
+        """
+        Reads a response written by encode.
+
+        Parameters:
+            buffer (bytes-like) : The response.
+
+        Returns:
+            response (dict) : The response as Player.poll returned it, numbers of the target positions are floats.
+        """
+        buffer = memoryview(buffer)
+
+        (magic, version, status, count) = BinaryResponse.HEADER.unpack_from(buffer, 0)
+
+        if magic != BinaryResponse.MAGIC or version != BinaryResponse.VERSION:
+            raise Exception("Not a binary response of version {}".format(BinaryResponse.VERSION))
+
+        if status == BinaryResponse.PASS:
+            return {}
+
+        bots = dict()
+        offset = BinaryResponse.HEADER.size
+
+        for i in range(count):
+            (x, y, speed, actions, length) = BinaryResponse.ORDER.unpack_from(buffer, offset)
+            offset += BinaryResponse.ORDER.size
+
+            bots[str(buffer[offset : offset + length], "utf-8")] = { "targetPosition": (x, y, speed), "actions": actions }
+            offset += length
+
+        return { "bots": bots }
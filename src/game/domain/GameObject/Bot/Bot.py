@@ -51,8 +51,7 @@ class Bot(GameObject):
     def pickUp(self, gameObject):
         if not gameObject.held:
             gameObject.held = True
-            gameObject.x = self.x
-            gameObject.y = self.y
+            gameObject.moveTo(self.x, self.y)
             self.heldItems.append(gameObject)
 
     def drop(self, gameObject):
@@ -10,9 +10,12 @@ class GameObject:
         pickable (bool) : Whether it can be picked up and moved around
         held (bool) : Whether it is held by someone or something
         category (String) : Object category (to call the correct class)
+        grid (SpatialGrid) : The grid following this object, if any
 
     """
 
+    grid = None
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -24,5 +27,15 @@ class GameObject:
         self.x += x
         self.y += y
 
+        if self.grid is not None:
+            self.grid.update(self)
+
+    def moveTo(self, x, y):
+        self.x = x
+        self.y = y
+
+        if self.grid is not None:
+            self.grid.update(self)
+
     def isIn(self, x, y):
         raise NotImplementedError
\ No newline at end of file
@@ -47,14 +47,17 @@ class Map:
         raise NotImplementedError
 
     @staticmethod
-    def GetRandomPositionInBlock(block, margin = 0):
+    def GetRandomPositionInBlock(block, margin = 0, generator = None):
         """
         Obtain a random coordinate inside a block
 
         Parameters:
             block (Block): A block with x and y coordinates.
+            generator (Random): The random generator to draw from, the global one when None.
 
         Returns:
             point (x,y): A point inside the given block.
         """
-        return (block.x + randint(margin,Map.BLOCKSIZE - margin), block.y + randint(margin,Map.BLOCKSIZE - margin))
\ No newline at end of file
+        randomInt = randint if generator is None else generator.randint
+
+        return (block.x + randomInt(margin,Map.BLOCKSIZE - margin), block.y + randomInt(margin,Map.BLOCKSIZE - margin))
\ No newline at end of file
@@ -1,4 +1,5 @@
 from domain.Map import Map
+from domain.Map.SpatialGrid import SpatialGrid
 from domain.GameObject.Block import *
 from domain.GameObject.Flag import Flag
 from domain.GameObject.PowerUp import *
@@ -7,9 +8,12 @@ from random import *
 class RegularMap(Map):
     """
     Implements Map.
+
+    Attributes:
+        grid (SpatialGrid): Where the objects and the bots of the map are, by block.
     """
 
-    def __init__(self, mapData):
+    def __init__(self, mapData, seed = None):
         """
         Initialize the Map according to mapData.
 
@@ -25,6 +29,8 @@ class RegularMap(Map):
             flagZones (list):   List of FlagZone objects
             depots (list):      List of Depot objects
             objects (list):     List of GameObjects
+
+            seed (any):         Seed of the random positions given by this map, unpredictable when None.
         """
         Map.BLOCKSIZE    = mapData["blocksize"]
         self.blockHeight = mapData["blockHeight"]
@@ -39,11 +45,28 @@ class RegularMap(Map):
 
         self._bots = list()
 
+        self._random = Random(seed)
+
+        # Bots are added by the model once they are created
+        self.grid = SpatialGrid(Map.BLOCKSIZE)
+
+        for category in self.objects.values():
+            for gameObject in category:
+                self.grid.insert(gameObject)
+
     @staticmethod
     def loadMapData(filename):
         """
         Constructs the map data for Init. See its description above.
         """
+        with open(filename, "r") as file:
+            return RegularMap.parseMapData(file.readlines())
+
+    @staticmethod
+    def parseMapData(lines):
+        """
+        Constructs the map data for Init from the lines of a map file, see loadMapData.
+        """
 
         # To use for the 'mapData' parameter in constructor
         data = {
@@ -78,61 +101,58 @@ class RegularMap(Map):
         data["objects"] = { "Default": []}
         
 
-        with open(filename, "r") as file:
-            lines = file.readlines()
-
-            mapDefinitionLines = 3 # The amount of lines before the map tiling
+        mapDefinitionLines = 3 # The amount of lines before the map tiling
 
-            data["blocksize"] = int(lines[0].split(":")[1])
-            Map.BLOCKSIZE = data["blocksize"]
+        data["blocksize"] = int(lines[0].split(":")[1])
+        Map.BLOCKSIZE = data["blocksize"]
 
-            data["blockWidth"] = int(lines[1].split(":")[1])
-            data["blockHeight"] = int(lines[2].split(":")[1])
+        data["blockWidth"] = int(lines[1].split(":")[1])
+        data["blockHeight"] = int(lines[2].split(":")[1])
 
-            data["height"] = data["blockHeight"] * Map.BLOCKSIZE
-            data["width"] = data["blockWidth"] * Map.BLOCKSIZE
+        data["height"] = data["blockHeight"] * Map.BLOCKSIZE
+        data["width"] = data["blockWidth"] * Map.BLOCKSIZE
 
-            # The file lines that contains the map tiling
-            # Used to fill 'data["blocks"]' according to 'blocks'
-            mapLines = lines[mapDefinitionLines : data["blockHeight"] + mapDefinitionLines]
+        # The file lines that contains the map tiling
+        # Used to fill 'data["blocks"]' according to 'blocks'
+        mapLines = lines[mapDefinitionLines : data["blockHeight"] + mapDefinitionLines]
 
-            data["blocks"] = [[None for i in range(data["blockHeight"])] for i in range(data["blockWidth"])]
+        data["blocks"] = [[None for i in range(data["blockHeight"])] for i in range(data["blockWidth"])]
 
-            for y in range(data["blockHeight"]):
-                for x in range(data["blockWidth"]):
-                    if mapLines[y][x] not in blocks.keys():
-                        continue
+        for y in range(data["blockHeight"]):
+            for x in range(data["blockWidth"]):
+                if mapLines[y][x] not in blocks.keys():
+                    continue
 
-                    # See definition of 'blocks' for explanation
-                    data["blocks"][x][y] = eval(blocks[mapLines[y][x]].format(x * Map.BLOCKSIZE,y * Map.BLOCKSIZE))
+                # See definition of 'blocks' for explanation
+                data["blocks"][x][y] = eval(blocks[mapLines[y][x]].format(x * Map.BLOCKSIZE,y * Map.BLOCKSIZE))
 
-                    if(type(data["blocks"][x][y]).__name__ == "Spawn"):
-                        # If this is a spawn block, add it to it's team's spawn blocks
-                        data["spawns"][data["blocks"][x][y].team].append(data["blocks"][x][y])
+                if(type(data["blocks"][x][y]).__name__ == "Spawn"):
+                    # If this is a spawn block, add it to it's team's spawn blocks
+                    data["spawns"][data["blocks"][x][y].team].append(data["blocks"][x][y])
 
-                    elif(type(data["blocks"][x][y]).__name__ == "FlagZone"):
-                        # One flag zone per team ?
-                        data["flagZones"][data["blocks"][x][y].team].append(data["blocks"][x][y])
+                elif(type(data["blocks"][x][y]).__name__ == "FlagZone"):
+                    # One flag zone per team ?
+                    data["flagZones"][data["blocks"][x][y].team].append(data["blocks"][x][y])
 
-                    elif(type(data["blocks"][x][y]).__name__ == "Depot"):
-                        data["depots"][data["blocks"][x][y].team].append(data["blocks"][x][y]) 
+                elif(type(data["blocks"][x][y]).__name__ == "Depot"):
+                    data["depots"][data["blocks"][x][y].team].append(data["blocks"][x][y]) 
 
 
-            data["flags"] = [
-                Flag(1, data["flagZones"][1][0].x, data["flagZones"][1][0].y),
-                Flag(2, data["flagZones"][2][0].x, data["flagZones"][2][0].y)
-            ]
+        data["flags"] = [
+            Flag(1, data["flagZones"][1][0].x, data["flagZones"][1][0].y),
+            Flag(2, data["flagZones"][2][0].x, data["flagZones"][2][0].y)
+        ]
 
-            for obj in lines[data["blockHeight"] + mapDefinitionLines:]:
-                lineSplit = obj.replace("\n","").split(":")
-                gameObject = eval(lineSplit[0]+"("+lineSplit[1]+")")
-                if gameObject.category not in data["objects"].keys():
-                    data["objects"][gameObject.category] = [gameObject]
-                else:
-                    data["objects"][gameObject.category].append(gameObject)
-            
-            for flag in data["flags"]:
-                data["objects"]["Default"].append(flag)
+        for obj in lines[data["blockHeight"] + mapDefinitionLines:]:
+            lineSplit = obj.replace("\n","").split(":")
+            gameObject = eval(lineSplit[0]+"("+lineSplit[1]+")")
+            if gameObject.category not in data["objects"].keys():
+                data["objects"][gameObject.category] = [gameObject]
+            else:
+                data["objects"][gameObject.category].append(gameObject)
+        
+        for flag in data["flags"]:
+            data["objects"]["Default"].append(flag)
 
         return data
 
@@ -144,7 +164,7 @@ class RegularMap(Map):
         Returns:
             point (x,y): A point located in the spawn of a said team.
         """
-        return Map.GetRandomPositionInBlock(choice(self._spawns[team]), margin)
+        return Map.GetRandomPositionInBlock(self._random.choice(self._spawns[team]), margin, self._random)
 
 
     def GetRandomPositionInDepot(self, team, margin = 0):
@@ -155,7 +175,7 @@ class RegularMap(Map):
         Returns:
             point (x,y): A point located in the depot of a said team.
         """
-        return Map.GetRandomPositionInBlock(choice(self._depots[team]), margin)
+        return Map.GetRandomPositionInBlock(self._random.choice(self._depots[team]), margin, self._random)
 
 
     def IsObjectInTile(self, gameobject, block):
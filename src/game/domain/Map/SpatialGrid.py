@@ -0,0 +1,107 @@
+from math import ceil
+
+class SpatialGrid:
+    """
+    Keeps track of the cell each object is in, to find the objects around a point without going through all of them.
+
+    Objects added to the grid tell it when they move (see GameObject.move).
+
+    Attributes:
+        cellSize (int) : Side of a cell in real coordinates, usually the size of a block.
+    """
+
+    def __init__(self, cellSize):
+        self.cellSize = cellSize
+
+        self._cells = dict()
+        self._objectCells = dict()
+
+    def cellOf(self, x, y):
+        """
+        Returns:
+            cell (x,y) : The cell containing this point.
+        """
+        return (int(x // self.cellSize), int(y // self.cellSize))
+
+    def insert(self, gameObject):
+        """
+        Adds an object to the grid, which will then follow its moves.
+        """
+        cell = self.cellOf(gameObject.x, gameObject.y)
+
+        self._cells.setdefault(cell, []).append(gameObject)
+        self._objectCells[id(gameObject)] = cell
+
+        gameObject.grid = self
+
+    def remove(self, gameObject):
+        """
+        Removes an object from the grid.
+        """
+        cell = self._objectCells.pop(id(gameObject))
+
+        self._cells[cell].remove(gameObject)
+        if not self._cells[cell]:
+            del self._cells[cell]
+
+        gameObject.grid = None
+
+    def update(self, gameObject):
+        """
+        Moves an object to the cell of its current position, called whenever it moves.
+        """
+        cell = self.cellOf(gameObject.x, gameObject.y)
+        oldCell = self._objectCells[id(gameObject)]
+
+        if cell != oldCell:
+            self._cells[oldCell].remove(gameObject)
+            if not self._cells[oldCell]:
+                del self._cells[oldCell]
+
+            self._cells.setdefault(cell, []).append(gameObject)
+            self._objectCells[id(gameObject)] = cell
+
+    def queryRadius(self, x, y, radius):
+        """
+        Returns:
+            objects (list(GameObject)) : The objects at most radius away from (x, y).
+        """
+        (minX, minY) = self.cellOf(x - radius, y - radius)
+        (maxX, maxY) = self.cellOf(x + radius, y + radius)
+
+        squaredRadius = radius * radius
+        found = list()
+
+        for cellX in range(minX, maxX + 1):
+            for cellY in range(minY, maxY + 1):
+                for gameObject in self._cells.get((cellX, cellY), ()):
+                    if (gameObject.x - x) ** 2 + (gameObject.y - y) ** 2 <= squaredRadius:
+                        found.append(gameObject)
+
+        return found
+
+    def queryCells(self, cells, margin = 0):
+        """
+        Parameters:
+            cells (iterable((x,y))) : Cells to look into, for example the ones a ray goes through.
+            margin (int) : Also look into the cells around them, far enough to find every object at most margin away.
+
+        Returns:
+            objects (list(GameObject)) : The objects in these cells, a superset of the objects at most margin away
+                from them. Each object is listed once, in the order of the cells.
+        """
+        reach = ceil(margin / self.cellSize)
+
+        visited = set()
+        found = list()
+
+        for (cellX, cellY) in cells:
+            for nearX in range(cellX - reach, cellX + reach + 1):
+                for nearY in range(cellY - reach, cellY + reach + 1):
+                    if (nearX, nearY) in visited:
+                        continue
+
+                    visited.add((nearX, nearY))
+                    found.extend(self._cells.get((nearX, nearY), ()))
+
+        return found
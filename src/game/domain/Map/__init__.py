@@ -1,2 +1,3 @@
 from .Map import Map
-from .RegularMap import RegularMap
\ No newline at end of file
+from .RegularMap import RegularMap
+from .SpatialGrid import SpatialGrid
\ No newline at end of file
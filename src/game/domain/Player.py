@@ -19,10 +19,28 @@ class Player:
     If they are holding a flag, bots can drop it next to their current location for other to pick it up.
     """
 
+    DELTA_POLLING = False
+    """
+    Set to True to only get what changed since the previous polling data, see domain.PollingView.
+    """
+
     def __init__(self, map, rules, team):
         raise NotImplementedError
 
 
+    @classmethod
+    def prepare(cls, map):
+        """
+        Called once for each map before players of this class are created on it, when they are started by a
+        PlayerForkServer. Compute here what only depends on the map, and keep it for __init__ : it is computed once,
+        before the player processes are forked, and they all share it.
+
+        Parameters:
+            map : The map, as given to __init__.
+        """
+        pass
+
+
     def poll(self, pollingData):
         """
         This function will be called on each tick, use it to indicate your actions.
@@ -0,0 +1,50 @@
+class PollingView:
+    """
+    Rebuilds the whole polling data from delta polling data, on the player side.
+
+    A player setting DELTA_POLLING to True only gets what changed since its previous polling data (see
+    DeltaDictBuilder), which is faster to build and to send. Passing each polling data to update gives back the
+    polling data described in Player.poll, as if DELTA_POLLING was False. The seen objects of a bot may come in
+    another order.
+
+    Attributes:
+        bots (dict) : Fields of each bot, as last received.
+        seen (dict) : For each bot, the objects it sees by key.
+    """
+
+    def __init__(self):
+        self._bots = dict()
+        self._seen = dict()
+
+    def update(self, pollingData):
+        """
+        Applies polling data received by the player.
+
+        Parameters:
+            pollingData (dict) : The polling data given to Player.poll, delta or not.
+
+        Returns:
+            pollingData (dict) : The whole polling data.
+        """
+        if not pollingData.get("delta", False):
+            return pollingData
+
+        for (botId, changes) in pollingData["bots"].items():
+            bot = self._bots.setdefault(botId, dict())
+            seen = self._seen.setdefault(botId, dict())
+
+            for key in changes.get("seenLeave", ()):
+                del seen[key]
+
+            for (key, fields) in changes.get("seenUpdate", {}).items():
+                seen[key] = dict(seen[key], **fields)
+
+            seen.update(changes.get("seenEnter", {}))
+
+            bot.update((field, value) for (field, value) in changes.items() if not field.startswith("seen"))
+
+        return {
+            "bots": { botId: dict(bot, seen = list(self._seen[botId].values())) for (botId, bot) in self._bots.items() },
+            "events": pollingData["events"],
+            "missedTicks": pollingData["missedTicks"],
+        }
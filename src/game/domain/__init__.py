@@ -1 +1,4 @@
-from .Player import Player
\ No newline at end of file
+from .Player import Player
+from .PollingView import PollingView
+from .BinaryPolling import BinaryPolling
+from .BinaryResponse import BinaryResponse
\ No newline at end of file
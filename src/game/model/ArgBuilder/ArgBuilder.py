@@ -21,12 +21,14 @@ class ArgBuilder(metaclass=ABCMeta):
         ...
 
     @abstractmethod
-    def addBot(self, bot, seen):
+    def addBot(self, bot, botId, seen = ()):
         """
         Add a new bot to the argument.
 
         Parameters:
             bot (Bot): domain.Bot
+            botId (int): id of the bot in its team
+            seen (list(GameObject)): objects seen by the bot, see VisibilityMatrix
         """
         ...
 
@@ -0,0 +1,123 @@
+from model.ArgBuilder.ArgBuilder import ArgBuilder
+from service.Ruleset import Ruleset
+from domain.GameObject.Bot import Bot
+from domain.BinaryPolling import BinaryPolling
+
+class BinaryBuilder(ArgBuilder):
+    """
+    Builds polling data in a preallocated buffer, with the binary layout described in domain.BinaryPolling, which
+    reads it on the player side. Responses are written with domain.BinaryResponse.
+
+    The buffer is reused by every argument built : the result is only valid until the next call to beginArgument.
+
+    Attributes:
+        buffer (bytearray) : Where arguments are built, grown when an argument does not fit.
+        strings (dict) : Index of each bot identifier and type name written.
+    """
+
+    def __init__(self, capacity = 4096):
+        """
+        Parameters:
+            capacity (int) : Size of the buffer at first, in bytes.
+        """
+        self._buffer = bytearray(capacity)
+        self._strings = dict()
+        self._length = None
+
+    def getResult(self):
+        """
+        Return the argument built by this builder.
+
+        Return :
+            data (memoryview) : The argument, a view over the buffer of this builder.
+        """
+        if self._finished:
+            return memoryview(self._buffer)[:self._length]
+
+        raise Exception("Object was not completed !")
+
+
+    def beginArgument(self):
+        self._offset = BinaryPolling.HEADER.size
+        self._currentBotId = 0
+        self._flags = list()
+        self._missedTicks = 0
+
+        self._finished = False
+
+
+    def endArgument(self):
+        if self._currentBotId != int(Ruleset.GetRulesetValue("BotsCount")):
+            raise Exception("Argument doesn't contain 5 bots !")
+
+        # Flags may be added before the bots, they are written after them
+        self._reserve(self._offset + len(self._flags) * BinaryPolling.FLAG.size)
+
+        for (team, x, y) in self._flags:
+            BinaryPolling.FLAG.pack_into(self._buffer, self._offset, team, x, y)
+            self._offset += BinaryPolling.FLAG.size
+
+        stringsOffset = self._offset
+        names = [name.encode("utf-8") for name in self._strings]
+
+        self._reserve(self._offset + (len(names) + 1) * BinaryPolling.STRING.size + sum(len(name) for name in names))
+
+        BinaryPolling.STRING.pack_into(self._buffer, self._offset, len(names))
+        self._offset += BinaryPolling.STRING.size
+
+        for name in names:
+            BinaryPolling.STRING.pack_into(self._buffer, self._offset, len(name))
+            self._offset += BinaryPolling.STRING.size
+            self._buffer[self._offset : self._offset + len(name)] = name
+            self._offset += len(name)
+
+        BinaryPolling.HEADER.pack_into(self._buffer, 0, BinaryPolling.MAGIC, BinaryPolling.VERSION,
+            self._currentBotId, len(self._flags), stringsOffset, self._missedTicks)
+
+        self._length = self._offset
+        self._finished = True
+
+
+    def addBot(self, bot, botId, seen = ()):
+        if self._currentBotId >= int(Ruleset.GetRulesetValue("BotsCount")):
+            raise Exception("To many bots in this argument")
+
+        self._reserve(self._offset + BinaryPolling.BOT.size + len(seen) * BinaryPolling.SEEN.size)
+
+        BinaryPolling.BOT.pack_into(self._buffer, self._offset, self._stringIndex(str(botId)),
+            bot.x, bot.y, bot.angle, bot.speed, bot.health, bot.flag(), bot.getCooldown(), len(seen))
+        self._offset += BinaryPolling.BOT.size
+
+        for gameObject in seen:
+            typeIndex = self._stringIndex(type(gameObject).__name__)
+
+            if isinstance(gameObject, Bot):
+                BinaryPolling.SEEN.pack_into(self._buffer, self._offset, typeIndex, True, gameObject.x, gameObject.y,
+                    gameObject.angle, gameObject.speed, gameObject.health, gameObject.flag(), gameObject.getCooldown())
+            else:
+                BinaryPolling.SEEN.pack_into(self._buffer, self._offset, typeIndex, False, gameObject.x, gameObject.y,
+                    0, 0, 0, 0, 0)
+
+            self._offset += BinaryPolling.SEEN.size
+
+        self._currentBotId += 1
+
+
+    def addFlag(self, team, currentPosition):
+        self._flags.append((team, currentPosition[0], currentPosition[1]))
+
+
+    def addMissedTicks(self, missedTicks):
+        self._missedTicks = missedTicks
+
+
+    def _stringIndex(self, name):
+        return self._strings.setdefault(name, len(self._strings))
+
+
+    def _reserve(self, size):
+        # A new buffer rather than extending this one, results still viewed keep the old one
+        if len(self._buffer) < size:
+            buffer = bytearray(max(size, 2 * len(self._buffer)))
+            buffer[:len(self._buffer)] = self._buffer
+            self._buffer = buffer
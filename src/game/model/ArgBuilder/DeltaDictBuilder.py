@@ -0,0 +1,64 @@
+from model.ArgBuilder.DictBuilder import DictBuilder
+
+class DeltaDictBuilder(DictBuilder):
+    """
+    Builds polling data holding only what changed since the previous argument built, so one builder is needed per
+    team. The first argument holds everything. domain.PollingView rebuilds the polling data of DictBuilder from them.
+
+    The argument has the format of DictBuilder, with "delta" set to True. Bots whose fields and seen objects did not
+    change are left out, the others only have their fields that changed, and instead of "seen" :
+        "seenEnter" : { <key> : <object> } the objects the bot started seeing, formatted as in DictBuilder
+        "seenUpdate" : { <key> : { <field> : <value> } } the fields that changed of the objects it still sees
+        "seenLeave" : [ <key> ] the objects it stopped seeing
+    Each of them only when not empty. A key identifies the same object during the whole game.
+
+    Polling data must reach the player in order, none skipped : this builder can not be used with SharedPlayerProcess.
+    """
+
+    def __init__(self):
+        self._lastBots = dict()
+        self._lastSeen = dict()
+        self._keys = dict()
+
+    def beginArgument(self):
+        super().beginArgument()
+        self._dico["delta"] = True
+
+    def addBot(self, bot, botId, seen = ()):
+        super().addBot(bot, botId, ())
+
+        current = self._dico["bots"].pop(botId)
+        del current["seen"]
+
+        last = self._lastBots.get(botId, {})
+        changes = { field: value for (field, value) in current.items() if field not in last or last[field] != value }
+        self._lastBots[botId] = current
+
+        seenNow = { self._keyOf(gameObject): self._seenObject(gameObject) for gameObject in seen }
+        lastSeen = self._lastSeen.get(botId, {})
+        self._lastSeen[botId] = seenNow
+
+        enter = dict()
+        update = dict()
+
+        for (key, entry) in seenNow.items():
+            if key not in lastSeen:
+                enter[key] = entry
+            elif entry != lastSeen[key]:
+                update[key] = { field: value for (field, value) in entry.items() if lastSeen[key].get(field) != value }
+
+        leave = [key for key in lastSeen if key not in seenNow]
+
+        for (field, value) in (("seenEnter", enter), ("seenUpdate", update), ("seenLeave", leave)):
+            if value:
+                changes[field] = value
+
+        if changes:
+            self._dico["bots"][botId] = changes
+
+    def _keyOf(self, gameObject):
+        """
+        Returns:
+            key (int) : Identifier of gameObject in the arguments of this builder, the same during the whole game.
+        """
+        return self._keys.setdefault(id(gameObject), len(self._keys))
@@ -1,5 +1,6 @@
 from model.ArgBuilder.ArgBuilder import ArgBuilder
 from service.Ruleset import Ruleset
+from domain.GameObject.Bot import Bot
 
 class DictBuilder(ArgBuilder):
     
@@ -30,7 +31,7 @@ class DictBuilder(ArgBuilder):
         self._finished = True
 
 
-    def addBot(self, bot, botId, seen):
+    def addBot(self, bot, botId, seen = ()):
         if self._currentBotId >= int(Ruleset.GetRulesetValue("BotsCount")):
             raise Exception("To many bots in this argument")
         
@@ -39,11 +40,27 @@ class DictBuilder(ArgBuilder):
             "life": bot.health,
             "flag": bot.flag(),
             "cooldown": bot.getCooldown(), # TODO n'a pas trop de sens pour le moment
-            "seen": seen
+            "seen": [self._seenObject(gameObject) for gameObject in seen]
         }
         self._currentBotId += 1
 
 
+    def _seenObject(self, gameObject):
+        if isinstance(gameObject, Bot):
+            return {
+                "type": type(gameObject).__name__,
+                "currentPosition" : (gameObject.x, gameObject.y, gameObject.angle, gameObject.speed),
+                "life": gameObject.health,
+                "flag": gameObject.flag(),
+                "cooldown": gameObject.getCooldown(),
+            }
+
+        return {
+            "type": type(gameObject).__name__,
+            "currentPosition" : (gameObject.x, gameObject.y),
+        }
+
+
     def addFlag(self, team, currentPosition):
         if "flags" not in self._dico["events"].keys():
             self._dico["events"]["flags"] = list()
@@ -25,7 +25,7 @@ class JSONBuilder(ArgBuilder):
         self._dictBuilder.endArgument()
 
 
-    def addBot(self, bot, botId, seen):
+    def addBot(self, bot, botId, seen = ()):
         self._dictBuilder.addBot(bot, botId, seen)
 
 
@@ -1,3 +1,5 @@
 from .ArgBuilder import ArgBuilder
 from .DictBuilder import DictBuilder
-from .JSONBuilder import JSONBuilder
\ No newline at end of file
+from .JSONBuilder import JSONBuilder
+from .DeltaDictBuilder import DeltaDictBuilder
+from .BinaryBuilder import BinaryBuilder
\ No newline at end of file
@@ -0,0 +1,52 @@
+from model.PlayerProcess import PlayerProcess
+from multiprocessing import Pipe
+
+class ForkedPlayerProcess(PlayerProcess):
+    """
+    Same as PlayerProcess, but the process was forked by a PlayerForkServer, with the player already initialized in
+    it : responses are received the same way, only sending the polling data and stopping the process differ.
+
+    Attributes:
+        player (ForkedPlayer) : The process of the player, None if it failed to initialize.
+    """
+
+    def __init__(self, model, teamId, player):
+        self._player = player
+
+        if player is not None:
+            results = player.results
+        else:
+            # Like the pipe of a process that crashed : nothing ever comes through it
+            (results, resultSender) = Pipe(duplex = False)
+            resultSender.close()
+
+        self._initialize(model, teamId, results)
+
+    def execute(self):
+        """
+        Sends the data to the player process.
+        """
+        self._stopwatch.StartTimer()
+
+        if self._player is not None:
+            self._player.send(self._data)
+
+    def start(self):
+        """
+        The process started when the player was created.
+        """
+        pass
+
+    def join(self, timeout = None):
+        """
+        Waits until process termination.
+        """
+        if self._player is not None:
+            self._player.join(timeout)
+
+    def kill(self):
+        """
+        Kills the process hosting the player. Should only be called once the game is over.
+        """
+        if self._player is not None:
+            self._player.kill()
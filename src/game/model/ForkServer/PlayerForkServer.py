@@ -0,0 +1,292 @@
+from model.PlayerProcess import pollPlayer
+from domain.Map.RegularMap import RegularMap
+from multiprocessing import Pipe, get_context, reduction
+from multiprocessing.connection import Connection
+from queue import Queue
+import configparser
+import gc
+import importlib
+import os
+import random
+import select
+import signal
+import sys
+import threading
+import traceback
+
+class PlayerForkServer:
+    """
+    A process that imports the players and prepares the maps once (see Player.prepare), then forks a process for each
+    player of each game, initialized in it. Starting a player then only costs a fork of a process where everything is
+    already loaded, whatever the start method of multiprocessing.
+
+    What is loaded before forking is frozen (gc.freeze) : the garbage collector of the player processes never writes
+    in it, so that its memory stays shared between them, copy-on-write.
+
+    Each player comes with a pidfd of its process (Linux 5.3 or later), opened by the server before the process can be
+    reaped : the player is watched and killed through it, never through a pid that may have been given to another
+    process since.
+
+    Attributes:
+        modules (list(string)) : Players imported when the server starts, like ai.playerTest.myPlayer. Others are
+            imported when first asked for.
+        mapFiles (list(string)) : Maps loaded and prepared for these players when the server starts. Others are loaded
+            when first asked for, and kept.
+        process (Process) : The server.
+        requests (Connection) : Where players are asked for, see createPlayer.
+    """
+
+    def __init__(self, modules = (), mapFiles = ()):
+        self.modules = list(modules)
+        self.mapFiles = list(mapFiles)
+
+        (self._requests, serverRequests) = Pipe()
+
+        # Forked, so that the server starts with everything this process already imported
+        self.process = get_context("fork").Process(target = runForkServer, args = (serverRequests, self._requests, self.modules, self.mapFiles), daemon = True)
+        self.process.start()
+
+        serverRequests.close()
+
+    def createPlayer(self, Player, mapFile, ruleset, team, seed = None):
+        """
+        Forks a process for a player and waits for its initialization.
+
+        Parameters:
+            Player (class) : The class of the player, importable by the server.
+            mapFile (string) : The map, loaded by the server.
+            ruleset (Ruleset) : The rules of the game, as given to Player.
+            team (int) : The team of the player.
+            seed (any) : Seed of the random module for this player, so that seeded games are reproducible.
+
+        Returns:
+            player (ForkedPlayer) : Handle of the player process, None if its initialization failed.
+        """
+        (dataReceiver, dataSender) = Pipe(duplex = False)
+        (results, resultSender) = Pipe(duplex = False)
+
+        self._requests.send((Player, mapFile, dict(ruleset), team, seed))
+        reduction.send_handle(self._requests, dataReceiver.fileno(), self.process.pid)
+        reduction.send_handle(self._requests, resultSender.fileno(), self.process.pid)
+
+        # The player process has its own ends of the pipes
+        dataReceiver.close()
+        resultSender.close()
+
+        pid = self._requests.recv()
+        player = ForkedPlayer(pid, reduction.recv_handle(self._requests), dataSender, results)
+
+        try:
+            initialized = results.recv()
+        except EOFError:
+            initialized = False
+
+        if not initialized:
+            player.kill()
+            player.join()
+            return None
+
+        return player
+
+    def close(self):
+        """
+        Stops the server, the players it forked keep playing until their game is over.
+        """
+        self._requests.close()
+        self.process.join()
+
+class ForkedPlayer:
+    """
+    Handle of a player process forked by a PlayerForkServer.
+
+    Polling data is sent from a thread, like a multiprocessing Queue does, so that a player slow to read it does not
+    block the game.
+
+    Attributes:
+        pid (int) : The process of the player, only to be displayed : it may belong to another process once the player
+            is gone.
+        pidfd (int) : File descriptor of the process of the player, readable once it is gone.
+        results (Connection) : Where the player sends its responses, with the CPU time spent on each.
+        outgoing (Queue) : Polling data not sent yet.
+    """
+
+    _STOP = object()
+
+    def __init__(self, pid, pidfd, data, results):
+        self.pid = pid
+        self.pidfd = pidfd
+        self.results = results
+
+        self._data = data
+        self._outgoing = Queue()
+
+        self._feeder = threading.Thread(target = self._feed, daemon = True)
+        self._feeder.start()
+
+    def send(self, pollingData):
+        """
+        Sends polling data to the player, without waiting for it to be read.
+        """
+        self._outgoing.put(pollingData)
+
+    def _feed(self):
+        while True:
+            pollingData = self._outgoing.get()
+
+            if pollingData is ForkedPlayer._STOP:
+                break
+
+            try:
+                self._data.send(pollingData)
+            except OSError:
+                # The player is gone
+                break
+
+        self._data.close()
+
+    def alive(self):
+        """
+        Returns:
+            alive (bool) : Whether the process of the player still runs.
+        """
+        return self.pidfd >= 0 and not self._exited(0)
+
+    def kill(self):
+        if self.pidfd >= 0:
+            try:
+                signal.pidfd_send_signal(self.pidfd, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+        self._outgoing.put(ForkedPlayer._STOP)
+
+    def join(self, timeout = None):
+        """
+        Waits until the process of the player is gone, it is not a child of this process to wait for.
+        """
+        if self.pidfd < 0 or not self._exited(timeout):
+            return
+
+        # Nobody reads polling data anymore
+        self._outgoing.put(ForkedPlayer._STOP)
+        self._feeder.join()
+        self.results.close()
+
+        os.close(self.pidfd)
+        self.pidfd = -1
+
+    def _exited(self, timeout):
+        """
+        Returns:
+            exited (bool) : Whether the process of the player exited within timeout seconds, None to wait until then.
+        """
+        return bool(select.select([self.pidfd], [], [], timeout)[0])
+
+def runForkServer(requests, clientRequests, modules, mapFiles):
+    """
+    Prepares the maps for the players, then forks a process for each player asked for, until the requests are closed.
+    """
+    # Only the game keeps its end, for the server to know when it is gone
+    clientRequests.close()
+
+    Players = [importlib.import_module(module).myPlayer for module in modules]
+
+    maps = dict()
+    prepared = set()
+
+    def prepare(Player, mapFile):
+        if mapFile not in maps:
+            maps[mapFile] = RegularMap.loadMapData(mapFile)
+
+        if (Player, mapFile) not in prepared:
+            Player.prepare(maps[mapFile])
+            prepared.add((Player, mapFile))
+
+    for mapFile in mapFiles:
+        for Player in Players:
+            prepare(Player, mapFile)
+
+    # The player processes exit on their own, they are reaped as soon as they do
+    signal.signal(signal.SIGCHLD, reapPlayers)
+
+    while True:
+        try:
+            (Player, mapFile, rules, team, seed) = requests.recv()
+        except EOFError:
+            break
+
+        dataReceiver = Connection(reduction.recv_handle(requests), writable = False)
+        resultSender = Connection(reduction.recv_handle(requests), readable = False)
+
+        prepare(Player, mapFile)
+
+        # Everything loaded so far is left alone by the collector, so that its pages are never copied
+        gc.collect()
+        gc.freeze()
+
+        # Not reaped before its pidfd is opened, so that the pidfd can only be of this process
+        signal.pthread_sigmask(signal.SIG_BLOCK, { signal.SIGCHLD })
+
+        pid = os.fork()
+
+        if pid == 0:
+            requests.close()
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, { signal.SIGCHLD })
+
+            status = runForkedPlayer(dataReceiver, resultSender, Player, maps[mapFile], rules, team, seed)
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(status)
+
+        pidfd = os.pidfd_open(pid)
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, { signal.SIGCHLD })
+
+        dataReceiver.close()
+        resultSender.close()
+
+        requests.send(pid)
+        reduction.send_handle(requests, pidfd, os.getppid())
+        os.close(pidfd)
+
+def reapPlayers(signum, frame):
+    """
+    Reaps the player processes that exited, the game watches them through their pidfd.
+    """
+    try:
+        while os.waitpid(-1, os.WNOHANG)[0] > 0:
+            pass
+    except ChildProcessError:
+        pass
+
+def runForkedPlayer(dataReceiver, resultSender, Player, mapData, rules, team, seed):
+    """
+    Creates a player the way the game does, then answers its polling data until the game is over.
+
+    Returns:
+        status (int) : Exit status of the process.
+    """
+    # Players get a section of a parser, like the game gives them
+    parser = configparser.ConfigParser()
+    parser.read_dict({ "Ruleset": rules })
+
+    random.seed(seed)
+
+    try:
+        player = Player(mapData, parser["Ruleset"], team = team)
+    except:
+        traceback.print_exc()
+        resultSender.send(False)
+        return 1
+
+    resultSender.send(True)
+
+    try:
+        pollPlayer(dataReceiver.recv, resultSender, player)
+    except (EOFError, BrokenPipeError):
+        # The game is over
+        return 0
+    except:
+        traceback.print_exc()
+        return 1
@@ -0,0 +1,2 @@
+from .PlayerForkServer import PlayerForkServer, ForkedPlayer
+from .ForkedPlayerProcess import ForkedPlayerProcess
\ No newline at end of file
@@ -1,18 +1,30 @@
 from model.Model import Model
 from model.PhysicsEngine import PhysicsEngine
 from model.PlayerProcess import PlayerProcess
+from model.SharedMemory import PollingLayout, SharedPlayerProcess
+from model.PlayerPool import PooledPlayerProcess
+from model.Network import SocketPlayerProcess
+from model.ForkServer import ForkedPlayerProcess
+from model.ResponseDecoder import ResponseDecoder
+from model.VisibilityTable import VisibilityTable
 from model.ArgBuilder.JSONBuilder import JSONBuilder
 from model.ArgBuilder.DictBuilder import DictBuilder
+from model.ArgBuilder.DeltaDictBuilder import DeltaDictBuilder
+from model.Replay.RecordingTimeManager import RecordingTimeManager
 from service.Ruleset import Ruleset
 from service.Physics import Physics
 from service.Config import Config
 from service.TimeManager import TimeManager
+from service.Metrics import Metrics
+from service.VirtualTimeManager import VirtualTimeManager
 from domain.Map import *
 from domain.GameObject.Bot import *
 from domain.Player import Player
 from copy import deepcopy
+from queue import Empty
+from random import randrange
 
-import sys, math
+import sys, math, time, multiprocessing.connection
 class GameModel(Model):
     """
     Implements the Game Model.
@@ -24,29 +36,50 @@ class GameModel(Model):
         teams (dict) : Contains player informations to be sent to them.
 
         countdownremaining (int) : time in milliseconds since end of start countdownremaining.
+        clock (VirtualClock) : The clock of a headless game, None when the game follows the real time.
+        seed (int) : Seed of every random choice made by the game, so that it can be played again.
+        recorders (list(Recorder)) : Objects following the game as it is played.
+        replay (ReplayReader) : The recorded game played again instead of polling players, if any.
+        pool (PlayerPool) : The workers hosting the players, None when each player has a process of its own.
+        metrics (Metrics) : Measures of the players and of the ticks.
+        server (PlayerServer) : Where remote players connect, None when the players are run by the game.
+        forkServer (PlayerForkServer) : Forks the processes of the players, None when the game starts them.
     """
 
-    def __init__(self, Player1, Player2, map_file = './maps/map_01.txt'):
+    def __init__(self, Player1, Player2, map_file = './maps/map_01.txt', clock = None, seed = None, recorders = None, replay = None, pool = None, metrics = None, server = None, forkServer = None):
         """
         Initialize game data.
   
         Parameters: 
            Player1 (Player): The player in control of the Red team.
            Player2 (Player): The player in control of the Blue team.
+           map_file (string): The map to play on.
+           clock (VirtualClock): When given, the game runs headless on this clock instead of the real time.
+           seed (int): Seed of the game, a random one when None.
+           recorders (list(Recorder)): Objects following the game as it is played.
+           replay (ReplayReader): Replays a recorded game, Player1 and Player2 are then ignored.
+           pool (PlayerPool): Hosts the players in its workers instead of starting a process for each of them.
+           metrics (Metrics): Where the game adds its measures, new ones following the Config when None.
+           server (PlayerServer): Players connect to it instead of being run by the game, Player1 and Player2 are then
+               ignored.
+           forkServer (PlayerForkServer): Creates the players in processes it forks, from the maps it already prepared.
         """
         mapData = RegularMap.loadMapData(map_file)
 
+        self._mapFile = map_file
+
+        # Always known, even when picked randomly, so that any game can be reproduced
+        self.seed = seed if seed is not None else randrange(2 ** 32)
+
         # Generate an empty map and send it to the players
         # The bots starting positions will be sent at the first polling
-        self._map = RegularMap(mapData)
+        self._map = RegularMap(mapData, self.seed)
 
         self._ruleset = Ruleset.GetRuleset()
 
         self._engine = PhysicsEngine(self._ruleset, self._map)
 
-        self._engine.createCollisionMap("RegularBot", 36)
-
-        self._argBuilder = DictBuilder()
+        self._argBuilders = dict()
 
         self._players = dict()
 
@@ -54,7 +87,35 @@ class GameModel(Model):
 
         self.turn = 0
 
-        self.stopwatch = TimeManager()
+        self._clock = clock
+        self._replay = replay
+        self._pool = pool
+        self._headless = clock is not None or replay is not None
+
+        self._metrics = metrics if metrics is not None else Metrics.FromConfig()
+        self._answered = set() # players that answered the last polling in time
+        self._budgetMs = None # think time of the last polling, None during the countdown
+
+        # Measures of a player add up over the games it plays
+        self._playerNames = {
+            "1": getattr(Player1, "__module__", "1") if replay is None else "1",
+            "2": getattr(Player2, "__module__", "2") if replay is None else "2",
+        }
+
+        if replay is not None:
+            self.stopwatch = replay.createTimeManager()
+        elif clock is not None:
+            self.stopwatch = VirtualTimeManager(clock)
+        else:
+            self.stopwatch = TimeManager()
+
+        self._recorders = list(recorders) if recorders else list()
+
+        if self._recorders:
+            self.stopwatch = RecordingTimeManager(self.stopwatch, self._recorders)
+
+            for recorder in self._recorders:
+                recorder.beginGame(self)
         
         self.countdownremaining = self._ruleset["StartCountdownSeconds"] * 1000
 
@@ -65,29 +126,73 @@ class GameModel(Model):
         self.mouse_coords = (0,0)
 
         self.shoots = [] # all shoots to display, reset each turn.
+        self.visibility = None # what each bot saw at the last polling
         self.to_exec = [] # functions to execute at some ms
 
         #### Implementation Simu ####
-        try:
-            self._players["1"] = Player1(mapData, self._ruleset, team=1)
-        except:
-            print("Player 1 can't be evaluated because it failed to initialize")
-
-        try:
-            self._players["2"] = Player2(mapData, self._ruleset, team=2)
-        except:
-            print("Player 2 can't be evaluated because it failed to initialize")
+        if replay is not None:
+            # Responses come from the replay, there is nobody to initialize
+            self._players = { "1": None, "2": None }
+        elif server is not None:
+            # Remote players get the teams in the order they connect, the first one plays Red
+            while len(self._players) < 2:
+                player = server.accept(Config.PlayerConnectTimeoutSeconds())
+
+                if player is None:
+                    break
+
+                if self.register(player) is None:
+                    print("Remote player {} failed to initialize".format(player.name))
+
+            for teamId in ("1", "2"):
+                if teamId in self._players:
+                    self._playerNames[teamId] = self._players[teamId].name or teamId
+                else:
+                    print("Player {} can't be evaluated because nobody connected in time".format(teamId))
+        elif pool is not None:
+            # Players are initialized in the workers of the pool, which outlive the game
+            matchId = pool.newMatch()
+
+            for (teamId, Player) in (("1", Player1), ("2", Player2)):
+                player = pool.createPlayer(matchId, teamId, Player, mapData, self._ruleset, "{}_{}".format(self.seed, teamId))
+
+                if player is None:
+                    print("Player {} can't be evaluated because it failed to initialize".format(teamId))
+                else:
+                    self._players[teamId] = player
+        elif forkServer is not None:
+            # Players are initialized in their processes, forked from a server that already loaded everything
+            for (teamId, Player) in (("1", Player1), ("2", Player2)):
+                player = forkServer.createPlayer(Player, map_file, self._ruleset, int(teamId), "{}_{}".format(self.seed, teamId))
+
+                if player is None:
+                    print("Player {} can't be evaluated because it failed to initialize".format(teamId))
+                else:
+                    self._players[teamId] = player
+        else:
+            try:
+                self._players["1"] = Player1(mapData, self._ruleset, team=1)
+            except:
+                print("Player 1 can't be evaluated because it failed to initialize")
+
+            try:
+                self._players["2"] = Player2(mapData, self._ruleset, team=2)
+            except:
+                print("Player 2 can't be evaluated because it failed to initialize")
         ####
 
         self._teams = dict()
+        self._decoders = dict()
         self._teamFails = dict()
         self._teamMissedTicks = dict()
+        self._teamTotalMissedTicks = dict()
 
         for team in range(1,3): # 2 Players
             teamId = str(team)
 
             self._teamFails[teamId] = 0 # Keep track of each failure to respond from players
             self._teamMissedTicks[teamId] = 0
+            self._teamTotalMissedTicks[teamId] = 0
 
             self._teams[teamId] = { "bots": {} }
 
@@ -98,18 +203,61 @@ class GameModel(Model):
                 self._teams[teamId]["bots"][botId] = RegularBot(team, x, y)
                 self._teams[teamId]["bots"][botId].setCooldown(self.stopwatch.GetTimeMs())
 
+                self._map.grid.insert(self._teams[teamId]["bots"][botId])
+
+            self._decoders[teamId] = ResponseDecoder(self._teams[teamId]["bots"].keys())
             
-            self._playerProcesses[teamId] = PlayerProcess(self, teamId, self._players[teamId])
+            if replay is not None:
+                self._playerProcesses[teamId] = replay.createPlayerProcess(self, teamId)
+            elif pool is not None:
+                self._playerProcesses[teamId] = PooledPlayerProcess(self, teamId, self._players.get(teamId))
+            elif server is not None:
+                self._playerProcesses[teamId] = SocketPlayerProcess(self, teamId, self._players.get(teamId))
+            elif forkServer is not None:
+                self._playerProcesses[teamId] = ForkedPlayerProcess(self, teamId, self._players.get(teamId))
+            elif Config.PlayerTransport() == "SharedMemory":
+                self._playerProcesses[teamId] = SharedPlayerProcess(self, teamId, self._players.get(teamId),
+                    self.createPollingLayout(teamId), "{}_{}".format(self.seed, teamId))
+            else:
+                self._playerProcesses[teamId] = PlayerProcess(self, teamId, self._players.get(teamId), "{}_{}".format(self.seed, teamId))
             self._playerProcesses[teamId].start()
 
+            # Delta polling data needs every polling data to reach the player, which shared memory does not ensure
+            Player = Player1 if team == 1 else Player2
+            deltaPolling = getattr(Player, "DELTA_POLLING", False) and not isinstance(self._playerProcesses[teamId], SharedPlayerProcess)
+
+            self._argBuilders[teamId] = DeltaDictBuilder() if deltaPolling else DictBuilder()
+
+        # Far enough for the bots that see the furthest, kept between games
+        viewDistance = max((bot.viewDistance for team in self._teams.values() for bot in team["bots"].values()), default = 0)
+        self._engine.createVisibilityTable(viewDistance, VisibilityTable.CachePath(map_file))
+
         self._lastFlagPosition = [
             (-1, -1),
             (-1, -1)
         ]
 
+    def createPollingLayout(self, teamId):
+        """
+        Returns:
+            layout (PollingLayout) : Room for everything the bots of a team can see, for SharedPlayerProcess.
+        """
+        botsCount = int(self._ruleset["BotsCount"])
+        objects = [gameObject for category in self._map.objects.values() for gameObject in category]
+
+        typeNames = sorted({ type(gameObject).__name__ for gameObject in objects } | { RegularBot.__name__ })
+
+        return PollingLayout(self._teams[teamId]["bots"].keys(), typeNames, 2 * botsCount + len(objects), len(self._map.flags))
+
     def getEngine(self):
         return self._engine
 
+    def getRuleset(self):
+        return self._ruleset
+
+    def getMapFile(self):
+        return self._mapFile
+
     def tick(self, deltaTime):
         """ 
         Update and handle the game data. Poll each player and process their actions.
@@ -124,7 +272,11 @@ class GameModel(Model):
         if self.game_over:
             return
 
-        self.handleEvents()
+        for recorder in self._recorders:
+            recorder.beginTick(deltaTime)
+
+        with self._metrics.time("events"):
+            self.handleEvents()
 
         if self.turn >= 0 and self.turn != 1 :
             # Called before the start of the countdown and each turn after (not including) the first turn
@@ -133,7 +285,8 @@ class GameModel(Model):
 
         if self.turn > 0:
             # Call each turn to handle physics and player response
-            self.handleNormalTurn()
+            with self._metrics.time("physics"):
+                self.handleNormalTurn()
 
         # In this condition, we wemove ThinkTimeMs because it is already slept during player polling
         elif self.stopwatch.PeekDeltaTimeMs() > int(self._ruleset["StartCountdownSeconds"]) * 1000 - int(self._ruleset["ThinkTimeMs"]):
@@ -144,7 +297,8 @@ class GameModel(Model):
             # Call each time during countdown after the first player polling
             self.handleStartingCountdown()
 
-        self.checkItemsPickup()
+        with self._metrics.time("pickup"):
+            self.checkItemsPickup()
 
         flagInDepot = self._map.FlagInDepot()
 
@@ -153,6 +307,26 @@ class GameModel(Model):
             self.countdownremaining = 0
             self.winner = flagInDepot
 
+        elif self.isTimeUp():
+            # Nobody captured a flag in time, this is a draw
+            self.game_over = True
+
+        for recorder in self._recorders:
+            recorder.endTick(self)
+
+        self._metrics.tick()
+
+    def isTimeUp(self):
+        """
+        Checks whether the game lasted for MaxDurationSeconds after the countdown. A value of 0 means no limit.
+        """
+        maxDurationMs = int(self._ruleset["MaxDurationSeconds"]) * 1000
+
+        if maxDurationMs <= 0 or self.turn <= 0:
+            return False
+
+        return self.stopwatch.PeekDeltaTimeMs() >= int(self._ruleset["StartCountdownSeconds"]) * 1000 + maxDurationMs
+
     def handlePlayerPolling(self):
         """
         Creates and starts each Player Process which will process the player's polling function.
@@ -170,12 +344,24 @@ class GameModel(Model):
             "2" : None,
         }
 
+        # Everything seen this tick, for both teams at once
+        with self._metrics.time("visibility"):
+            bots = list(self.getAllBots().values())
+            self.visibility = self._engine.computeVisibility(
+                bots, bots + [gameObject for category in self._map.objects.values() for gameObject in category]
+            )
+
+        pollingStart = time.perf_counter()
+        serializationMs = dict()
+
         # Send polling data to each player and get their response
         for teamId in self._players.keys():
             player = self._players[teamId]
+            start = time.perf_counter()
 
             # Start to build the pollindData
-            self._argBuilder.beginArgument()
+            argBuilder = self._argBuilders[teamId]
+            argBuilder.beginArgument()
 
             for i in range(2):
                 oldFlagX, oldFlagY = self._lastFlagPosition[i]
@@ -185,90 +371,162 @@ class GameModel(Model):
 
 
                 if flagX != oldFlagX or flagY != oldFlagY:
-                    self._argBuilder.addFlag(self._map.flags[i].team, (flagX, flagY))
+                    argBuilder.addFlag(self._map.flags[i].team, (flagX, flagY))
 
             for botId in self._teams[teamId]["bots"].keys():
-                seen = []
                 bot = self._teams[teamId]["bots"][botId]
-                for enemy in self._teams[str(1 if teamId == 2 else 1)]["bots"].values():
-                    
-                    if self._engine.sees(bot,enemy):
-                        seen.append({ 
-                            "type": type(enemy).__name__,
-                            "currentPosition" : (enemy.x, enemy.y, enemy.angle, enemy.speed),
-                            "life": enemy.health,
-                            "flag": enemy.flag(),
-                            "cooldown": enemy.getCooldown(),
-                            })
-                for categ in self._map.objects.values():
-                    for obj in categ:
-                        if self._engine.sees(bot,obj):
-                            seen.append({
-                            "type": type(obj).__name__,
-                            "currentPosition" : (obj.x, obj.y),
-                            })
-                
-                self._argBuilder.addBot(self._teams[teamId]["bots"][botId], botId, seen)
 
-            self._argBuilder.addMissedTicks(self._teamMissedTicks[teamId])
-            self._argBuilder.endArgument()
+                # Enemies and map objects, allies are known anyway
+                seen = [
+                    gameObject for gameObject in self.visibility.seenBy(bot)
+                    if not isinstance(gameObject, Bot) or gameObject.player != bot.player
+                ]
+
+                argBuilder.addBot(bot, botId, seen)
 
-            pollingData = self._argBuilder.getResult()
+            argBuilder.addMissedTicks(self._teamMissedTicks[teamId])
+            argBuilder.endArgument()
+
+            pollingData = argBuilder.getResult()
 
             self._playerProcesses[teamId].setData(pollingData)
-            
-        # Start each player's computation and sleep while they should be processing
-        # After we are done sleeping, two things can occur:
+            serializationMs[teamId] = (time.perf_counter() - start) * 1000
+
+        # Start each player's computation and wait while they should be processing, or until they all answered
+        # After we are done waiting, two things can occur:
         #   1 - If we are in countdown phase : Players will be able to compute for the duration of the countdown
         #   2 - Else : Players will be immediatly checked and killed. If they did not finish, their (individual) turn is invalid; not affecting other players.
-        for playerProcess in self._playerProcesses.values():
+        for (teamId, playerProcess) in self._playerProcesses.items():
+            start = time.perf_counter()
             playerProcess.execute()
 
-        # The entire computation of a player must be done during this sleep (if not in countdown phase)
-        TimeManager.Sleep(int(self._ruleset["ThinkTimeMs"]))
+            self._metrics.recordSerialization(self._playerNames[teamId],
+                serializationMs.get(teamId, 0) + (time.perf_counter() - start) * 1000)
+
+        self._metrics.recordPhase("polling", (time.perf_counter() - pollingStart) * 1000)
+
+        thinkTimeMs = int(self._ruleset["ThinkTimeMs"])
+        waitMs = thinkTimeMs
+
+        self._budgetMs = thinkTimeMs if self.turn != -1 else None
+
+        if self.turn == -1 and self._headless:
+            # Headless players get the whole countdown at once, there is nothing to display meanwhile
+            thinkTimeMs = waitMs = int(self._ruleset["StartCountdownSeconds"]) * 1000
+        elif self.isCpuBudget():
+            # The think time is checked on the CPU time of each response, see checkPlayers
+            # Waiting is only capped for players that hang, or computing on a busy host
+            waitMs = max(int(self._ruleset["ThinkWallCapMs"]), thinkTimeMs)
+
+        # The entire computation of a player must be done during this time (if not in countdown phase)
+        with self._metrics.time("wait"):
+            self.waitForPlayers(thinkTimeMs, waitMs)
+
+    def isCpuBudget(self):
+        """
+        Returns:
+            cpu (bool) : Whether ThinkTimeMs is measured on the CPU time of the players rather than on the wall clock.
+        """
+        return int(self._ruleset["ThinkTimeCpu"]) != 0
+
+    def waitForPlayers(self, budgetMs, capMs = None):
+        """
+        Gives players budgetMs milliseconds to compute their response, and returns as soon as every player answered.
+
+        Players whose responses come through a connection (see PlayerProcess.waitable) are waited for at once, the
+        others one after the other. On a virtual clock, the game time is then advanced by budgetMs whenever the
+        players answered, so that a game plays the same however fast they are.
+
+        Parameters:
+            budgetMs (int) : The think time of the players.
+            capMs (int) : How long to wait on the wall clock, budgetMs by default.
+        """
+        if capMs is None:
+            capMs = budgetMs
+
+        deadline = TimeManager()
+        deadline.StartTimer()
+
+        waiting = dict()
+        self._answered = set()
+
+        for (teamId, playerProcess) in self._playerProcesses.items():
+            connection = playerProcess.waitable()
+
+            if connection is None:
+                continue
+
+            if playerProcess.wait(0):
+                self._answered.add(teamId)
+            else:
+                waiting[connection] = teamId
+
+        while waiting:
+            remainingMs = capMs - deadline.PeekDeltaTimeMs()
+
+            if remainingMs <= 0:
+                break
+
+            # A connection is also ready when its process died, it will not answer anyway
+            for connection in multiprocessing.connection.wait(list(waiting.keys()), remainingMs / 1000):
+                teamId = waiting.pop(connection)
+
+                if self._playerProcesses[teamId].wait(0):
+                    self._answered.add(teamId)
+
+        for (teamId, playerProcess) in self._playerProcesses.items():
+            if playerProcess.waitable() is None and playerProcess.wait(capMs - deadline.PeekDeltaTimeMs()):
+                self._answered.add(teamId)
+
+        if self._headless:
+            self.stopwatch.Sleep(budgetMs)
 
     def handleNormalTurn(self):
         """
         This stops players computing and processes their response
         """
 
-        # This occurs right after sleeping during ThinkTimeMs milliseconds
-        for playerProcess in self._playerProcesses.values():
-            playerProcess.check()
+        # This occurs right after waiting for the players, at most ThinkTimeMs milliseconds
+        self.checkPlayers()
                 
         self.turn += 1
 
         # reset shoots
         self.shoots = []
 
-        # Interpret players orders
+        # Check and decode every response before anything moves
         for teamId in self.teamsData.keys():
             if(self.teamsData[teamId] == None):
                 print("At {}ms (turn {}) : Did not get a response from player {}".format(self.stopwatch.PeekDeltaTimeMs(),self.turn,teamId))
+                self._metrics.recordMiss(self._playerNames[teamId])
                 self._teamFails[teamId] += 1
                 self._teamMissedTicks[teamId] += 1
-                continue
-            elif self.teamsData[teamId] == {}:
-                # Empty response, player pass turn
-                continue
-            else:
+                self._teamTotalMissedTicks[teamId] += 1
+            elif self.teamsData[teamId] != {}:
+                # An empty response is the player passing its turn
                 self._teamMissedTicks[teamId] = 0
 
-            # try:
-            data = self.teamsData[teamId]
-            for botId in data["bots"].keys():
-                bot = self._teams[teamId]["bots"][botId]
+            rejected = self._decoders[teamId].decode(self.teamsData[teamId])
+
+            if rejected:
+                print("At {}ms (turn {}) : Invalid response from player {} ({} entries rejected)".format(self.stopwatch.PeekDeltaTimeMs(),self.turn,teamId,rejected))
+                self._metrics.recordInvalid(self._playerNames[teamId], rejected)
+                self._teamFails[teamId] += 1
+
+        # Interpret players orders
+        for teamId in self.teamsData.keys():
+            decoder = self._decoders[teamId]
+
+            for row in decoder.rows:
+                bot = self._teams[teamId]["bots"][decoder.botIds[row]]
 
                 # Needed for shoot
                 bot_old_x = bot.x
                 bot_old_y = bot.y
                 bot_old_angle = bot.angle
 
-                # Unpack target
-                targetX = data["bots"][botId]["targetPosition"][0]
-                targetY = data["bots"][botId]["targetPosition"][1]
-                targetSpeed = data["bots"][botId]["targetPosition"][2]
-                
+                (targetX, targetY, targetSpeed, actions) = decoder.order(row)
+
                 # Perform checks                    
                 bot.angle = self._engine.checkAngle(bot, targetX, targetY)
                 bot.speed = self._engine.checkSpeed(bot, targetSpeed)
@@ -277,25 +535,22 @@ class GameModel(Model):
 
                 # Apply movement
                 (realX, realY) = Physics.applyMovement(bot.x, bot.y, bot.angle, bot.speed)
-                (newX,newY) = self._engine.checkCollision("RegularBot",bot.x,bot.y,realX,realY,targetX,targetY)
+                (newX,newY) = self._engine.checkCollision(bot.x, bot.y, realX, realY, bot.radius, targetX, targetY,
+                    int(self._ruleset["WallSliding"]) != 0)
 
                 bot.move(newX - bot.x, newY - bot.y)
 
-
-                # bitwise comparison for actions
-                actions = bin(data["bots"][botId]["actions"])
-                actions = actions[::-1] # Reverse action
-
-                if int(actions[0]) == 1: # SHOOT
-                    if self.stopwatch.GetTimeMs() - self._teams[teamId]["bots"][botId].getCooldown() > int(self._ruleset["BotShootCooldown"]):
-                        self._teams[teamId]["bots"][botId].setCooldown(self.stopwatch.GetTimeMs())
+                if actions & Player.SHOOT:
+                    if self.stopwatch.GetTimeMs() - bot.getCooldown() > int(self._ruleset["BotShootCooldown"]):
+                        bot.setCooldown(self.stopwatch.GetTimeMs())
 
                         (shootedBot, (end_x, end_y)) = self._engine.getShootedBot(
                             bot_old_x,
                             bot_old_y,
                             bot_old_angle,
                             10000,
-                            self.getBots(1 if int(teamId) == 2 else 2).values()
+                            [enemy for enemy in self._engine.getObjectsAlongShoot(bot_old_x, bot_old_y, bot_old_angle, 10000, bot.radius)
+                                if isinstance(enemy, Bot) and enemy.player != bot.player]
                         )
 
                         # if (shootedBot != None):
@@ -303,11 +558,8 @@ class GameModel(Model):
 
                         self.shoots.append(((bot_old_x, bot_old_y), (end_x, end_y), bot.player))
 
-                if actions[1]: # DROP_FLAG
+                if actions & Player.DROP_FLAG:
                     pass
-            # except:
-            #     print("Invalid response from player {} : {}".format(teamId,sys.exc_info()[0]))
-            #     self._teamFails[teamId] += 1
 
         for teamId in self._teamFails.keys():
             if self._teamFails[teamId] >= Config.InvalidResponsesKick():
@@ -315,6 +567,33 @@ class GameModel(Model):
                 self.kick(teamId)
                 self._teamFails[teamId] = -1
 
+    def checkPlayers(self):
+        """
+        Checks each player for a response, placed in teamsData.
+        """
+        for (teamId, playerProcess) in self._playerProcesses.items():
+            received = playerProcess.check()
+
+            if received:
+                # Players have the whole countdown for their first response
+                self._metrics.recordResponse(self._playerNames[teamId], playerProcess.lastResponseTime,
+                    self.turn > 0 and teamId not in self._answered, playerProcess.lastCpuTime)
+
+            if received and self._budgetMs is not None and self.isCpuBudget():
+                # The CPU time when the process measured it, the wall-clock time otherwise
+                spentMs = playerProcess.lastCpuTime if playerProcess.lastCpuTime is not None else playerProcess.lastResponseTime
+
+                if spentMs is not None and spentMs > self._budgetMs:
+                    # Same as no response, before being recorded so that replays drop it as well
+                    print("At {}ms (turn {}) : Player {} went over its think time ({:.1f}ms)".format(self.stopwatch.PeekDeltaTimeMs(), self.turn, teamId, spentMs))
+                    self._metrics.recordOverBudget(self._playerNames[teamId])
+
+                    self.teamsData[teamId] = None
+                    received = False
+
+            for recorder in self._recorders:
+                recorder.recordResponse(teamId, received, self.teamsData[teamId] if received else None)
+
     def handleFirstTurn(self):
         """
         Handles the end of the countdown and sets the turn to 1. This causes the turn to be handled without asking for new data, since it is collected during countdown.
@@ -322,8 +601,7 @@ class GameModel(Model):
         self.turn = 1
         self.countdownremaining = 0
 
-        for playerProcess in self._playerProcesses.values():
-            playerProcess.check()
+        self.checkPlayers()
 
     def handleStartingCountdown(self):
         """
@@ -331,8 +609,7 @@ class GameModel(Model):
         """
         self.countdownremaining = int(self._ruleset["StartCountdownSeconds"]) * 1000 - int(self._ruleset["ThinkTimeMs"]) - self.stopwatch.PeekDeltaTimeMs()
 
-        for playerProcess in self._playerProcesses.values():
-            playerProcess.check()
+        self.checkPlayers()
 
     def checkItemsPickup(self):
         """
@@ -341,12 +618,14 @@ class GameModel(Model):
         allBots = self.getBots()
 
         for bot in allBots.values():
-            for flag in self._map.flags:
-                if not flag.held and Physics.distance(flag.x,bot.x,flag.y,bot.y) <= bot.reach:
+            around = self._engine.getObjectsAround(bot.x, bot.y, bot.reach)
+
+            for flag in around:
+                if type(flag).__name__ == "Flag" and not flag.held:
                     bot.pickUp(flag)
 
-            for effect in self._map.objects["Effect"]:
-                if not effect.used and Physics.distance(effect.x,bot.x,effect.y,bot.y) <= bot.reach:
+            for effect in around:
+                if effect.category == "Effect" and not effect.used:
                     effect.apply(bot)
                     self.queueEvent(effect.wearOut,effect.duration,bot)
 
@@ -380,15 +659,45 @@ class GameModel(Model):
 
     def register(self, player):
         """
-        Only used if we make it a server.
+        Adds a remote player to the first team without a player, and provides it with the data a player gets at its
+        init : the lines of the map file (see RegularMap.parseMapData), the ruleset and a seed.
 
-        Add a new player to the game and provide it with necessary data.
+        Parameters:
+            player (RemotePlayer) : A player connected to the PlayerServer of the game.
 
         Returns:
-            data : Contains all the data a player can have at it's init.
+            data : Contains all the data a player can have at it's init, see Framing. None if both teams already have
+                a player, or if the player failed to initialize in time.
         """
-       
-        pass
+        teamId = next((teamId for teamId in ("1", "2") if teamId not in self._players), None)
+
+        if teamId is None:
+            return None
+
+        with open(self._mapFile, "r") as file:
+            mapLines = file.readlines()
+
+        data = {
+            "type": "init",
+            "team": int(teamId),
+            "map": mapLines,
+            "ruleset": dict(self._ruleset),
+            "seed": "{}_{}".format(self.seed, teamId),
+        }
+
+        player.send(data)
+
+        try:
+            initialized = player.receive("ready", Config.PlayerConnectTimeoutSeconds()).get("initialized", False)
+        except Empty:
+            initialized = False
+
+        if not initialized:
+            player.close()
+            return None
+
+        self._players[teamId] = player
+        return data
 
     def kick(self, teamId):
         """
@@ -404,15 +713,54 @@ class GameModel(Model):
             self._lastFlagPosition[i] = (self._map.flags[i].x, self._map.flags[i].y)
             # TODO: If the flag is inside a base, switch to endscreen
 
+    def getResults(self):
+        """
+        Summarizes the game, usually once it is over.
+
+        Returns:
+            results (dict) : {
+                "winner" : <team number, None for a draw or an unfinished game>,
+                "turns" : <number of turns played>,
+                "durationMs" : <game time in milliseconds since the start of the countdown>,
+                "missedTicks" : { "<teamId>" : <number of turns without a response>, ... }
+            }
+        """
+        return {
+            "winner": self.winner,
+            "turns": max(self.turn, 0),
+            "durationMs": self.stopwatch.PeekDeltaTimeMs() if self.turn != 0 else 0,
+            "missedTicks": dict(self._teamTotalMissedTicks),
+        }
+
     def stop(self):
         """
         Ends the game and terminates child processes
         """
         for playerProcess in self._playerProcesses.values():
             playerProcess.kill()
+            playerProcess.join()
+
+        for recorder in self._recorders:
+            recorder.close()
+
+        self._metrics.write()
 
     def getShoots(self):
         return self.shoots
+
+    def getMetrics(self):
+        """
+        Returns:
+            metrics (Metrics) : Measures of the players and of the ticks, see Metrics.snapshot.
+        """
+        return self._metrics
+
+    def getVisibility(self):
+        """
+        Returns:
+            visibility (VisibilityMatrix) : What each bot saw at the last polling, None before the first one.
+        """
+        return self.visibility
         
     def queueEvent(self, function, inMs, args):
         """
@@ -0,0 +1,68 @@
+import asyncio
+import json
+import struct
+
+class Framing:
+    """
+    How the game and remote players talk over a socket : each message is a JSON object sent as a frame, its size in
+    bytes (HEADER) followed by its UTF-8 text. JSON rather than pickle, so that the game never runs code sent by a
+    player. Tuples are received as lists.
+
+    Messages have a "type" :
+        "hello" : { "name" } sent by the player once connected.
+        "init" : { "team", "map", "ruleset", "seed" } sent by the game, map being the lines of the map file.
+        "ready" : { "initialized" } sent by the player once its Player is created, or failed to be.
+        "poll" : { "sequence", "data" } sent by the game, data being the polling data of Player.poll.
+        "response" : { "sequence", "data" } sent by the player, data being what Player.poll returned.
+    """
+
+    HEADER = struct.Struct(">I")
+
+    MAXIMUM_SIZE = 16 * 1024 * 1024
+    """
+    Largest message accepted, in bytes, so that a broken peer can not make the other one allocate anything.
+    """
+
+    @staticmethod
+    def encode(message):
+        """
+        Returns:
+            frame (bytes) : The message, ready to be written on the socket.
+        """
+        text = json.dumps(message, separators = (",", ":")).encode("utf-8")
+
+        return Framing.HEADER.pack(len(text)) + text
+
+    @staticmethod
+    async def read(reader):
+        """
+        Reads the next message from a StreamReader.
+
+        Returns:
+            message (dict) : The message, None when the connection was closed.
+        """
+        try:
+            (size,) = Framing.HEADER.unpack(await reader.readexactly(Framing.HEADER.size))
+
+            if size > Framing.MAXIMUM_SIZE:
+                raise Exception("Message of {} bytes is too large".format(size))
+
+            return json.loads(await reader.readexactly(size))
+        except (EOFError, ConnectionError, asyncio.IncompleteReadError):
+            return None
+
+    @staticmethod
+    def parseAddress(address):
+        """
+        Parameters:
+            address (string) : "unix:<path>" for a Unix socket, "<host>:<port>" for TCP.
+
+        Returns:
+            (kind, arguments) : "unix" and (path,), or "tcp" and (host, port).
+        """
+        if address.startswith("unix:"):
+            return ("unix", (address[len("unix:"):],))
+
+        (host, port) = address.rsplit(":", 1)
+
+        return ("tcp", (host or "127.0.0.1", int(port)))
@@ -0,0 +1,148 @@
+from model.Network.Framing import Framing
+from queue import Queue, Empty
+import asyncio
+import os
+import threading
+import traceback
+
+class PlayerServer:
+    """
+    Listens for remote players on a TCP or Unix socket, see PlayerClient. The sockets are handled by an asyncio loop
+    running in a thread of its own, so that the game loop stays as it is : it only takes the players that connected
+    with accept, and talks to them through RemotePlayer.
+
+    Attributes:
+        address (string) : Where players connect, see Framing.parseAddress.
+        loop (AbstractEventLoop) : The loop handling the sockets, in its own thread.
+        connected (Queue(RemotePlayer)) : Players that said hello, not accepted yet.
+    """
+
+    def __init__(self, address):
+        self.address = address
+
+        self._connected = Queue()
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target = self._loop.run_forever, daemon = True)
+        self._thread.start()
+
+        self._server = asyncio.run_coroutine_threadsafe(self._listen(), self._loop).result()
+
+    async def _listen(self):
+        (kind, arguments) = Framing.parseAddress(self.address)
+
+        if kind == "unix":
+            if os.path.exists(arguments[0]):
+                os.remove(arguments[0])
+
+            return await asyncio.start_unix_server(self._handle, *arguments)
+
+        return await asyncio.start_server(self._handle, *arguments)
+
+    async def _handle(self, reader, writer):
+        """
+        Reads the messages of a player for as long as it is connected.
+        """
+        player = None
+
+        try:
+            hello = await Framing.read(reader)
+
+            if hello is None or hello.get("type") != "hello":
+                return
+
+            player = RemotePlayer(self._loop, writer, str(hello.get("name", "")))
+            self._connected.put(player)
+
+            while True:
+                message = await Framing.read(reader)
+
+                if message is None:
+                    break
+
+                player.messages.put(message)
+        except Exception:
+            traceback.print_exc()
+        finally:
+            if player is not None:
+                player.closed = True
+                # Wakes up a receive waiting for this player
+                player.messages.put({ "type": "closed" })
+
+            writer.close()
+
+    def accept(self, timeoutSeconds = None):
+        """
+        Blocks until a player connects.
+
+        Returns:
+            player (RemotePlayer) : The first player that connected and was not accepted yet, None if none did in time.
+        """
+        try:
+            return self._connected.get(True, timeoutSeconds)
+        except Empty:
+            return None
+
+    def close(self):
+        """
+        Stops listening and stops the loop, players already connected are closed with it.
+        """
+        self._server.close()
+        asyncio.run_coroutine_threadsafe(self._server.wait_closed(), self._loop).result()
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+        (kind, arguments) = Framing.parseAddress(self.address)
+
+        if kind == "unix" and os.path.exists(arguments[0]):
+            os.remove(arguments[0])
+
+class RemotePlayer:
+    """
+    A player connected to a PlayerServer, used from the game thread.
+
+    Attributes:
+        name (string) : What the player said it is in its hello.
+        messages (Queue(dict)) : Messages received from the player, in order, then { "type": "closed" } once it
+            disconnected.
+        closed (bool) : Whether the player disconnected.
+    """
+
+    def __init__(self, loop, writer, name):
+        self._loop = loop
+        self._writer = writer
+
+        self.name = name
+        self.messages = Queue()
+        self.closed = False
+
+    def send(self, message):
+        """
+        Sends a message without waiting for it to be written.
+        """
+        if not self.closed:
+            self._loop.call_soon_threadsafe(self._writer.write, Framing.encode(message))
+
+    def receive(self, kind, timeoutSeconds = None):
+        """
+        Takes the oldest message of a kind, dropping older messages of other kinds.
+
+        Returns:
+            message (dict) : The message. Raises Empty if it did not come in time, or at once if the player is closed
+                and sent nothing more.
+        """
+        while True:
+            if self.closed and self.messages.empty():
+                raise Empty
+
+            message = self.messages.get(True, None if timeoutSeconds is None else max(timeoutSeconds, 0))
+
+            if message.get("type") == kind:
+                return message
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._loop.call_soon_threadsafe(self._writer.close)
@@ -0,0 +1,46 @@
+from model.RelayedPlayerProcess import RelayedPlayerProcess
+import time
+
+class SocketPlayerProcess(RelayedPlayerProcess):
+    """
+    Stands for a PlayerProcess when the player is remote, connected to a PlayerServer : same interface, the player
+    runs wherever its PlayerClient does.
+
+    Attributes:
+        player (RemotePlayer) : The connection to the player, None if it failed to initialize.
+        sequence (int) : Number of the last polling data sent.
+    """
+
+    def __init__(self, model, teamId, player):
+        super().__init__(model, teamId, player)
+
+        self._sequence = 0
+
+    def execute(self):
+        """
+        Sends the data to the player.
+        """
+        self._stopwatch.StartTimer()
+        self._sequence += 1
+
+        if self._player is not None:
+            self._player.send({ "type": "poll", "sequence": self._sequence, "data": self._data })
+
+    def _receive(self, timeoutMs):
+        deadline = time.monotonic() + timeoutMs / 1000
+
+        while True:
+            message = self._player.receive("response", deadline - time.monotonic())
+
+            # A late answer to older polling data is not what the player would answer now
+            if message.get("sequence") == self._sequence:
+                # Measured on the host of the player, which the game can not check
+                return (message["data"], None)
+
+    def kill(self):
+        """
+        Closes the connection, the player is told the game is over by the connection closing.
+        """
+        if self._player is not None:
+            self._player.close()
+            self._player = None
@@ -0,0 +1,3 @@
+from .Framing import Framing
+from .PlayerServer import PlayerServer, RemotePlayer
+from .SocketPlayerProcess import SocketPlayerProcess
\ No newline at end of file
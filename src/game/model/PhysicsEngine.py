@@ -2,8 +2,11 @@ from service.Physics import Physics
 from service.Config import Config
 from domain.Map import Map
 from domain.GameObject import Bot
+from model.VisibilityTable import VisibilityTable
+from model.VisibilityMatrix import VisibilityMatrix
 
 import math
+import numpy
 
 class PhysicsEngine(Physics):
     """
@@ -13,6 +16,7 @@ class PhysicsEngine(Physics):
         ruleset (Ruleset) : The set of rules needed to make objects behave
         map (Map) : The game world
         deltaTime (int) : Time in milliseconds since last tick
+        visibilityTable (VisibilityTable) : Which blocks see each other, None until createVisibilityTable is called
     """
 
     def __init__(self, ruleset, map_):
@@ -22,6 +26,8 @@ class PhysicsEngine(Physics):
         self.collisionsMaps = dict()
         self.collisionsMapsDividers = dict()
 
+        self.visibilityTable = None
+
 
     def tick(self, deltaTime):
         """
@@ -79,58 +85,159 @@ class PhysicsEngine(Physics):
         """
         return (self.deltaTime / (1000 / (30 * Config.TimeRate())))
 
-    def checkCollision(self, collisionMap, x, y, targetX, targetY, capX, capY):
+    def checkCollision(self, x, y, targetX, targetY, radius, capX = None, capY = None, slide = False):
         """
-        Checks whether a target's path collides with the map.
+        Moves a circle from (x, y) towards (targetX, targetY) until it touches a solid block.
+
+        Parameters:
+            radius (int) : Radius of the circle moving. Example: bot.radius
+            capX, capY (int) : Where the circle is heading, it stops there if it passes through it.
+            slide (bool) : Whether the rest of the movement goes on along the block touched instead of stopping.
 
         Returns:
-            position (int,int) : The first valid position.
+            position (x, y) : Where the circle ends, touching the block it stopped on if any.
         """
-        
-        dx = abs(targetX - x)
-        dy = abs(targetY - y)
+        (dx, dy) = (targetX - x, targetY - y)
 
-        currentX = x
-        currentY = y
+        if capX is not None and capY is not None and (dx != 0 or dy != 0):
+            # Passing within half a unit of the cap stops on it
+            t = ((capX - x) * dx + (capY - y) * dy) / (dx * dx + dy * dy)
+            if 0 <= t <= 1 and Physics.distance(x + t * dx, capX, y + t * dy, capY) <= 0.5:
+                (dx, dy) = (t * dx, t * dy)
 
-        lastX = x
-        lastY = y
+        # Touching a block consumes the movement up to it, a slide can touch at most two more
+        for i in range(3 if slide else 1):
+            contact = self.sweepCircle(x, y, x + dx, y + dy, radius)
 
-        n = int(1 + dx + dy)
+            if contact is None:
+                return (x + dx, y + dy)
 
-        xInc = 1 if (targetX > x) else -1
-        yInc = 1 if (targetY > y) else -1
+            (t, (normalX, normalY)) = contact
+            (x, y) = (x + t * dx, y + t * dy)
 
-        error = dx - dy
+            # What is left of the movement, without the part going into the block
+            (dx, dy) = ((1 - t) * dx, (1 - t) * dy)
+            push = dx * normalX + dy * normalY
+            (dx, dy) = (dx - push * normalX, dy - push * normalY)
 
-        dx *= 2
-        dy *= 2
-        
-        for i in range(n, 0, -1):
+        return (x, y)
 
-            if capX != None and capY != None and capX == currentX and capY == currentY:
-                return (lastX,lastY)
-            
-            if self.collisionsMaps[collisionMap][int(currentX // self.collisionsMapsDividers[collisionMap])][int(currentY // self.collisionsMapsDividers[collisionMap])]:
-                return (lastX, lastY)
-
-            lastX = currentX
-            lastY = currentY
-
-            if error > 0:
-                currentX += xInc
-                error -= dy
-            elif error < 0:
-                currentY += yInc
-                error += dx
-            elif error == 0:
-                currentX += xInc
-                currentY += yInc
-                error -= dy
-                error += dx
-                n -= 1
-                
-        return (targetX, targetY)
+    def sweepCircle(self, x, y, targetX, targetY, radius):
+        """
+        Finds where a circle moving along a segment first touches a solid block, exactly. Blocks out of the map are
+        solid.
+
+        Each block near the segment is grown by radius (a rectangle with rounded corners) and the segment is
+        intersected with it, so the cost only depends on the number of blocks around, not on the distance in units.
+        A circle already overlapping a block only touches it when moving further into it.
+
+        Returns:
+            contact (t, (normalX, normalY)) : The fraction of the segment at which the circle touches a block and the
+                unit normal of the block there, pointing out of it. None if the circle never touches any.
+        """
+        size = Map.BLOCKSIZE
+        blocks = self._map.blocks
+        (width, height) = (self._map.blockWidth, self._map.blockHeight)
+
+        (dx, dy) = (targetX - x, targetY - y)
+
+        contact = None
+
+        for blockX in range(int((min(x, targetX) - radius) // size), int((max(x, targetX) + radius) // size) + 1):
+            for blockY in range(int((min(y, targetY) - radius) // size), int((max(y, targetY) + radius) // size) + 1):
+                if 0 <= blockX < width and 0 <= blockY < height and not blocks[blockX][blockY].solid:
+                    continue
+
+                hit = PhysicsEngine.sweepCircleRect(x, y, dx, dy, radius,
+                    blockX * size, blockY * size, (blockX + 1) * size, (blockY + 1) * size)
+
+                if hit is not None and (contact is None or hit[0] < contact[0]):
+                    contact = hit
+
+        return contact
+
+    @staticmethod
+    def sweepCircleRect(x, y, dx, dy, radius, minX, minY, maxX, maxY):
+        """
+        Intersects a circle moving by (dx, dy) from (x, y) with a rectangle.
+
+        Returns:
+            contact (t, (normalX, normalY)) : See sweepCircle, None if the circle does not touch the rectangle
+                for t in [0, 1].
+        """
+        # Closest point of the rectangle to the center, at the start
+        closestX = min(max(x, minX), maxX)
+        closestY = min(max(y, minY), maxY)
+        (awayX, awayY) = (x - closestX, y - closestY)
+
+        if awayX * awayX + awayY * awayY <= radius * radius:
+            # Already touching
+            length = math.hypot(awayX, awayY)
+
+            if length > 0:
+                normal = (awayX / length, awayY / length)
+            else:
+                # The center is inside, out through the closest side
+                sides = [(x - minX, (-1, 0)), (maxX - x, (1, 0)), (y - minY, (0, -1)), (maxY - y, (0, 1))]
+                normal = min(sides)[1]
+
+            if dx * normal[0] + dy * normal[1] < 0:
+                return (0.0, normal)
+
+            return None
+
+        if dx == 0 and dy == 0:
+            return None
+
+        # The center enters the rectangle grown by radius along both axes (slab test)
+        tEnter = 0.0
+        tExit = 1.0
+
+        for (start, delta, low, high) in ((x, dx, minX - radius, maxX + radius), (y, dy, minY - radius, maxY + radius)):
+            if delta == 0:
+                if start < low or start > high:
+                    return None
+                continue
+
+            (t1, t2) = ((low - start) / delta, (high - start) / delta)
+            (tEnter, tExit) = (max(tEnter, min(t1, t2)), min(tExit, max(t1, t2)))
+
+            if tEnter > tExit:
+                return None
+
+        (hitX, hitY) = (x + tEnter * dx, y + tEnter * dy)
+
+        outsideX = hitX < minX or hitX > maxX
+        outsideY = hitY < minY or hitY > maxY
+
+        if not (outsideX and outsideY):
+            # On a side, the normal is the axis it is outside of
+            if outsideX:
+                return (tEnter, (-1 if hitX < minX else 1, 0))
+            return (tEnter, (0, -1 if hitY < minY else 1))
+
+        # Near a corner, the circle touches the corner itself
+        cornerX = minX if hitX < minX else maxX
+        cornerY = minY if hitY < minY else maxY
+
+        (fromX, fromY) = (x - cornerX, y - cornerY)
+        a = dx * dx + dy * dy
+        b = fromX * dx + fromY * dy
+        c = fromX * fromX + fromY * fromY - radius * radius
+        discriminant = b * b - a * c
+
+        if discriminant < 0:
+            return None
+
+        t = (-b - math.sqrt(discriminant)) / a
+
+        if t < 0 or t > 1:
+            return None
+
+        (normalX, normalY) = (fromX + t * dx, fromY + t * dy)
+        length = math.hypot(normalX, normalY)
+
+        return (t, (normalX / length, normalY / length))
 
     def viewBlocked(self, x, y, targetX, targetY):
         """
@@ -139,78 +246,155 @@ class PhysicsEngine(Physics):
         Returns:
             blocked (bool) : True if blocked, False if not blocked
         """
-        
-        dx = abs(targetX - x)
-        dy = abs(targetY - y)
+        return self.castRay(x, y, targetX, targetY, lambda block: not block.transparent) is not None
 
-        currentX = x
-        currentY = y
+    def traverseBlocks(self, x, y, targetX, targetY):
+        """
+        Lists the blocks crossed by a segment, in order, each one once (Amanatides & Woo grid traversal).
 
-        lastX = x
-        lastY = y
+        A segment going exactly through the corner of a block goes straight to the diagonal block.
+        Blocks out of the map are listed as well, callers decide what they mean.
 
-        n = int(1 + dx + dy)
+        Returns:
+            blocks (generator((blockX, blockY, t))) : Coordinates of each block crossed, in blocks, and the fraction
+                of the segment at which it is entered : the entry point is (x + t * (targetX - x), y + t * (targetY - y)).
+        """
+        size = Map.BLOCKSIZE
+
+        (dx, dy) = (targetX - x, targetY - y)
+
+        (blockX, blockY) = (int(x // size), int(y // size))
+
+        # Each block crossed is one step along x and/or y, from the starting block to the target block
+        stepsX = abs(int(targetX // size) - blockX)
+        stepsY = abs(int(targetY // size) - blockY)
+
+        stepX = 1 if dx > 0 else -1
+        stepY = 1 if dy > 0 else -1
+
+        # t at which the next vertical (tMaxX) or horizontal (tMaxY) block border is crossed, and between two of them
+        if dx != 0:
+            tMaxX = ((blockX + (dx > 0)) * size - x) / dx
+            tDeltaX = size / abs(dx)
+        else:
+            tMaxX = tDeltaX = math.inf
+
+        if dy != 0:
+            tMaxY = ((blockY + (dy > 0)) * size - y) / dy
+            tDeltaY = size / abs(dy)
+        else:
+            tMaxY = tDeltaY = math.inf
+
+        yield (blockX, blockY, 0.0)
+
+        while stepsX > 0 or stepsY > 0:
+            if stepsY == 0 or (stepsX > 0 and tMaxX < tMaxY):
+                t = tMaxX
+                tMaxX += tDeltaX
+                blockX += stepX
+                stepsX -= 1
+            elif stepsX == 0 or tMaxY < tMaxX:
+                t = tMaxY
+                tMaxY += tDeltaY
+                blockY += stepY
+                stepsY -= 1
+            else:
+                t = tMaxX
+                tMaxX += tDeltaX
+                tMaxY += tDeltaY
+                blockX += stepX
+                blockY += stepY
+                stepsX -= 1
+                stepsY -= 1
+
+            yield (blockX, blockY, t)
+
+    def castRay(self, x, y, targetX, targetY, stopsRay):
+        """
+        Follows a segment through the blocks it crosses until one of them stops it. Leaving the map stops it as well.
 
-        xInc = 1 if (targetX > x) else -1
-        yInc = 1 if (targetY > y) else -1
+        Parameters:
+            stopsRay (function(Block)) : Returns True for blocks that stop the ray. Example: lambda block: block.solid
 
-        error = dx - dy
+        Returns:
+            impact ((x, y), block) : The point where the segment enters the first block stopping it and this block
+                (None out of the map), or None if nothing stops the segment.
+        """
+        blocks = self._map.blocks
+        (width, height) = (self._map.blockWidth, self._map.blockHeight)
+
+        for (blockX, blockY, t) in self.traverseBlocks(x, y, targetX, targetY):
+            if blockX < 0 or blockY < 0 or blockX >= width or blockY >= height:
+                block = None
+            elif stopsRay(blocks[blockX][blockY]):
+                block = blocks[blockX][blockY]
+            else:
+                continue
 
-        dx *= 2
-        dy *= 2
-        
-        for i in range(n, 0, -1):
-            
-            if not self._map.blocks[int(currentX // self._map.BLOCKSIZE)][int(currentY // self._map.BLOCKSIZE)].transparent:
-                return True
-
-            lastX = currentX
-            lastY = currentY
-
-            if error > 0:
-                currentX += xInc
-                error -= dy
-            elif error < 0:
-                currentY += yInc
-                error += dx
-            elif error == 0:
-                currentX += xInc
-                currentY += yInc
-                error -= dy
-                error += dx
-                n -= 1
-                
-        return False
+            return ((x + t * (targetX - x), y + t * (targetY - y)), block)
+
+        return None
 
     def createCollisionMap(self, name, padding):
+        """
+        Computes where the center of an object of radius padding can not go, at a resolution of divider units.
+        Collisions are computed by checkCollision without it, this is only an approximation to display.
+
+        The map is a numpy boolean array indexed by [x // divider, y // divider] : every solid block is marked, then
+        grown by the padding along both axes.
 
+        Parameters:
+            name (string) : The identifier of this collision map. Example: "RegularBot"
+            padding (int) : The distance to keep from solid blocks.
+        """
         divider = 10 # 1 / round(Map.BLOCKSIZE / padding)
         self.collisionsMapsDividers[name] = divider
 
         collisionsMapPadding = int(padding // (Map.BLOCKSIZE // divider))
-        collisionsMapWidth = int(self._map.blockWidth * divider)
-        collisionsMapHeight = int(self._map.blockHeight * divider)
+        blockSizeFactored = int(Map.BLOCKSIZE // divider)
 
-        self.collisionsMaps[name] = [[False for i in range(0,collisionsMapHeight)] for j in range(0,collisionsMapWidth)]
+        solidBlocks = numpy.array([[block.solid for block in blockline] for blockline in self._map.blocks], dtype = bool)
 
-        blockSizeFactored = int(Map.BLOCKSIZE // divider)
+        # Each block covers blockSizeFactored cells in each direction
+        solidCells = solidBlocks.repeat(blockSizeFactored, axis = 0).repeat(blockSizeFactored, axis = 1)
+
+        self.collisionsMaps[name] = PhysicsEngine.dilate(solidCells, collisionsMapPadding)
+
+    @staticmethod
+    def dilate(cells, padding):
+        """
+        Grows the True cells of a 2 dimensional boolean array by padding cells along both axes (a square around each).
+
+        Returns:
+            cells (numpy.ndarray) : A new array, of the same shape.
+        """
+        for axis in range(2):
+            grown = cells.copy()
+            length = cells.shape[axis]
+
+            for shift in range(1, min(padding, length - 1) + 1):
+                before = [slice(None)] * 2
+                after = [slice(None)] * 2
+
+                before[axis] = slice(shift, None)
+                after[axis] = slice(None, length - shift)
+
+                grown[tuple(before)] |= cells[tuple(after)]
+                grown[tuple(after)] |= cells[tuple(before)]
+
+            cells = grown
+
+        return cells
 
-        (x,y) = (0,0)
-        for blockline in self._map.blocks:
-            for block in blockline:
-                if block.solid:
-                    for rx in range(- collisionsMapPadding, blockSizeFactored + collisionsMapPadding):
-                        for ry in range(- collisionsMapPadding, blockSizeFactored + collisionsMapPadding):
-                            nx = int(x + rx)
-                            ny = int(y + ry)
-                            
-                            if nx >= 0 and ny >= 0 and nx < collisionsMapWidth and ny < collisionsMapHeight:
-                                # print("{} {}".format(nx,ny))
-                                self.collisionsMaps[name][nx][ny] = True
-
-                y += blockSizeFactored
-            y = 0
-            x += blockSizeFactored
+    def createVisibilityTable(self, distance, cachePath = None):
+        """
+        Computes which blocks see each other, so that sees rarely has to cast a ray. See VisibilityTable.
+
+        Parameters:
+            distance (int) : The largest view distance of the objects that will see, in real coordinates.
+            cachePath (string) : File in which the table is kept between games, None to always compute it.
+        """
+        self.visibilityTable = VisibilityTable.load(self._map, distance, cachePath)
 
     def sees(self, bot1, gameObject):
         if Physics.distance(bot1.x, gameObject.x, bot1.y, gameObject.y) > bot1.viewDistance:
@@ -226,53 +410,70 @@ class PhysicsEngine(Physics):
         if abs(deltaAngle) > bot1.fov:
             return False
             
-        return self.viewBlocked(bot1.x, bot1.y, gameObject.x, gameObject.y)
+        if self.visibilityTable is not None:
+            visibility = self.visibilityTable.lookup(
+                int(bot1.x // Map.BLOCKSIZE),
+                int(bot1.y // Map.BLOCKSIZE),
+                int(gameObject.x // Map.BLOCKSIZE),
+                int(gameObject.y // Map.BLOCKSIZE)
+            )
+
+            if visibility != VisibilityTable.PARTIAL:
+                return visibility == VisibilityTable.CLEAR
+
+        return not self.viewBlocked(bot1.x, bot1.y, gameObject.x, gameObject.y)
+
+    def computeVisibility(self, bots, objects):
+        """
+        Checks sees for every bot and object at once, much faster than calling it for each pair.
+
+        Returns:
+            visibility (VisibilityMatrix) : Which bots see which objects, at their current positions.
+        """
+        return VisibilityMatrix(self, bots, objects)
 
 
 
     def getImpactPoint(self, x, y, targetX, targetY):
-        dx = abs(targetX - x)
-        dy = abs(targetY - y)
+        """
+        Returns:
+            point (x,y) : Where a segment enters the first solid block it crosses, None if it does not cross any.
+        """
+        impact = self.castRay(x, y, targetX, targetY, lambda block: block.solid)
 
-        currentX = x
-        currentY = y
+        return impact[0] if impact is not None else None
 
-        lastX = x
-        lastY = y
 
-        n = int(1 + dx + dy)
+    def getObjectsAround(self, x, y, radius):
+        """
+        Returns:
+            objects (list(GameObject)) : The objects and bots of the map at most radius away from (x, y).
+        """
+        return self._map.grid.queryRadius(x, y, radius)
 
-        xInc = 1 if (targetX > x) else -1
-        yInc = 1 if (targetY > y) else -1
+    def getObjectsAlongRay(self, x, y, targetX, targetY, margin):
+        """
+        Returns:
+            objects (list(GameObject)) : The objects and bots of the map that may be at most margin away from the
+                segment, found from the blocks it crosses. Callers check each of them exactly.
+        """
+        blocks = ((blockX, blockY) for (blockX, blockY, t) in self.traverseBlocks(x, y, targetX, targetY))
 
-        error = dx - dy
+        return self._map.grid.queryCells(blocks, margin)
 
-        dx *= 2
-        dy *= 2
-        
-        for i in range(n, 0, -1):
-            
-            if self._map.blocks[int(currentX // self._map.BLOCKSIZE)][int(currentY // self._map.BLOCKSIZE)].solid:
-                return (currentX, currentY)
-
-            lastX = currentX
-            lastY = currentY
-
-            if error > 0:
-                currentX += xInc
-                error -= dy
-            elif error < 0:
-                currentY += yInc
-                error += dx
-            elif error == 0:
-                currentX += xInc
-                currentY += yInc
-                error -= dy
-                error += dx
-                n -= 1
-                
-        return None
+    def getObjectsAlongShoot(self, x, y, angle, shootLength, margin):
+        """
+        Same as getObjectsAlongRay, for a shoot that stops at the first solid block.
+
+        Returns:
+            objects (list(GameObject)) : The objects and bots that may be at most margin away from the shoot.
+        """
+        targetX = x + math.cos(math.radians(angle)) * shootLength
+        targetY = y + math.sin(math.radians(angle)) * shootLength
+
+        (targetX, targetY) = self.getImpactPoint(x, y, targetX, targetY) or (targetX, targetY)
 
+        return self.getObjectsAlongRay(x, y, targetX, targetY, margin)
 
     def getShootedBot(self, x, y, angle, shootLength, bots):
         """
@@ -292,7 +493,7 @@ class PhysicsEngine(Physics):
             if Physics.angularDistance(angle, Physics.getAngle(x, y, bot.x, bot.y)) >= 90:
                 continue
 
-            distanceToBot = Physics.distance(x, y, bot.x, bot.y)
+            distanceToBot = Physics.distance(x, bot.x, y, bot.y)
             if distanceToBot > shootLength:
                 continue
 
@@ -311,11 +512,11 @@ class PhysicsEngine(Physics):
             return botsToCheck[0]
         
         elif n > 1:
-            minDist = Physics.distance(x, y, botsToCheck[0][1][0], botsToCheck[0][1][1])
+            minDist = Physics.distance(x, botsToCheck[0][1][0], y, botsToCheck[0][1][1])
             minBotIndex = 0
 
-            for i in range(2, n):
-                newDist = Physics.distance(x, y, botsToCheck[i][1][0], botsToCheck[i][1][1])
+            for i in range(1, n):
+                newDist = Physics.distance(x, botsToCheck[i][1][0], y, botsToCheck[i][1][1])
 
                 if newDist < minDist:
                     minDist = newDist
@@ -0,0 +1,338 @@
+from multiprocessing import Process, Queue
+from queue import Empty
+import configparser
+import itertools
+import random
+import resource
+import time
+import traceback
+
+class PlayerPool:
+    """
+    Long-lived worker processes hosting the players of many matches, so that a process is not started (and the
+    players imported again) for every match.
+
+    Each worker hosts any number of players, one per match and team, polled by match id and team. The two players of
+    a match are always hosted by different workers, so that they compute at the same time. A worker is recycled once
+    it hosted maxMatches players, or once its memory grew over maxMemoryMb : it does not get new players anymore and
+    is stopped as soon as it hosts none. A worker still computing for a match that ended is stopped as well, a player
+    stuck in its poll would block the others. A worker that died, a player having ended its process, is recycled the
+    same way, its players not answering anymore.
+
+    Attributes:
+        size (int) : Number of workers, at least 2.
+        maxMatches (int) : Number of players a worker hosts before being recycled, None for no limit.
+        maxMemoryMb (int) : Largest memory used by a worker before being recycled, in megabytes, None for no limit.
+        workers (list(PlayerWorker)) : The workers, started when first needed.
+        matches (iterator(int)) : Identifiers of the next matches.
+    """
+
+    WAIT_SLICE_SECONDS = 0.1
+    """
+    Longest wait for a message before checking that the worker is still alive.
+    """
+
+    def __init__(self, size = 2, maxMatches = None, maxMemoryMb = None):
+        if size < 2:
+            raise Exception("A pool needs at least 2 workers, one for each team of a match")
+
+        self.size = size
+        self.maxMatches = maxMatches
+        self.maxMemoryMb = maxMemoryMb
+
+        self._workers = [None] * size
+        self._matches = itertools.count(1)
+
+    def newMatch(self):
+        """
+        Returns:
+            matchId (int) : Identifier of a new match, to create its players.
+        """
+        return next(self._matches)
+
+    def createPlayer(self, matchId, teamId, Player, mapData, ruleset, seed = None):
+        """
+        Creates a player in a worker that does not host the other team of this match, and waits for its
+        initialization.
+
+        Parameters:
+            matchId (int) : The match, see newMatch.
+            teamId (string) : The team of the player in this match.
+            Player (class) : The class of the player, importable by the workers.
+            mapData (dict) : The map, as given to Player.
+            ruleset (Ruleset) : The rules of the match, as given to Player.
+            seed (any) : Seed of the random module for this player, so that seeded games are reproducible.
+
+        Returns:
+            player (PooledPlayer) : Handle of the player, None if its initialization failed or ended the worker.
+        """
+        index = self._pickWorker(matchId)
+
+        worker = self._workers[index]
+        worker.hosted.add((matchId, teamId))
+        worker.created += 1
+
+        worker.requests.put(("create", matchId, teamId, Player, mapData, dict(ruleset), int(teamId), seed))
+
+        try:
+            (succeeded, worker.memoryMb) = self.receive(worker, (matchId, teamId), "created")
+        except Empty:
+            # The worker died initializing the player
+            succeeded = False
+            worker.retiring = True
+
+        if not succeeded:
+            self.removePlayer(PooledPlayer(self, worker, matchId, teamId))
+            return None
+
+        return PooledPlayer(self, worker, matchId, teamId)
+
+    def _pickWorker(self, matchId):
+        """
+        Returns:
+            index (int) : The worker hosting the fewest players among the ones that are not recycled and do not host
+                this match yet, started if needed.
+        """
+        candidates = list()
+
+        for (index, worker) in enumerate(self._workers):
+            if worker is not None and not worker.process.is_alive():
+                worker.retiring = True
+
+                if not worker.hosted:
+                    worker.stop()
+                    self._workers[index] = worker = None
+
+            if worker is not None and worker.retiring:
+                continue
+            if worker is not None and any(hostedMatch == matchId for (hostedMatch, teamId) in worker.hosted):
+                continue
+
+            candidates.append((len(worker.hosted) if worker is not None else 0, index))
+
+        if not candidates:
+            raise Exception("Every worker of the pool is busy with this match or being recycled")
+
+        index = min(candidates)[1]
+
+        if self._workers[index] is None:
+            self._workers[index] = PlayerWorker()
+
+        return index
+
+    def poll(self, player, pollingData):
+        """
+        Sends polling data to a player, its response is then available to receive.
+        """
+        key = (player.matchId, player.teamId)
+
+        player.worker.outstanding[key] = player.worker.outstanding.get(key, 0) + 1
+        player.worker.requests.put(("poll", player.matchId, player.teamId, pollingData))
+
+    def receive(self, worker, key, kind, timeoutMs = None):
+        """
+        Takes the oldest message of a kind sent by worker for key (match, team). Messages for other players are
+        put aside for them.
+
+        Parameters:
+            timeoutMs (int) : How long to wait for the message, None to wait until it comes.
+
+        Returns:
+            content (any) : The content of the message. Raises Empty if it did not come in time, if the worker died
+                without sending it, or if the player crashed : it will not send anything anymore.
+        """
+        pending = worker.pending.setdefault(key, list())
+        deadline = None if timeoutMs is None else time.monotonic() + max(timeoutMs, 0) / 1000
+
+        while True:
+            if key in worker.crashed:
+                raise Empty
+
+            for (i, (messageKind, content)) in enumerate(pending):
+                if messageKind == kind:
+                    del pending[i]
+                    return content
+
+            message = self._nextMessage(worker, deadline)
+
+            (messageKind, matchId, teamId, content) = message
+
+            if messageKind in ("result", "crashed"):
+                worker.outstanding[(matchId, teamId)] = worker.outstanding.get((matchId, teamId), 0) - 1
+
+            if messageKind == "removed":
+                worker.memoryMb = content
+            elif messageKind == "crashed":
+                worker.crashed.add((matchId, teamId))
+            elif (matchId, teamId) in worker.hosted:
+                worker.pending.setdefault((matchId, teamId), list()).append((messageKind, content))
+
+    def _nextMessage(self, worker, deadline):
+        """
+        Returns:
+            message (tuple) : The next message of worker. Raises Empty at the deadline (None for none), or as soon as
+                the worker died without sending any.
+        """
+        while True:
+            timeout = PlayerPool.WAIT_SLICE_SECONDS
+
+            if deadline is not None:
+                timeout = min(timeout, max(deadline - time.monotonic(), 0))
+
+            try:
+                return worker.responses.get(True, timeout)
+            except Empty:
+                if not worker.process.is_alive():
+                    # What it sent before dying is still in the queue
+                    return worker.responses.get(True, PlayerPool.WAIT_SLICE_SECONDS)
+
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+
+    def removePlayer(self, player):
+        """
+        Removes a player from its worker once its match is over, and recycles the worker if needed.
+        """
+        worker = player.worker
+        key = (player.matchId, player.teamId)
+
+        worker.hosted.discard(key)
+        worker.crashed.discard(key)
+        worker.pending.pop(key, None)
+
+        if worker.outstanding.pop(key, 0) > 0:
+            # Still computing for a match that ended
+            worker.retiring = True
+        else:
+            # The memory it reports afterwards decides whether it is recycled next time
+            worker.requests.put(("remove", player.matchId, player.teamId))
+
+        if self.maxMatches is not None and worker.created >= self.maxMatches:
+            worker.retiring = True
+        if self.maxMemoryMb is not None and worker.memoryMb >= self.maxMemoryMb:
+            worker.retiring = True
+
+        if worker.retiring and not worker.hosted and worker in self._workers:
+            worker.stop()
+            self._workers[self._workers.index(worker)] = None
+
+    def close(self):
+        """
+        Stops every worker.
+        """
+        for (index, worker) in enumerate(self._workers):
+            if worker is not None:
+                worker.stop()
+                self._workers[index] = None
+
+class PlayerWorker:
+    """
+    A worker process of a PlayerPool and what the pool knows about it.
+
+    Attributes:
+        process (Process) : The worker process.
+        requests (Queue) : Messages sent to the worker.
+        responses (Queue) : Messages sent by the worker : (kind, matchId, teamId, content). The content of a result
+            is (response, CPU time spent on it in milliseconds), like PlayerProcess receives them.
+        hosted (set((matchId, teamId))) : The players hosted.
+        pending (dict) : Messages received for each player, not taken yet.
+        crashed (set((matchId, teamId))) : The players hosted whose poll raised, that do not answer anymore.
+        outstanding (dict) : Number of polls sent to each player that were not answered yet.
+        created (int) : Number of players hosted since the worker started.
+        memoryMb (double) : Largest memory used by the worker when it last said so, in megabytes.
+        retiring (bool) : Whether the worker is being recycled.
+    """
+
+    def __init__(self):
+        self.requests = Queue()
+        self.responses = Queue()
+
+        self.hosted = set()
+        self.pending = dict()
+        self.crashed = set()
+        self.outstanding = dict()
+        self.created = 0
+        self.memoryMb = 0
+        self.retiring = False
+
+        self.process = Process(target = runPlayerWorker, args = (self.requests, self.responses), daemon = True)
+        self.process.start()
+
+    def stop(self):
+        self.process.kill()
+        self.process.join()
+
+class PooledPlayer:
+    """
+    Handle of a player hosted by a PlayerPool.
+    """
+
+    def __init__(self, pool, worker, matchId, teamId):
+        self.pool = pool
+        self.worker = worker
+        self.matchId = matchId
+        self.teamId = teamId
+
+def runPlayerWorker(requests, responses):
+    """
+    Hosts players until killed. Each player keeps its own random state, as if it had a process of its own.
+    """
+    players = dict()
+    randomStates = dict()
+
+    while True:
+        (kind, matchId, teamId, *arguments) = requests.get()
+        key = (matchId, teamId)
+
+        if kind == "create":
+            (Player, mapData, rules, team, seed) = arguments
+
+            # Players get a section of a parser, like the game gives them
+            parser = configparser.ConfigParser()
+            parser.read_dict({ "Ruleset": rules })
+
+            random.seed(seed)
+
+            try:
+                players[key] = Player(mapData, parser["Ruleset"], team = team)
+                succeeded = True
+            except:
+                traceback.print_exc()
+                succeeded = False
+
+            randomStates[key] = random.getstate()
+            responses.put(("created", matchId, teamId, (succeeded, memoryMb())))
+
+        elif kind == "poll":
+            if key not in players:
+                responses.put(("crashed", matchId, teamId, None))
+                continue
+
+            random.setstate(randomStates[key])
+
+            try:
+                # CPU time of this process only : the players of other matches it hosts do not compute meanwhile
+                start = time.process_time()
+                result = players[key].poll(arguments[0])
+                cpuTime = (time.process_time() - start) * 1000
+            except:
+                # Like a player process that crashed, this player does not answer anymore
+                traceback.print_exc()
+                del players[key]
+                responses.put(("crashed", matchId, teamId, None))
+                continue
+
+            randomStates[key] = random.getstate()
+            responses.put(("result", matchId, teamId, (result, cpuTime)))
+
+        elif kind == "remove":
+            players.pop(key, None)
+            randomStates.pop(key, None)
+            responses.put(("removed", matchId, teamId, memoryMb()))
+
+def memoryMb():
+    """
+    Returns:
+        memory (double) : Largest memory used by this process so far, in megabytes.
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
@@ -0,0 +1,41 @@
+from model.RelayedPlayerProcess import RelayedPlayerProcess
+from queue import Empty
+
+class PooledPlayerProcess(RelayedPlayerProcess):
+    """
+    Stands for a PlayerProcess when the player is hosted by a PlayerPool : same interface, but the process is shared
+    with other matches and outlives the game.
+
+    Attributes:
+        player (PooledPlayer) : The player in its pool, None if it failed to initialize.
+    """
+
+    def execute(self):
+        """
+        Sends the data to the player in its worker.
+        """
+        self._stopwatch.StartTimer()
+
+        if self._player is not None:
+            self._player.pool.poll(self._player, self._data)
+
+    def _receive(self, timeoutMs):
+        worker = self._player.worker
+        key = (self._player.matchId, self._player.teamId)
+
+        try:
+            return self._player.pool.receive(worker, key, "result", timeoutMs)
+        except Empty:
+            if key in worker.crashed:
+                # Like a player process that crashed, no need to wait for it anymore
+                self.kill()
+
+            raise
+
+    def kill(self):
+        """
+        Removes the player from its pool, the process itself keeps hosting other players.
+        """
+        if self._player is not None:
+            self._player.pool.removePlayer(self._player)
+            self._player = None
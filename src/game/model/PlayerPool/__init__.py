@@ -0,0 +1,2 @@
+from .PlayerPool import PlayerPool
+from .PooledPlayerProcess import PooledPlayerProcess
@@ -1,7 +1,10 @@
 
 from service.TimeManager import TimeManager
-from multiprocessing import Process, Queue
+from multiprocessing import Process, Queue, Pipe
+from queue import Empty
+import random
 import sys
+import time
 
 class PlayerProcess():
     """
@@ -15,15 +18,19 @@ class PlayerProcess():
         data (any) : The data to be sent to the Process
         
         dataQueue (Queue) : The queue used to send data to the process
-        resultQueue (Queue) : The queue used to get the result from the process
+        results (Connection) : The end of the pipe through which the process sends its results
+        resultSender (Connection) : The other end, used by the process only, closed here once it started
+        pending (list) : Results already received by wait, not yet checked
 
         model (Model) : The game model, containing teamsData in which we place the response
         teamId (string) : The team identifier, for placing the result in the correct teamsData
 
         stopwatch (TimeManager) : Used to monitor process response time
+        lastResponseTime (int) : Wall-clock time the player took to answer, in milliseconds
+        lastCpuTime (double) : CPU time the process of the player spent computing the same response, in milliseconds
     """
 
-    def __init__(self, model, teamId, player):
+    def __init__(self, model, teamId, player, seed = None):
         """
         Creates a new process to run a player's tick.
 
@@ -31,24 +38,34 @@ class PlayerProcess():
             model (Model) : Access to the model of the game
             teamId (string) : The team to operate
             player (Player) : The player to call
+            seed (any) : Seed of the random module in the process, so that seeded games are reproducible
         """
 
+        (results, self._resultSender) = Pipe(duplex = False)
+        self._initialize(model, teamId, results)
+
         self._target = runPlayerProcess
+        self._dataQueue = Queue()
+
+        self._args = (self._dataQueue, self._resultSender, player, seed)
+
+        self._process = Process(target=self._target, args=self._args)
 
+    def _initialize(self, model, teamId, results):
+        """
+        Sets what does not depend on how the process of the player is started, the responses coming through results.
+        """
         self._data = None
-        self._dataQueue = Queue()
-        self._resultQueue = Queue()
+        self._results = results
+        self._pending = list()
 
         self._model = model
         self._teamId = teamId
 
         self._stopwatch = TimeManager()
 
-        self._args = (self._dataQueue, self._resultQueue, player)
-
-        self._process = Process(target=self._target, args=self._args)
-
         self.lastResponseTime = None
+        self.lastCpuTime = None
 
     def setData(self, pollingData):
         """
@@ -68,28 +85,81 @@ class PlayerProcess():
         self._stopwatch.StartTimer()
         self._dataQueue.put(self._data)
 
+    def wait(self, timeoutMs):
+        """
+        Blocks until the player has sent a response or timeoutMs milliseconds have passed.
+
+        The response is kept for the next call to check.
+
+        Returns:
+            received (bool) : Whether a response is available.
+        """
+        if self._pending:
+            return True
+
+        try:
+            if not self._results.poll(max(timeoutMs, 0) / 1000):
+                return False
+
+            self._pending.append(self._results.recv())
+        except (EOFError, OSError):
+            # The process is gone, it will not answer
+            return False
+
+        self.lastResponseTime = self._stopwatch.DeltaTimeMs()
+        return True
+
+    def waitable(self):
+        """
+        Returns:
+            connection (Connection) : Ready for multiprocessing.connection.wait when the player sent a response, so
+                that many players can be waited for at once.
+        """
+        return self._results
+
     def check(self):
         """
         Checks if the player has sent a response, and places it in teamsData[team]
 
         If no response is given, None is placed.
+
+        Returns:
+            received (bool) : Whether a new response was placed.
         """
         try: 
-            result = self._resultQueue.get(False)
+            (result, self.lastCpuTime) = self._nextResult()
 
             # In case of player pass turn
-            while not self._resultQueue.empty() and result == {}:
-                result = self._resultQueue.get(False)
+            while result == {} and self._results.poll():
+                (result, self.lastCpuTime) = self._nextResult()
 
-            self.lastResponseTime = self._stopwatch.DeltaTimeMs()
-            
         except:
             if self._model.teamsData[self._teamId] == None:
                 result = None
             else:
                 result = self._model.teamsData[self._teamId]
 
+            self._model.teamsData[self._teamId] = result
+            return False
+
         self._model.teamsData[self._teamId] = result
+        return True
+
+    def _nextResult(self):
+        """
+        Takes the oldest response and the CPU time spent on it, starting with the ones put aside by wait.
+
+        Raises Empty if there is none.
+        """
+        if self._pending:
+            return self._pending.pop(0)
+
+        if not self._results.poll():
+            raise Empty
+
+        result = self._results.recv()
+        self.lastResponseTime = self._stopwatch.DeltaTimeMs()
+        return result
 
     def start(self):
         """
@@ -97,6 +167,9 @@ class PlayerProcess():
         """
         self._process.start()
 
+        # Only the process writes to the pipe : the results end reports the end of file as soon as it dies
+        self._resultSender.close()
+
     def join(self, timeout = None):
         """
         Waits until process termination.
@@ -109,8 +182,26 @@ class PlayerProcess():
         """
         self._process.kill()
 
-def runPlayerProcess(dataQueue, resultQueue, player):
-        while True:
-            pollingData = dataQueue.get()
+def runPlayerProcess(dataQueue, resultSender, player, seed):
+        if seed is not None:
+            random.seed(seed)
+
+        pollPlayer(dataQueue.get, resultSender, player)
+
+def pollPlayer(receive, resultSender, player):
+    """
+    Answers polling data until the process is stopped, each response sent with the CPU time spent on it.
+
+    Parameters:
+        receive (function) : Blocks until the next polling data comes, and returns it.
+        resultSender (Connection) : Where the responses are sent.
+        player (Player) : The player to call.
+    """
+    while True:
+        pollingData = receive()
+
+        # CPU time of this process only, whatever the load of the host
+        start = time.process_time()
+        result = player.poll(pollingData)
 
-            resultQueue.put(player.poll(pollingData))
\ No newline at end of file
+        resultSender.send((result, (time.process_time() - start) * 1000))
@@ -0,0 +1,123 @@
+from service.TimeManager import TimeManager
+from queue import Empty
+
+class RelayedPlayerProcess():
+    """
+    Stands for a PlayerProcess when the player does not run in a process of its own that the game started : same
+    interface, the responses being relayed by something else, a PlayerPool or a PlayerServer.
+
+    Subclasses send the polling data in execute and receive the responses in _receive, with the CPU time spent on
+    them when it is measured.
+
+    Attributes:
+        player (any) : How the player is reached, None if it failed to initialize.
+        data (any) : The data to be sent to the player
+        pending (list) : (response, CPU time) already received by wait, not yet checked
+
+        model (Model) : The game model, containing teamsData in which we place the response
+        teamId (string) : The team identifier, for placing the result in the correct teamsData
+
+        stopwatch (TimeManager) : Used to monitor process response time
+        lastResponseTime (int) : Wall-clock time the player took to answer, in milliseconds
+        lastCpuTime (double) : CPU time spent computing the same response, in milliseconds, None when not measured
+    """
+
+    def __init__(self, model, teamId, player):
+        self._player = player
+        self._data = None
+        self._pending = list()
+
+        self._model = model
+        self._teamId = teamId
+
+        self._stopwatch = TimeManager()
+
+        self.lastResponseTime = None
+        self.lastCpuTime = None
+
+    def setData(self, pollingData):
+        self._data = pollingData
+
+    def execute(self):
+        raise NotImplementedError
+
+    def wait(self, timeoutMs):
+        """
+        Blocks until the player has sent a response or timeoutMs milliseconds have passed.
+
+        Returns:
+            received (bool) : Whether a response is available.
+        """
+        if self._pending:
+            return True
+
+        try:
+            self._pending.append(self._nextResponse(timeoutMs))
+        except Empty:
+            return False
+
+        return True
+
+    def waitable(self):
+        """
+        Returns:
+            connection (Connection) : None, the responses are not received through a connection of this player.
+        """
+        return None
+
+    def check(self):
+        """
+        Checks if the player has sent a response, and places it in teamsData[team], the same way PlayerProcess.check
+        does.
+
+        Returns:
+            received (bool) : Whether a new response was placed.
+        """
+        if self._pending:
+            (result, self.lastCpuTime) = self._pending.pop(0)
+        else:
+            try:
+                (result, self.lastCpuTime) = self._nextResponse(0)
+            except Empty:
+                return False
+
+        # In case of player pass turn
+        while result == {}:
+            try:
+                (result, self.lastCpuTime) = self._nextResponse(0)
+            except Empty:
+                break
+
+        self._model.teamsData[self._teamId] = result
+        return True
+
+    def _nextResponse(self, timeoutMs):
+        """
+        Returns:
+            (result, cpuTime) : The next response of the player, timed, see _receive. Raises Empty if it did not come
+                in time.
+        """
+        if self._player is None:
+            raise Empty
+
+        received = self._receive(timeoutMs)
+        self.lastResponseTime = self._stopwatch.DeltaTimeMs()
+
+        return received
+
+    def _receive(self, timeoutMs):
+        """
+        Returns:
+            (result, cpuTime) : The next response of the player and the CPU time spent on it in milliseconds, None
+                when not measured. Raises Empty if it did not come within timeoutMs milliseconds.
+        """
+        raise NotImplementedError
+
+    def start(self):
+        pass
+
+    def join(self, timeout = None):
+        pass
+
+    def kill(self):
+        raise NotImplementedError
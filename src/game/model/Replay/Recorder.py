@@ -0,0 +1,62 @@
+
+class Recorder:
+    """
+    Interface for objects following a game as it is played, usually to write it somewhere.
+
+    Every method does nothing by default, implement the ones you need.
+    The GameModel calls them in this order : beginGame, then for each tick beginTick, recordTime and recordResponse as
+    many times as they occur, and endTick. close is called when the game is stopped.
+    """
+
+    def beginGame(self, model):
+        """
+        Called once the map, the ruleset and the seed of the game are known, before any bot is created.
+
+        Parameters:
+            model (GameModel) : The game being recorded.
+        """
+        pass
+
+    def beginTick(self, deltaTime):
+        """
+        Called at the start of GameModel.tick.
+
+        Parameters:
+            deltaTime (int) : The time in milliseconds since the last tick.
+        """
+        pass
+
+    def recordTime(self, timeMs):
+        """
+        Called each time the game reads its stopwatch.
+
+        Parameters:
+            timeMs (int) : The time that was read, in milliseconds.
+        """
+        pass
+
+    def recordResponse(self, teamId, received, response):
+        """
+        Called each time the game checks for a player response.
+
+        Parameters:
+            teamId (string) : The team that was checked.
+            received (bool) : Whether a new response arrived.
+            response (dict) : The new response, None when nothing arrived.
+        """
+        pass
+
+    def endTick(self, model):
+        """
+        Called at the end of GameModel.tick.
+
+        Parameters:
+            model (GameModel) : The game being recorded.
+        """
+        pass
+
+    def close(self):
+        """
+        Called when the game is stopped. Nothing will be recorded afterwards.
+        """
+        pass
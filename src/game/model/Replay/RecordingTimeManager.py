@@ -0,0 +1,27 @@
+from service.TimeManager import TimeManager
+
+class RecordingTimeManager(TimeManager):
+    """
+    A TimeManager that reports every time it reads to recorders.
+
+    Every method of TimeManager reads the time through GetTimeMs, so the recorders see each value the game used.
+
+    Attributes:
+        timeManager (TimeManager) : The TimeManager actually giving the time.
+        recorders (list(Recorder)) : Who to report to.
+    """
+
+    def __init__(self, timeManager, recorders):
+        self._timeManager = timeManager
+        self._recorders = recorders
+
+    def GetTimeMs(self):
+        timeMs = self._timeManager.GetTimeMs()
+
+        for recorder in self._recorders:
+            recorder.recordTime(timeMs)
+
+        return timeMs
+
+    def Sleep(self, ms):
+        self._timeManager.Sleep(ms)
@@ -0,0 +1,90 @@
+import struct
+
+class ReplayEncoding:
+    """
+    Constants and helpers shared by ReplayRecorder and ReplayReader.
+
+    A replay file starts with MAGIC, followed by the length of a JSON header on 4 bytes (big endian) and the header itself.
+    The rest of the file is a zlib stream of events, each starting with one of the tags below.
+
+    Events:
+        TIME (zigzag varint) : The stopwatch was read, the value is the difference with the previous read.
+        TICK (double) : A tick started, with this deltaTime.
+        TICK_SAME : A tick started, with the same deltaTime as the previous one.
+        NO_RESPONSE (team byte) : A player was checked without a new response.
+        RESPONSE_PASS (team byte) : A player answered {}.
+        RESPONSE_BOTS (team byte, varint count, then per bot : varint bot index, types byte, 3 doubles, varint actions) :
+            A player answered orders for its bots. Bit i of the types byte is set when the i-th value of
+            targetPosition was an int.
+        RESPONSE_NONE (team byte) : A player answered None.
+        RESPONSE_DECODED (team byte, orders like RESPONSE_BOTS, varint rejected) : A player answered something else
+            that does not fit RESPONSE_BOTS. It is written the way the game decodes it (see ResponseDecoder) : the
+            orders accepted and the number of entries rejected, which is all the game uses of it. Nothing sent by a
+            player is ever unpickled or evaluated when replaying.
+        BOTS (per bot : changes byte, then a double per changed field) : State of every bot at the end of a tick.
+            Bit i of the changes byte is set when BOT_FIELDS[i] changed since the previous BOTS event.
+        END (zigzag varint) : The game is over, with this winner (0 for none).
+    """
+
+    MAGIC = b"CTFREPLAY\x02"
+
+    TIME             = 0x01
+    TICK             = 0x02
+    TICK_SAME        = 0x03
+    NO_RESPONSE      = 0x10
+    RESPONSE_PASS    = 0x11
+    RESPONSE_BOTS    = 0x12
+    RESPONSE_NONE    = 0x13
+    RESPONSE_DECODED = 0x14
+    BOTS             = 0x20
+    END              = 0x30
+
+    BOT_FIELDS = ("x", "y", "angle", "speed", "health", "flag")
+
+    DOUBLE = struct.Struct("<d")
+
+    @staticmethod
+    def getBotValues(bot):
+        """
+        Returns:
+            values (tuple) : The value of each of BOT_FIELDS for this bot.
+        """
+        return (bot.x, bot.y, bot.angle, bot.speed, bot.health, bot.flag())
+
+    @staticmethod
+    def writeVarint(buffer, value):
+        """
+        Appends a positive integer to a bytearray, 7 bits per byte.
+        """
+        while value > 0x7F:
+            buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    @staticmethod
+    def readVarint(data, offset):
+        """
+        Returns:
+            (value, offset) : The integer read and the offset following it.
+        """
+        value = 0
+        shift = 0
+        while True:
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return (value, offset)
+            shift += 7
+
+    @staticmethod
+    def writeSignedVarint(buffer, value):
+        """
+        Appends any integer to a bytearray, small negative values staying small (zigzag encoding).
+        """
+        ReplayEncoding.writeVarint(buffer, value * 2 if value >= 0 else -value * 2 - 1)
+
+    @staticmethod
+    def readSignedVarint(data, offset):
+        (value, offset) = ReplayEncoding.readVarint(data, offset)
+        return (value >> 1 if value & 1 == 0 else -(value >> 1) - 1, offset)
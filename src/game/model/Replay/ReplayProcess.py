@@ -0,0 +1,57 @@
+
+class ReplayProcess():
+    """
+    Stands for a PlayerProcess during a replay : each check gives the response recorded for the same check.
+
+    Attributes:
+        model (Model) : The game model, containing teamsData in which we place the response
+        teamId (string) : The team identifier, for placing the result in the correct teamsData
+        reader (ReplayReader) : The replay being played.
+    """
+
+    def __init__(self, model, teamId, reader):
+        self._model = model
+        self._teamId = teamId
+        self._reader = reader
+
+        self.lastResponseTime = None
+        self.lastCpuTime = None # recorded responses already passed their budget
+
+    def setData(self, pollingData):
+        pass
+
+    def execute(self):
+        pass
+
+    def wait(self, timeoutMs):
+        return True
+
+    def waitable(self):
+        """
+        Returns:
+            connection (Connection) : None, recorded responses are always available.
+        """
+        return None
+
+    def check(self):
+        """
+        Places the recorded response in teamsData[team], the same way PlayerProcess.check did.
+
+        Returns:
+            received (bool) : Whether a new response was recorded for this check.
+        """
+        (received, response) = self._reader.readResponse(self._teamId)
+
+        if received:
+            self._model.teamsData[self._teamId] = response
+
+        return received
+
+    def start(self):
+        pass
+
+    def join(self, timeout = None):
+        pass
+
+    def kill(self):
+        pass
@@ -0,0 +1,253 @@
+from model.Replay.ReplayEncoding import ReplayEncoding
+from model.Replay.ReplayProcess import ReplayProcess
+from model.Replay.ReplayTimeManager import ReplayTimeManager
+from service.Config import Config
+from service.Ruleset import Ruleset
+
+import json
+import struct
+import zlib
+
+class ReplayReader:
+    """
+    Plays again a game written by ReplayRecorder, without any player process.
+
+    The game model is rebuilt with the recorded seed, ruleset and map, then fed the recorded times and responses.
+    Since the model is deterministic, this reproduces the game exactly, which is checked against the recorded bot states.
+
+    Attributes:
+        header (dict) : seed, map, mapHash, ruleset, timeRate and bots of the recorded game.
+        data (bytes) : The decompressed events.
+        offset (int) : Position of the next event in data.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as replayFile:
+            content = replayFile.read()
+
+        if not content.startswith(ReplayEncoding.MAGIC):
+            raise Exception("{} is not a replay file".format(path))
+
+        offset = len(ReplayEncoding.MAGIC)
+        (headerLength,) = struct.unpack_from(">I", content, offset)
+        offset += 4
+
+        self.header = json.loads(content[offset : offset + headerLength].decode())
+
+        # A game that was never closed still has every event up to its last flush
+        self._data = zlib.decompressobj().decompress(content[offset + headerLength:])
+        self._offset = 0
+
+        self._botIds = self.header["bots"]
+        self._lastTimeMs = 0
+        self._lastDeltaTime = None
+        self._lastBotValues = dict()
+
+        self.winner = None
+
+    def replay(self, verify = True, onTick = None, recorders = None):
+        """
+        Plays the whole game again.
+
+        Config and Ruleset must be initialized, the recorded ruleset replaces the current one until the game is over.
+
+        Parameters:
+            verify (bool) : Raise an exception as soon as a bot differs from its recorded state.
+            onTick (function(GameModel)) : Called after each tick.
+            recorders (list(Recorder)) : Objects following the replayed game, to write it in another format.
+
+        Returns:
+            model (GameModel) : The game, in its final state.
+        """
+        ruleset = Ruleset.GetRuleset()
+        (savedRuleset, savedTimeRate) = (dict(ruleset), Config.config.parser["Gameplay"]["TimeRate"])
+
+        for (attribute, value) in self.header["ruleset"].items():
+            Ruleset.SetRulesetValue(attribute, value)
+        Config.SetConfigValue("Gameplay", "TimeRate", self.header["timeRate"])
+
+        try:
+            return self._replay(verify, onTick, recorders)
+        finally:
+            for attribute in list(ruleset.keys()):
+                if attribute not in savedRuleset:
+                    del ruleset[attribute]
+
+            for (attribute, value) in savedRuleset.items():
+                Ruleset.SetRulesetValue(attribute, value)
+            Config.SetConfigValue("Gameplay", "TimeRate", savedTimeRate)
+
+    def _replay(self, verify, onTick, recorders):
+        """
+        Plays the whole game again, once the recorded ruleset is set, see replay.
+        """
+        # Imported here because the model imports this package
+        from model.GameModel import GameModel
+
+        model = GameModel(None, None, self.header["map"], seed = self.header["seed"], recorders = recorders, replay = self)
+
+        while self._offset < len(self._data):
+            tag = self._data[self._offset]
+
+            if tag == ReplayEncoding.END:
+                (self.winner, self._offset) = ReplayEncoding.readSignedVarint(self._data, self._offset + 1)
+                break
+
+            if tag == ReplayEncoding.TIME:
+                # Read outside of a tick, after the last one
+                self.readTime()
+                continue
+
+            model.tick(self._readTick())
+            self._readBots(model, verify)
+
+            if onTick is not None:
+                onTick(model)
+
+        model.stop()
+        return model
+
+    def createTimeManager(self):
+        """
+        Returns:
+            timeManager (TimeManager) : The stopwatch to give to the replayed model.
+        """
+        return ReplayTimeManager(self)
+
+    def createPlayerProcess(self, model, teamId):
+        """
+        Returns:
+            process (ReplayProcess) : What the replayed model uses instead of a PlayerProcess.
+        """
+        return ReplayProcess(model, teamId, self)
+
+    def readTime(self):
+        """
+        Returns:
+            timeMs (int) : The next time read by the recorded game.
+        """
+        self._expect(ReplayEncoding.TIME)
+
+        (delta, self._offset) = ReplayEncoding.readSignedVarint(self._data, self._offset + 1)
+        self._lastTimeMs += delta
+
+        return self._lastTimeMs
+
+    def readResponse(self, teamId):
+        """
+        Returns:
+            (received, response) : The next check of this player in the recorded game.
+        """
+        tag = self._data[self._offset] if self._offset < len(self._data) else None
+
+        if tag not in (ReplayEncoding.NO_RESPONSE, ReplayEncoding.RESPONSE_PASS, ReplayEncoding.RESPONSE_BOTS,
+                ReplayEncoding.RESPONSE_NONE, ReplayEncoding.RESPONSE_DECODED):
+            self._expect(ReplayEncoding.NO_RESPONSE)
+
+        if str(self._data[self._offset + 1]) != teamId:
+            raise Exception("Replay diverged : expected a response from player {}".format(teamId))
+
+        offset = self._offset + 2
+
+        if tag == ReplayEncoding.NO_RESPONSE:
+            (received, response) = (False, None)
+
+        elif tag == ReplayEncoding.RESPONSE_PASS:
+            (received, response) = (True, {})
+
+        elif tag == ReplayEncoding.RESPONSE_NONE:
+            (received, response) = (True, None)
+
+        elif tag == ReplayEncoding.RESPONSE_DECODED:
+            (response, offset) = self._readOrders(offset)
+            (rejected, offset) = ReplayEncoding.readVarint(self._data, offset)
+
+            # Entries the game rejects as well, one per entry it rejected
+            for i in range(rejected):
+                response["bots"][("rejected", i)] = None
+
+            received = True
+
+        else:
+            (response, offset) = self._readOrders(offset)
+            received = True
+
+        self._offset = offset
+        return (received, response)
+
+    def _readOrders(self, offset):
+        """
+        Returns:
+            (response, offset) : The orders of RESPONSE_BOTS starting at offset as a response, and the offset following
+                them.
+        """
+        response = { "bots": {} }
+        (count, offset) = ReplayEncoding.readVarint(self._data, offset)
+
+        for i in range(count):
+            (botIndex, offset) = ReplayEncoding.readVarint(self._data, offset)
+            types = self._data[offset]
+            offset += 1
+
+            target = list()
+            for j in range(3):
+                (value,) = ReplayEncoding.DOUBLE.unpack_from(self._data, offset)
+                offset += ReplayEncoding.DOUBLE.size
+                target.append(int(value) if types & (1 << j) else value)
+
+            (actions, offset) = ReplayEncoding.readVarint(self._data, offset)
+
+            response["bots"][self._botIds[botIndex]] = { "targetPosition": tuple(target), "actions": actions }
+
+        return (response, offset)
+
+    def _readTick(self):
+        """
+        Returns:
+            deltaTime (float) : The deltaTime of the tick starting at the current event.
+        """
+        tag = self._data[self._offset]
+
+        if tag == ReplayEncoding.TICK_SAME:
+            self._offset += 1
+        else:
+            self._expect(ReplayEncoding.TICK)
+            (self._lastDeltaTime,) = ReplayEncoding.DOUBLE.unpack_from(self._data, self._offset + 1)
+            self._offset += 1 + ReplayEncoding.DOUBLE.size
+
+        return self._lastDeltaTime
+
+    def _readBots(self, model, verify):
+        """
+        Reads the BOTS event ending a tick and compares it to the model.
+        """
+        self._expect(ReplayEncoding.BOTS)
+        offset = self._offset + 1
+
+        for (botId, bot) in model.getAllBots().items():
+            changes = self._data[offset]
+            offset += 1
+
+            values = list(self._lastBotValues.get(botId, [None] * len(ReplayEncoding.BOT_FIELDS)))
+            for i in range(len(values)):
+                if changes & (1 << i):
+                    (values[i],) = ReplayEncoding.DOUBLE.unpack_from(self._data, offset)
+                    offset += ReplayEncoding.DOUBLE.size
+
+            self._lastBotValues[botId] = values
+
+            if verify and tuple(values) != ReplayEncoding.getBotValues(bot):
+                raise Exception("Replay diverged at turn {} : bot {} is {} instead of {}".format(
+                    model.turn, botId, ReplayEncoding.getBotValues(bot), tuple(values)))
+
+        self._offset = offset
+
+    def _expect(self, tag):
+        """
+        Raises an exception if the next event is not a tag event.
+        """
+        if self._offset >= len(self._data):
+            raise Exception("Replay ended before the game did")
+
+        if self._data[self._offset] != tag:
+            raise Exception("Replay diverged : expected event {} but found {}".format(tag, self._data[self._offset]))
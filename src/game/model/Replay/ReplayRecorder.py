@@ -0,0 +1,203 @@
+from model.Replay.Recorder import Recorder
+from model.Replay.ReplayEncoding import ReplayEncoding
+from model.ResponseDecoder import ResponseDecoder
+from service.Config import Config
+
+import hashlib
+import json
+import struct
+import zlib
+
+class ReplayRecorder(Recorder):
+    """
+    Writes a game in a compact binary file that ReplayReader can play again without the players.
+
+    Everything the game depends on is written : the seed, every time read and every player response.
+    The state of the bots is written after each tick as well, only the fields that changed, to check the replay.
+    See ReplayEncoding for the format.
+
+    Attributes:
+        path (string) : The file to write.
+        buffer (bytearray) : Events not compressed yet.
+    """
+
+    FLUSH_SIZE = 1 << 16
+    """
+    Size of the buffer at which events are compressed and written, at the end of a tick.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._file = None
+        self._compressor = zlib.compressobj(9)
+        self._buffer = bytearray()
+
+        self._botIndexes = dict()
+        self._decoders = dict()
+        self._lastTimeMs = 0
+        self._lastDeltaTime = None
+        self._lastBotValues = dict()
+        self._winner = None
+
+    def beginGame(self, model):
+        ruleset = model.getRuleset()
+        botsCount = int(ruleset["BotsCount"])
+        botIds = [str(team) + "_" + str(i) for team in range(1, 3) for i in range(botsCount)]
+
+        with open(model.getMapFile(), "rb") as mapFile:
+            mapHash = hashlib.sha1(mapFile.read()).hexdigest()
+
+        header = json.dumps({
+            "seed": model.seed,
+            "map": model.getMapFile(),
+            "mapHash": mapHash,
+            "ruleset": dict(ruleset),
+            "timeRate": Config.TimeRate(),
+            "bots": botIds,
+        }).encode()
+
+        self._botIndexes = { botId: index for (index, botId) in enumerate(botIds) }
+        self._decoders = { str(team): ResponseDecoder(botIds[(team - 1) * botsCount : team * botsCount]) for team in range(1, 3) }
+
+        self._file = open(self._path, "wb")
+        self._file.write(ReplayEncoding.MAGIC)
+        self._file.write(struct.pack(">I", len(header)))
+        self._file.write(header)
+
+    def beginTick(self, deltaTime):
+        if deltaTime == self._lastDeltaTime:
+            self._buffer.append(ReplayEncoding.TICK_SAME)
+        else:
+            self._buffer.append(ReplayEncoding.TICK)
+            self._buffer += ReplayEncoding.DOUBLE.pack(deltaTime)
+            self._lastDeltaTime = deltaTime
+
+    def recordTime(self, timeMs):
+        self._buffer.append(ReplayEncoding.TIME)
+        ReplayEncoding.writeSignedVarint(self._buffer, timeMs - self._lastTimeMs)
+        self._lastTimeMs = timeMs
+
+    def recordResponse(self, teamId, received, response):
+        if not received:
+            self._buffer.append(ReplayEncoding.NO_RESPONSE)
+            self._buffer.append(int(teamId))
+        elif response is None:
+            self._buffer.append(ReplayEncoding.RESPONSE_NONE)
+            self._buffer.append(int(teamId))
+        elif response == {}:
+            self._buffer.append(ReplayEncoding.RESPONSE_PASS)
+            self._buffer.append(int(teamId))
+        else:
+            encoded = self._encodeBots(response)
+
+            if encoded is not None:
+                self._buffer.append(ReplayEncoding.RESPONSE_BOTS)
+                self._buffer.append(int(teamId))
+                self._buffer += encoded
+            else:
+                self._buffer.append(ReplayEncoding.RESPONSE_DECODED)
+                self._buffer.append(int(teamId))
+                self._buffer += self._encodeDecoded(teamId, response)
+
+    def _encodeBots(self, response):
+        """
+        Encodes a well formed response for RESPONSE_BOTS.
+
+        Returns:
+            encoded (bytearray) : The encoded response, None if it does not have the expected shape.
+        """
+        if type(response) is not dict or response.keys() != { "bots" } or type(response["bots"]) is not dict:
+            return None
+
+        encoded = bytearray()
+        ReplayEncoding.writeVarint(encoded, len(response["bots"]))
+
+        for (botId, orders) in response["bots"].items():
+            if botId not in self._botIndexes or type(orders) is not dict or orders.keys() != { "targetPosition", "actions" }:
+                return None
+
+            target = orders["targetPosition"]
+            actions = orders["actions"]
+
+            if type(target) is not tuple or len(target) != 3 or type(actions) is not int or actions < 0:
+                return None
+
+            types = 0
+            for (i, value) in enumerate(target):
+                if type(value) is int and abs(value) < 2 ** 53:
+                    types |= 1 << i
+                elif type(value) is not float:
+                    return None
+
+            ReplayEncoding.writeVarint(encoded, self._botIndexes[botId])
+            encoded.append(types)
+            for value in target:
+                encoded += ReplayEncoding.DOUBLE.pack(value)
+            ReplayEncoding.writeVarint(encoded, actions)
+
+        return encoded
+
+    def _encodeDecoded(self, teamId, response):
+        """
+        Encodes any other response for RESPONSE_DECODED, as the game decodes it.
+
+        Returns:
+            encoded (bytearray) : The orders accepted, then the number of entries rejected.
+        """
+        decoder = self._decoders[teamId]
+        rejected = decoder.decode(response)
+
+        orders = dict()
+
+        for row in decoder.rows:
+            (targetX, targetY, speed, actions) = decoder.order(row)
+            orders[decoder.botIds[row]] = { "targetPosition": (targetX, targetY, speed), "actions": actions }
+
+        encoded = self._encodeBots({ "bots": orders })
+        ReplayEncoding.writeVarint(encoded, rejected)
+
+        return encoded
+
+    def endTick(self, model):
+        self._buffer.append(ReplayEncoding.BOTS)
+
+        for (botId, bot) in model.getAllBots().items():
+            values = ReplayEncoding.getBotValues(bot)
+            lastValues = self._lastBotValues.get(botId)
+
+            changes = 0
+            for i in range(len(values)):
+                if lastValues is None or values[i] != lastValues[i]:
+                    changes |= 1 << i
+
+            self._buffer.append(changes)
+            for i in range(len(values)):
+                if changes & (1 << i):
+                    self._buffer += ReplayEncoding.DOUBLE.pack(values[i])
+
+            self._lastBotValues[botId] = values
+
+        self._winner = model.winner
+
+        if len(self._buffer) >= ReplayRecorder.FLUSH_SIZE:
+            self._flush(zlib.Z_SYNC_FLUSH)
+
+    def close(self):
+        if self._file is None:
+            return
+
+        self._buffer.append(ReplayEncoding.END)
+        ReplayEncoding.writeSignedVarint(self._buffer, self._winner or 0)
+
+        self._flush(zlib.Z_FINISH)
+        self._file.close()
+        self._file = None
+
+    def _flush(self, mode):
+        """
+        Compresses and writes the buffered events. Z_SYNC_FLUSH keeps the file readable if the game is never closed.
+        """
+        self._file.write(self._compressor.compress(bytes(self._buffer)))
+        self._file.write(self._compressor.flush(mode))
+        self._file.flush()
+        self._buffer = bytearray()
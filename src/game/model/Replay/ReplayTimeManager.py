@@ -0,0 +1,21 @@
+from service.TimeManager import TimeManager
+
+class ReplayTimeManager(TimeManager):
+    """
+    A TimeManager giving back, in order, the times read during a recorded game.
+
+    Attributes:
+        reader (ReplayReader) : The replay being played.
+    """
+
+    def __init__(self, reader):
+        self._reader = reader
+
+    def GetTimeMs(self):
+        return self._reader.readTime()
+
+    def Sleep(self, ms):
+        """
+        Nothing to wait for, the next time read comes from the replay.
+        """
+        pass
@@ -0,0 +1,58 @@
+import struct
+
+class TimelineFormat:
+    """
+    Layout of a timeline file, written by TimelineRecorder and read by TimelineReader.
+
+    A timeline file starts with MAGIC, followed by the length of a JSON header on 4 bytes (big endian) and the header
+    itself, padded with spaces so that the frames start on a multiple of 8 bytes.
+
+    Then comes one frame per tick. A frame is an array of doubles (in the byte order given by the header) that holds
+    everything needed to draw this tick, so that any tick can be read on its own :
+        STATE_FIELDS, then BOT_FIELDS for each bot, FLAG_FIELDS for each flag, EFFECT_FIELDS for each effect
+        and SHOT_FIELDS for as many shots as there are bots (team 0 for an unused one).
+
+    Every keyframeInterval-th frame is a keyframe. Once the game is closed, the time of each keyframe is written after
+    the frames as an array of doubles, followed by FOOTER. This index finds the frame played at a given time without
+    going through the file. A file without footer (the game did not close) is still readable, its index is rebuilt.
+
+    Attributes:
+        botsCount (int) : Number of bots, of both teams.
+        flagsCount (int) : Number of flags on the map.
+        effectsCount (int) : Number of effects on the map.
+        frameLength (int) : Number of doubles in a frame.
+        frameSize (int) : Number of bytes in a frame.
+    """
+
+    MAGIC = b"CTFTIMELINE\x01"
+
+    FOOTER_MAGIC = b"CTFINDEX"
+
+    FOOTER = struct.Struct("<QQ8s")
+    """
+    Number of frames, number of keyframes, FOOTER_MAGIC.
+    """
+
+    RUNNING = -1
+    """
+    Value of the status field while the game is not over. Once over, the status is the winner (0 for a draw).
+    """
+
+    STATE_FIELDS = ("turn", "timeMs", "countdown", "status")
+    BOT_FIELDS = ("x", "y", "angle", "speed", "health", "flag")
+    FLAG_FIELDS = ("x", "y", "held")
+    EFFECT_FIELDS = ("x", "y", "used")
+    SHOT_FIELDS = ("startX", "startY", "endX", "endY", "team")
+
+    def __init__(self, botsCount, flagsCount, effectsCount):
+        self.botsCount = botsCount
+        self.flagsCount = flagsCount
+        self.effectsCount = effectsCount
+
+        self.botsOffset = len(TimelineFormat.STATE_FIELDS)
+        self.flagsOffset = self.botsOffset + botsCount * len(TimelineFormat.BOT_FIELDS)
+        self.effectsOffset = self.flagsOffset + flagsCount * len(TimelineFormat.FLAG_FIELDS)
+        self.shotsOffset = self.effectsOffset + effectsCount * len(TimelineFormat.EFFECT_FIELDS)
+
+        self.frameLength = self.shotsOffset + botsCount * len(TimelineFormat.SHOT_FIELDS)
+        self.frameSize = self.frameLength * 8
@@ -0,0 +1,164 @@
+from model.Model import Model
+from model.PhysicsEngine import PhysicsEngine
+from model.Replay.TimelineFormat import TimelineFormat
+from domain.Map import *
+from domain.GameObject.Bot import *
+
+class TimelineModel(Model):
+    """
+    Plays a timeline file with the same interface as GameModel, so that the game can be watched with the usual views.
+
+    Nothing is simulated : each tick, the frame recorded at the current time is read from the file.
+
+    Attributes:
+        reader (TimelineReader) : The timeline being watched.
+        currentTick (int) : Index of the frame being displayed.
+        timeMs (double) : Time of the game being displayed, in milliseconds.
+        playing (bool) : Whether time passes, False while paused.
+        speed (double) : How much faster than real time the game is played.
+    """
+
+    def __init__(self, reader):
+        """
+        Parameters:
+            reader (TimelineReader) : The timeline to watch.
+        """
+        self._reader = reader
+
+        # The map is generated again to get the same blocks, its objects are then moved as recorded
+        self._map = RegularMap(RegularMap.loadMapData(reader.header["map"]), reader.header["seed"])
+        self._ruleset = reader.header["ruleset"]
+
+        self._engine = PhysicsEngine(self._ruleset, self._map)
+
+        self._teams = { "1": { "bots": {} }, "2": { "bots": {} } }
+
+        for botId in reader.header["bots"]:
+            team = botId.split("_")[0]
+            self._teams[team]["bots"][botId] = RegularBot(int(team), 0, 0)
+
+        self._effects = self._map.objects.get("Effect", [])
+
+        self.mouseCoords = (0, 0)
+        self.shoots = []
+
+        self.playing = True
+        self.speed = 1
+
+        self.seek(0)
+
+    def tick(self, deltaTime):
+        """
+        Moves forward by deltaTime milliseconds of game time (multiplied by speed) unless paused.
+        """
+        previousTick = self.currentTick
+
+        if self.playing and self.currentTick < self._reader.framesCount - 1:
+            self.seekTime(self.timeMs + deltaTime * self.speed)
+            self.timeMs = max(self.timeMs, self._reader.timeMs(self.currentTick))
+
+        if self.currentTick == previousTick:
+            # The view draws the shoots it is given once, they already were
+            self.shoots = []
+
+    def seekTime(self, timeMs):
+        """
+        Displays the last tick played at or before timeMs.
+        """
+        self.seek(self._reader.tickAt(timeMs))
+        self.timeMs = max(timeMs, 0)
+
+    def seek(self, tick):
+        """
+        Displays a tick, given by its index in the timeline.
+        """
+        if self._reader.framesCount == 0:
+            # The game stopped before its first tick, there is nothing to display
+            raise Exception("This timeline is empty")
+
+        tick = min(max(tick, 0), self._reader.framesCount - 1)
+        frame = self._reader.frame(tick).tolist()
+
+        self.currentTick = tick
+        self._visibility = None
+        (self.turn, self.timeMs, self.countdownremaining, status) = frame[:len(TimelineFormat.STATE_FIELDS)]
+
+        self.game_over = status != TimelineFormat.RUNNING
+        self.winner = int(status) if self.game_over and status != 0 else None
+
+        fields = frame[self._reader.format.botsOffset : self._reader.format.flagsOffset]
+        for (i, bot) in enumerate(self.getAllBots().values()):
+            (bot.x, bot.y, bot.angle, bot.speed, bot.health, heldFlag) = fields[i * 6 : i * 6 + 6]
+
+        fields = frame[self._reader.format.flagsOffset : self._reader.format.effectsOffset]
+        for (i, flag) in enumerate(self._map.flags):
+            (flag.x, flag.y, held) = fields[i * 3 : i * 3 + 3]
+            flag.held = bool(held)
+
+        fields = frame[self._reader.format.effectsOffset : self._reader.format.shotsOffset]
+        for (i, effect) in enumerate(self._effects):
+            (effect.x, effect.y, used) = fields[i * 3 : i * 3 + 3]
+            effect.used = bool(used)
+
+        fields = frame[self._reader.format.shotsOffset:]
+        self.shoots = [
+            ((startX, startY), (endX, endY), int(team))
+            for (startX, startY, endX, endY, team) in zip(*[iter(fields)] * 5) if team != 0
+        ]
+
+    def getReader(self):
+        return self._reader
+
+    def getEngine(self):
+        return self._engine
+
+    def getMap(self):
+        return self._map
+
+    def getBots(self, team = None):
+        """
+        Get bots from one or both teams
+
+        Returns:
+            bots (list) : The list of requested bots
+        """
+        if team == None:
+            return self.getAllBots()
+
+        return self._teams[str(team)]["bots"]
+
+    def getAllBots(self):
+        """
+        Get bots from both teams
+
+        Returns:
+            bots (list) : The list of all Bots in the game.
+        """
+        bots = self._teams["1"]["bots"].copy()
+        bots.update(self._teams["2"]["bots"])
+        return bots
+
+    def getShoots(self):
+        return self.shoots
+
+    def getVisibility(self):
+        """
+        Computes which bots see each other at the current tick, only when displayed.
+
+        Returns:
+            visibility (VisibilityMatrix) : Which bots see which bots.
+        """
+        if self._visibility is None:
+            bots = list(self.getAllBots().values())
+            self._visibility = self._engine.computeVisibility(bots, bots)
+
+        return self._visibility
+
+    def register(self, player):
+        pass
+
+    def stop(self):
+        """
+        Closes the timeline file.
+        """
+        self._reader.close()
@@ -0,0 +1,110 @@
+from model.Replay.TimelineFormat import TimelineFormat
+
+from array import array
+from bisect import bisect_right
+
+import json
+import mmap
+import struct
+import sys
+
+class TimelineReader:
+    """
+    Reads a timeline file written by TimelineRecorder, through mmap : opening a file or reading a tick does not depend
+    on the length of the game.
+
+    Attributes:
+        header (dict) : seed, map, ruleset, bots, flags, effects, keyframeInterval and byteorder of the recorded game.
+        format (TimelineFormat) : Layout of the frames.
+        framesCount (int) : Number of ticks recorded.
+        keyframeTimes (sequence) : Time of each keyframe, in milliseconds.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access = mmap.ACCESS_READ)
+
+        if self._mmap[:len(TimelineFormat.MAGIC)] != TimelineFormat.MAGIC:
+            self.close()
+            raise Exception("{} is not a timeline file".format(path))
+
+        offset = len(TimelineFormat.MAGIC)
+        (headerLength,) = struct.unpack_from(">I", self._mmap, offset)
+        offset += 4
+
+        self.header = json.loads(self._mmap[offset : offset + headerLength].decode())
+        offset += headerLength
+
+        if self.header["byteorder"] != sys.byteorder:
+            self.close()
+            raise Exception("{} was recorded on a {} endian machine".format(path, self.header["byteorder"]))
+
+        self.format = TimelineFormat(len(self.header["bots"]), self.header["flags"], self.header["effects"])
+        self._keyframeInterval = self.header["keyframeInterval"]
+
+        footerOffset = len(self._mmap) - TimelineFormat.FOOTER.size
+        (framesCount, keyframesCount, footerMagic) = TimelineFormat.FOOTER.unpack_from(self._mmap, max(footerOffset, 0))
+
+        if footerMagic == TimelineFormat.FOOTER_MAGIC:
+            indexOffset = footerOffset - keyframesCount * 8
+            self.framesCount = framesCount
+            self.keyframeTimes = memoryview(self._mmap)[indexOffset : footerOffset].cast("d")
+        else:
+            # The game was not closed, only whole frames are kept and the index is read from them
+            self.framesCount = (len(self._mmap) - offset) // self.format.frameSize
+            self.keyframeTimes = None
+
+        self._frames = memoryview(self._mmap)[offset : offset + self.framesCount * self.format.frameSize].cast("d")
+
+        if self.keyframeTimes is None:
+            self.keyframeTimes = array("d", self._frames[1 :: self.format.frameLength * self._keyframeInterval])
+
+    def frame(self, tick):
+        """
+        Parameters:
+            tick (int) : Index of the tick, from 0 to framesCount - 1.
+
+        Returns:
+            frame (memoryview) : The doubles of this frame, see TimelineFormat. Valid until the reader is closed.
+        """
+        if tick < 0 or tick >= self.framesCount:
+            raise Exception("Tick {} is not in this timeline of {} ticks".format(tick, self.framesCount))
+
+        start = tick * self.format.frameLength
+        return self._frames[start : start + self.format.frameLength]
+
+    def timeMs(self, tick):
+        """
+        Returns:
+            timeMs (double) : Time of the game at this tick, in milliseconds.
+        """
+        return self._frames[tick * self.format.frameLength + 1]
+
+    def tickAt(self, timeMs):
+        """
+        Finds the last tick played at or before timeMs, from the closest keyframe.
+
+        Returns:
+            tick (int) : Index of the tick, 0 if timeMs is before the first one.
+        """
+        if self.framesCount == 0:
+            raise Exception("This timeline is empty")
+
+        tick = max(bisect_right(self.keyframeTimes, timeMs) - 1, 0) * self._keyframeInterval
+        end = min(tick + self._keyframeInterval, self.framesCount)
+
+        while tick + 1 < end and self.timeMs(tick + 1) <= timeMs:
+            tick += 1
+
+        return tick
+
+    def close(self):
+        """
+        Releases the file. Frames read from this reader can not be used afterwards.
+        """
+        for view in (getattr(self, "_frames", None), getattr(self, "keyframeTimes", None)):
+            if isinstance(view, memoryview):
+                view.release()
+
+        self._mmap.close()
+        self._file.close()
@@ -0,0 +1,103 @@
+from model.Replay.Recorder import Recorder
+from model.Replay.TimelineFormat import TimelineFormat
+
+from array import array
+
+import json
+import struct
+import sys
+
+class TimelineRecorder(Recorder):
+    """
+    Writes the state of the game at each tick in a timeline file, that TimelineReader can open at any tick at once.
+
+    Unlike ReplayRecorder, nothing is computed again when watching : this is meant for looking at long games.
+    See TimelineFormat for the format.
+
+    Attributes:
+        path (string) : The file to write.
+        keyframeInterval (int) : Number of ticks between two keyframes.
+    """
+
+    KEYFRAME_INTERVAL = 300
+    """
+    Default number of ticks between two keyframes, 10 seconds at 30 frames per second.
+    """
+
+    def __init__(self, path, keyframeInterval = KEYFRAME_INTERVAL):
+        self._path = path
+        self._file = None
+        self._keyframeInterval = keyframeInterval
+
+        self._format = None
+        self._timeMs = 0
+        self._framesCount = 0
+        self._keyframeTimes = array("d")
+
+    def beginGame(self, model):
+        ruleset = model.getRuleset()
+        botsCount = int(ruleset["BotsCount"])
+        map_ = model.getMap()
+
+        self._format = TimelineFormat(2 * botsCount, len(map_.flags), len(map_.objects.get("Effect", [])))
+
+        header = json.dumps({
+            "seed": model.seed,
+            "map": model.getMapFile(),
+            "ruleset": dict(ruleset),
+            "bots": [str(team) + "_" + str(i) for team in range(1, 3) for i in range(botsCount)],
+            "flags": self._format.flagsCount,
+            "effects": self._format.effectsCount,
+            "keyframeInterval": self._keyframeInterval,
+            "byteorder": sys.byteorder,
+        }).encode()
+
+        # Frames start on a multiple of 8 bytes, so that they can be read as doubles where they are
+        headerEnd = len(TimelineFormat.MAGIC) + 4 + len(header)
+        header += b" " * (-headerEnd % 8)
+
+        self._file = open(self._path, "wb")
+        self._file.write(TimelineFormat.MAGIC)
+        self._file.write(struct.pack(">I", len(header)))
+        self._file.write(header)
+
+    def beginTick(self, deltaTime):
+        self._timeMs += deltaTime
+
+    def endTick(self, model):
+        frame = array("d", [model.turn, self._timeMs, max(model.countdownremaining, 0)])
+        frame.append(TimelineFormat.RUNNING if not model.game_over else (model.winner or 0))
+
+        for bot in model.getAllBots().values():
+            frame.extend((bot.x, bot.y, bot.angle, bot.speed, bot.health, bot.flag()))
+
+        map_ = model.getMap()
+
+        for flag in map_.flags:
+            frame.extend((flag.x, flag.y, flag.held))
+
+        for effect in map_.objects.get("Effect", []):
+            frame.extend((effect.x, effect.y, effect.used))
+
+        shoots = model.getShoots()[:self._format.botsCount]
+
+        for ((startX, startY), (endX, endY), team) in shoots:
+            frame.extend((startX, startY, endX, endY, team))
+
+        frame.extend([0] * (len(TimelineFormat.SHOT_FIELDS) * (self._format.botsCount - len(shoots))))
+
+        if self._framesCount % self._keyframeInterval == 0:
+            self._keyframeTimes.append(self._timeMs)
+
+        frame.tofile(self._file)
+        self._framesCount += 1
+
+    def close(self):
+        if self._file is None:
+            return
+
+        self._keyframeTimes.tofile(self._file)
+        self._file.write(TimelineFormat.FOOTER.pack(self._framesCount, len(self._keyframeTimes), TimelineFormat.FOOTER_MAGIC))
+
+        self._file.close()
+        self._file = None
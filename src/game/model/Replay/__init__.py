@@ -0,0 +1,11 @@
+from .Recorder import Recorder
+from .RecordingTimeManager import RecordingTimeManager
+from .ReplayEncoding import ReplayEncoding
+from .ReplayProcess import ReplayProcess
+from .ReplayTimeManager import ReplayTimeManager
+from .ReplayRecorder import ReplayRecorder
+from .ReplayReader import ReplayReader
+from .TimelineFormat import TimelineFormat
+from .TimelineRecorder import TimelineRecorder
+from .TimelineReader import TimelineReader
+from .TimelineModel import TimelineModel
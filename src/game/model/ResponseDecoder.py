@@ -0,0 +1,125 @@
+import math
+import numbers
+import numpy
+
+class ResponseDecoder:
+    """
+    Checks the responses of a player and decodes them in one pass, into an array with a row per bot of its team :
+    (targetX, targetY, speed, actions). The rows of the team are known beforehand, so that decoding a response is a
+    lookup per bot rather than walking nested dicts.
+
+    An entry that is not an order for a bot of the team, or whose values are not finite numbers, is rejected and
+    counted without raising : the other bots of the response still get their orders.
+
+    Attributes:
+        botIds (list(string)) : The bots of the team, one row each.
+        orders (numpy.ndarray) : Float array, orders[row] = (targetX, targetY, speed, actions) of the last response.
+        given (numpy.ndarray) : Boolean array, whether the last response gave an order to the bot of each row.
+        rows (list(int)) : Rows given an order by the last response, in the order of the response.
+        rejected (int) : Number of entries rejected since the creation.
+    """
+
+    TARGET_X = 0
+    TARGET_Y = 1
+    SPEED = 2
+    ACTIONS = 3
+
+    NUMBERS = (int, float)
+    """
+    Types accepted without going through numbers.Real, by far the most common ones.
+    """
+
+    ACTIONS_LIMIT = 2 ** 31
+    """
+    Action bits are below this, so that they are exact in the float array.
+    """
+
+    def __init__(self, botIds):
+        self.botIds = list(botIds)
+
+        self._rows = { botId: row for (row, botId) in enumerate(self.botIds) }
+
+        self.orders = numpy.zeros((len(self.botIds), 4))
+        self.given = numpy.zeros(len(self.botIds), dtype = bool)
+        self.rows = list()
+        self.rejected = 0
+
+    def decode(self, response):
+        """
+        Replaces the orders by the ones of a response, None or {} giving none.
+
+        Parameters:
+            response (dict) : The response, as Player.poll returns it.
+
+        Returns:
+            rejected (int) : Number of entries rejected in this response, 1 when the whole response is malformed.
+        """
+        self.given[:] = False
+        self.rows = list()
+
+        if response is None or response == {}:
+            return 0
+
+        bots = response.get("bots") if isinstance(response, dict) else None
+
+        if not isinstance(bots, dict):
+            self.rejected += 1
+            return 1
+
+        rejected = 0
+        values = list()
+
+        for (botId, order) in bots.items():
+            decoded = self._decodeOrder(botId, order)
+
+            if decoded is None:
+                rejected += 1
+                continue
+
+            self.rows.append(decoded[0])
+            values.append(decoded[1:])
+
+        if self.rows:
+            self.orders[self.rows] = values
+            self.given[self.rows] = True
+
+        self.rejected += rejected
+        return rejected
+
+    def _decodeOrder(self, botId, order):
+        """
+        Returns:
+            decoded (tuple) : (row, targetX, targetY, speed, actions), None when the entry is rejected.
+        """
+        row = self._rows.get(botId) if isinstance(botId, str) else None
+
+        if row is None or not isinstance(order, dict):
+            return None
+
+        target = order.get("targetPosition")
+        actions = order.get("actions")
+
+        if not isinstance(target, (tuple, list)) or len(target) != 3:
+            return None
+
+        for value in target:
+            if not ResponseDecoder.isNumber(value) or not math.isfinite(value):
+                return None
+
+        if not isinstance(actions, numbers.Integral) or not 0 <= actions < ResponseDecoder.ACTIONS_LIMIT:
+            return None
+
+        return (row, float(target[0]), float(target[1]), float(target[2]), float(actions))
+
+    @staticmethod
+    def isNumber(value):
+        return type(value) in ResponseDecoder.NUMBERS or isinstance(value, numbers.Real)
+
+    def order(self, row):
+        """
+        Returns:
+            order (tuple) : (targetX, targetY, speed, actions) of a row, actions being an int of Player action bits.
+        """
+        (targetX, targetY, speed, actions) = self.orders[row].tolist()
+
+        return (targetX, targetY, speed, int(actions))
@@ -0,0 +1,293 @@
+import math
+import struct
+
+class PollingLayout:
+    """
+    Fixed binary layout of the polling data sent to a player and of its response, so that they can be written in
+    shared memory instead of being pickled. Both the game and the player process build the same layout.
+
+    The shared memory holds two areas, one for the polling data and one for the response, each starting with its own
+    SEQUENCE counter (seqlock) : the writer makes it odd, writes the area, then makes it even again. A reader copies
+    the area and only keeps the copy if the counter was even and did not change meanwhile. Half the counter is the
+    number of writes, so a new value is a new request or response.
+
+    Polling data : POLLING_HEADER, then for each bot BOT followed by SEEN for each object it sees, then FLAG for each
+    flag event. Response : RESPONSE_HEADER, then ORDER for each bot ordered.
+
+    Bots are written by their index in botIds and seen objects by their index in typeNames. Numbers are written as
+    doubles, the player gets them back as floats except ids, counts, flags and actions.
+
+    Attributes:
+        botIds (list(string)) : Identifiers of the bots of the player, in order.
+        typeNames (list(string)) : Names of the classes of the objects that can be seen.
+        pollingCapacity (int) : Size of the polling data area, in bytes, without its counter.
+        responseCapacity (int) : Size of the response area, in bytes, without its counter.
+        size (int) : Size of the whole shared memory, in bytes.
+    """
+
+    SEQUENCE = struct.Struct("<Q")
+
+    POLLING_HEADER = struct.Struct("<IIq")
+    """
+    Number of bots, number of flag events, missed ticks.
+    """
+
+    BOT = struct.Struct("<IdddddidI")
+    """
+    Bot index, x, y, angle, speed, life, flag, cooldown, number of objects seen.
+    """
+
+    SEEN = struct.Struct("<I?dddddid")
+    """
+    Type index, whether it is a bot, x, y, then angle, speed, life, flag and cooldown for bots only.
+    """
+
+    FLAG = struct.Struct("<idd")
+    """
+    Team, x, y.
+    """
+
+    RESPONSE_HEADER = struct.Struct("<QIId")
+    """
+    Number of the polling data answered, status, number of orders, CPU time spent on the response in milliseconds
+    (NaN when not measured).
+    """
+
+    ORDER = struct.Struct("<Idddq")
+    """
+    Bot index, target x, target y, target speed, actions.
+    """
+
+    ORDERS = 0
+    """
+    Status of a response giving orders to bots.
+    """
+
+    PASS = 1
+    """
+    Status of an empty response : the player passes its turn.
+    """
+
+    INVALID = 2
+    """
+    Status of a response that does not follow the format of Player.poll, the game counts it as missing.
+    """
+
+    def __init__(self, botIds, typeNames, objectsCount, flagsCount):
+        """
+        Parameters:
+            botIds (list(string)) : Identifiers of the bots of the player, in order.
+            typeNames (list(string)) : Names of the classes of the objects that can be seen.
+            objectsCount (int) : Largest number of objects a bot can see.
+            flagsCount (int) : Largest number of flag events.
+        """
+        self.botIds = list(botIds)
+        self.typeNames = list(typeNames)
+
+        self._botIndexes = { botId: i for (i, botId) in enumerate(self.botIds) }
+        self._typeIndexes = { name: i for (i, name) in enumerate(self.typeNames) }
+
+        self.pollingCapacity = (PollingLayout.POLLING_HEADER.size
+            + len(self.botIds) * (PollingLayout.BOT.size + objectsCount * PollingLayout.SEEN.size)
+            + flagsCount * PollingLayout.FLAG.size)
+        self.responseCapacity = PollingLayout.RESPONSE_HEADER.size + len(self.botIds) * PollingLayout.ORDER.size
+
+        self.pollingOffset = 0
+        self.responseOffset = PollingLayout.SEQUENCE.size + self.pollingCapacity
+        self.size = self.responseOffset + PollingLayout.SEQUENCE.size + self.responseCapacity
+
+        # Areas are packed here first, then copied at once in shared memory while their counter is odd
+        self._pollingBuffer = bytearray(self.pollingCapacity)
+        self._responseBuffer = bytearray(self.responseCapacity)
+
+    def writePolling(self, buffer, pollingData):
+        """
+        Writes polling data built by DictBuilder in the polling area.
+
+        Returns:
+            sequence (int) : The new value of the counter of the area.
+        """
+        data = self._pollingBuffer
+        offset = PollingLayout.POLLING_HEADER.size
+
+        for (botId, bot) in pollingData["bots"].items():
+            (x, y, angle, speed) = bot["currentPosition"]
+            seen = bot["seen"]
+
+            PollingLayout.BOT.pack_into(data, offset, self._botIndexes[botId], x, y, angle, speed,
+                bot["life"], bot["flag"], bot["cooldown"], len(seen))
+            offset += PollingLayout.BOT.size
+
+            for gameObject in seen:
+                position = gameObject["currentPosition"]
+
+                if len(position) == 4:
+                    PollingLayout.SEEN.pack_into(data, offset, self._typeIndexes[gameObject["type"]], True,
+                        *position, gameObject["life"], gameObject["flag"], gameObject["cooldown"])
+                else:
+                    PollingLayout.SEEN.pack_into(data, offset, self._typeIndexes[gameObject["type"]], False,
+                        position[0], position[1], 0, 0, 0, 0, 0)
+
+                offset += PollingLayout.SEEN.size
+
+        flags = pollingData["events"].get("flags", [])
+
+        for flag in flags:
+            PollingLayout.FLAG.pack_into(data, offset, flag["team"], flag["position"][0], flag["position"][1])
+            offset += PollingLayout.FLAG.size
+
+        PollingLayout.POLLING_HEADER.pack_into(data, 0, len(pollingData["bots"]), len(flags), pollingData["missedTicks"])
+
+        return PollingLayout._write(buffer, self.pollingOffset, data, offset)
+
+    def readPolling(self, buffer):
+        """
+        Reads the polling area.
+
+        Returns:
+            (sequence, pollingData) : The counter of the area, and the polling data as DictBuilder built it.
+        """
+        (sequence, data) = PollingLayout._read(buffer, self.pollingOffset, self.pollingCapacity)
+
+        (botsCount, flagsCount, missedTicks) = PollingLayout.POLLING_HEADER.unpack_from(data, 0)
+        offset = PollingLayout.POLLING_HEADER.size
+
+        bots = dict()
+
+        for i in range(botsCount):
+            (index, x, y, angle, speed, life, flag, cooldown, seenCount) = PollingLayout.BOT.unpack_from(data, offset)
+            offset += PollingLayout.BOT.size
+
+            seen = list()
+
+            for (typeIndex, isBot, seenX, seenY, seenAngle, seenSpeed, seenLife, seenFlag, seenCooldown) in \
+                    PollingLayout.SEEN.iter_unpack(data[offset : offset + seenCount * PollingLayout.SEEN.size]):
+                if isBot:
+                    seen.append({
+                        "type": self.typeNames[typeIndex],
+                        "currentPosition" : (seenX, seenY, seenAngle, seenSpeed),
+                        "life": seenLife,
+                        "flag": seenFlag,
+                        "cooldown": seenCooldown,
+                    })
+                else:
+                    seen.append({
+                        "type": self.typeNames[typeIndex],
+                        "currentPosition" : (seenX, seenY),
+                    })
+
+            offset += seenCount * PollingLayout.SEEN.size
+
+            bots[self.botIds[index]] = {
+                "currentPosition" : (x, y, angle, speed),
+                "life": life,
+                "flag": flag,
+                "cooldown": cooldown,
+                "seen": seen
+            }
+
+        events = dict()
+
+        if flagsCount > 0:
+            events["flags"] = [
+                {"team": team, "position": (x, y)}
+                for (team, x, y) in PollingLayout.FLAG.iter_unpack(data[offset : offset + flagsCount * PollingLayout.FLAG.size])
+            ]
+
+        return (sequence, { "bots": bots, "events": events, "missedTicks": missedTicks })
+
+    def writeResponse(self, buffer, answered, response, cpuTime = None):
+        """
+        Writes the response of a player in the response area. A response that does not follow the format of
+        Player.poll is written as INVALID.
+
+        Parameters:
+            answered (int) : The counter of the polling data answered.
+            response (dict) : What Player.poll returned.
+            cpuTime (double) : CPU time the player spent on the response, in milliseconds, None if not measured.
+
+        Returns:
+            sequence (int) : The new value of the counter of the area.
+        """
+        data = self._responseBuffer
+        offset = PollingLayout.RESPONSE_HEADER.size
+
+        if response == {}:
+            status = PollingLayout.PASS
+            count = 0
+        else:
+            status = PollingLayout.ORDERS
+            count = 0
+
+            try:
+                for (botId, order) in response["bots"].items():
+                    (x, y, speed) = order["targetPosition"]
+                    PollingLayout.ORDER.pack_into(data, offset, self._botIndexes[botId], x, y, speed, order["actions"])
+                    offset += PollingLayout.ORDER.size
+                    count += 1
+            except (TypeError, KeyError, ValueError, AttributeError, struct.error):
+                (status, count, offset) = (PollingLayout.INVALID, 0, PollingLayout.RESPONSE_HEADER.size)
+
+        PollingLayout.RESPONSE_HEADER.pack_into(data, 0, answered, status, count, math.nan if cpuTime is None else cpuTime)
+
+        return PollingLayout._write(buffer, self.responseOffset, data, offset)
+
+    def readResponse(self, buffer):
+        """
+        Reads the response area.
+
+        Returns:
+            (sequence, answered, response, cpuTime) : The counter of the area, the counter of the polling data
+                answered, the response as Player.poll returned it, None if it was INVALID, and the CPU time spent on
+                it, None if not measured.
+        """
+        (sequence, data) = PollingLayout._read(buffer, self.responseOffset, self.responseCapacity)
+
+        (answered, status, count, cpuTime) = PollingLayout.RESPONSE_HEADER.unpack_from(data, 0)
+
+        cpuTime = None if math.isnan(cpuTime) else cpuTime
+
+        if status == PollingLayout.PASS:
+            return (sequence, answered, {}, cpuTime)
+
+        if status == PollingLayout.INVALID:
+            return (sequence, answered, None, cpuTime)
+
+        orders = data[PollingLayout.RESPONSE_HEADER.size : PollingLayout.RESPONSE_HEADER.size + count * PollingLayout.ORDER.size]
+
+        response = { "bots": {
+            self.botIds[index]: { "targetPosition": (x, y, speed), "actions": actions }
+            for (index, x, y, speed, actions) in PollingLayout.ORDER.iter_unpack(orders)
+        }}
+
+        return (sequence, answered, response, cpuTime)
+
+    def sequence(self, buffer, offset):
+        """
+        Returns:
+            sequence (int) : The counter of the area at offset, without reading the area.
+        """
+        return PollingLayout.SEQUENCE.unpack_from(buffer, offset)[0]
+
+    @staticmethod
+    def _write(buffer, offset, data, length):
+        (sequence,) = PollingLayout.SEQUENCE.unpack_from(buffer, offset)
+
+        PollingLayout.SEQUENCE.pack_into(buffer, offset, sequence + 1)
+        start = offset + PollingLayout.SEQUENCE.size
+        buffer[start : start + length] = memoryview(data)[:length]
+        PollingLayout.SEQUENCE.pack_into(buffer, offset, sequence + 2)
+
+        return sequence + 2
+
+    @staticmethod
+    def _read(buffer, offset, capacity):
+        start = offset + PollingLayout.SEQUENCE.size
+
+        while True:
+            (before,) = PollingLayout.SEQUENCE.unpack_from(buffer, offset)
+            data = bytes(buffer[start : start + capacity])
+            (after,) = PollingLayout.SEQUENCE.unpack_from(buffer, offset)
+
+            if before == after and before % 2 == 0:
+                return (before, data)
@@ -0,0 +1,200 @@
+from service.TimeManager import TimeManager
+from multiprocessing import Process, Semaphore
+from multiprocessing.shared_memory import SharedMemory
+import random
+import time
+
+class SharedPlayerProcess():
+    """
+    Same as PlayerProcess, but the polling data and the responses go through shared memory with a fixed layout
+    (see PollingLayout) instead of being pickled in queues.
+
+    Only the latest polling data and the latest response are kept : a player slower than the game skips the polling
+    data it did not have time to read, and the game only checks its latest response.
+
+    Attributes:
+        process (Process) : The process in which player polling will be ran
+        layout (PollingLayout) : Where everything is in the shared memory
+        memory (SharedMemory) : Holds the polling data and the response, created by the game
+        pollingReady (Semaphore) : Released by the game when new polling data is written
+        responseReady (Semaphore) : Released by the player when a new response is written
+
+        data (any) : The data to be sent to the Process
+        polled (int) : Counter of the polling area when the latest polling data was written
+        checked (int) : Counter of the response area when it was last checked
+        timed (int) : Counter of the response area when lastResponseTime was last set
+
+        model (Model) : The game model, containing teamsData in which we place the response
+        teamId (string) : The team identifier, for placing the result in the correct teamsData
+
+        stopwatch (TimeManager) : Used to monitor process response time
+        lastResponseTime (int) : Wall-clock time the player took to answer, in milliseconds
+        lastCpuTime (double) : CPU time the process of the player spent computing the same response, in milliseconds
+    """
+
+    def __init__(self, model, teamId, player, layout, seed = None):
+        """
+        Creates a new process to run a player's tick.
+
+        Arguments:
+            model (Model) : Access to the model of the game
+            teamId (string) : The team to operate
+            player (Player) : The player to call
+            layout (PollingLayout) : Layout of the polling data of this player
+            seed (any) : Seed of the random module in the process, so that seeded games are reproducible
+        """
+        self._layout = layout
+        self._memory = SharedMemory(create = True, size = layout.size)
+
+        self._pollingReady = Semaphore(0)
+        self._responseReady = Semaphore(0)
+
+        self._data = None
+        self._polled = 0
+        self._checked = 0
+        self._timed = 0
+
+        self._model = model
+        self._teamId = teamId
+
+        self._stopwatch = TimeManager()
+
+        self._process = Process(target = runSharedPlayerProcess,
+            args = (self._memory.name, layout, self._pollingReady, self._responseReady, player, seed))
+
+        self.lastResponseTime = None
+        self.lastCpuTime = None
+
+    def setData(self, pollingData):
+        """
+        Changes what data will be written for the next call to execute.
+
+        Arguments:
+            pollingData (dict) : Polling data built by DictBuilder
+        """
+        self._data = pollingData
+
+    def execute(self):
+        """
+        Writes the data in shared memory and wakes the player up.
+        """
+        self._stopwatch.StartTimer()
+        self._polled = self._layout.writePolling(self._memory.buf, self._data)
+        self._pollingReady.release()
+
+    def wait(self, timeoutMs):
+        """
+        Blocks until the player has sent a response or timeoutMs milliseconds have passed.
+
+        Returns:
+            received (bool) : Whether a response is available.
+        """
+        deadline = TimeManager()
+        deadline.StartTimer()
+
+        while not self._answered():
+            # Releases are not consumed by check, so a release may be for a response already checked
+            if not self._responseReady.acquire(True, max(timeoutMs - deadline.PeekDeltaTimeMs(), 0) / 1000):
+                return False
+
+        self._timeResponse(self._layout.sequence(self._memory.buf, self._layout.responseOffset))
+        return True
+
+    def _answered(self):
+        """
+        Returns:
+            answered (bool) : Whether the latest response answers the latest polling data, and was not checked yet.
+        """
+        if self._layout.sequence(self._memory.buf, self._layout.responseOffset) == self._checked:
+            return False
+
+        return self._layout.readResponse(self._memory.buf)[1] == self._polled
+
+    def waitable(self):
+        """
+        Returns:
+            connection (Connection) : None, responses are signaled by a semaphore, see wait.
+        """
+        return None
+
+    def check(self):
+        """
+        Checks if the player has sent a response, and places it in teamsData[team]
+
+        If no response is given, teamsData[team] is left as it is. A response to older polling data, that the player
+        answered too late, is dropped : it is not what the player would answer now.
+
+        Returns:
+            received (bool) : Whether a new response was placed.
+        """
+        (sequence, answered, response, cpuTime) = self._layout.readResponse(self._memory.buf)
+
+        if sequence == self._checked:
+            return False
+
+        self._checked = sequence
+
+        if answered != self._polled:
+            return False
+
+        self.lastCpuTime = cpuTime
+        self._timeResponse(sequence)
+
+        self._model.teamsData[self._teamId] = response
+        return True
+
+    def _timeResponse(self, sequence):
+        """
+        Sets lastResponseTime the first time a response is seen, by wait or check.
+        """
+        if sequence != self._timed:
+            self._timed = sequence
+            self.lastResponseTime = self._stopwatch.DeltaTimeMs()
+
+    def start(self):
+        """
+        Starts the process hosting the player. Should only be called once in a game.
+        """
+        self._process.start()
+
+    def join(self, timeout = None):
+        """
+        Waits until process termination.
+        """
+        self._process.join(timeout)
+
+    def kill(self):
+        """
+        Kills the process hosting the player and releases the shared memory. Should only be called once the game is
+        over.
+        """
+        self._process.kill()
+        self._process.join()
+
+        self._memory.close()
+        self._memory.unlink()
+
+def runSharedPlayerProcess(memoryName, layout, pollingReady, responseReady, player, seed):
+        if seed is not None:
+            random.seed(seed)
+
+        memory = SharedMemory(name = memoryName)
+        answered = 0
+
+        while True:
+            pollingReady.acquire()
+
+            (sequence, pollingData) = layout.readPolling(memory.buf)
+
+            # Several releases for the same polling data, it was already answered
+            if sequence == answered:
+                continue
+
+            answered = sequence
+
+            # CPU time of this process only, whatever the load of the host
+            start = time.process_time()
+            response = player.poll(pollingData)
+
+            layout.writeResponse(memory.buf, answered, response, (time.process_time() - start) * 1000)
+            responseReady.release()
@@ -0,0 +1,2 @@
+from .PollingLayout import PollingLayout
+from .SharedPlayerProcess import SharedPlayerProcess
@@ -0,0 +1,107 @@
+from domain.Map import Map
+from model.VisibilityTable import VisibilityTable
+
+import numpy
+
+class VisibilityMatrix:
+    """
+    Which bots see which objects at one tick, for every pair at once.
+
+    Gives the same answers as PhysicsEngine.sees, but the view distance and the field of view are checked for all the
+    pairs together with numpy, then the visibility table for the pairs left. A ray is only cast for the few pairs the
+    table can not tell.
+
+    Attributes:
+        bots (list(Bot)) : The bots seeing, one row each.
+        objects (list(GameObject)) : The objects that can be seen, one column each. Bots can be objects as well.
+        seen (numpy.ndarray) : Boolean array, seen[i, j] is True when bots[i] sees objects[j].
+    """
+
+    def __init__(self, engine, bots, objects):
+        """
+        Computes the matrix, from the current positions of the bots and objects.
+
+        Parameters:
+            engine (PhysicsEngine) : The engine of the map, with its visibility table if it has one.
+            bots (list(Bot)) : The bots seeing.
+            objects (list(GameObject)) : The objects that can be seen.
+        """
+        self.bots = list(bots)
+        self.objects = list(objects)
+
+        self._rows = { id(bot): i for (i, bot) in enumerate(self.bots) }
+        self._columns = { id(gameObject): j for (j, gameObject) in enumerate(self.objects) }
+
+        self.seen = numpy.zeros((len(self.bots), len(self.objects)), dtype = bool)
+
+        if not self.bots or not self.objects:
+            return
+
+        botsData = numpy.array([(bot.x, bot.y, bot.angle, bot.viewDistance, bot.fov) for bot in self.bots], dtype = float)
+        objectsData = numpy.array([(gameObject.x, gameObject.y) for gameObject in self.objects], dtype = float)
+
+        (x, y, angle, viewDistance, fov) = (column[:, None] for column in botsData.T)
+        (targetX, targetY) = (column[None, :] for column in objectsData.T)
+
+        (dx, dy) = (targetX - x, targetY - y)
+
+        # Same operations as Physics.distance and Physics.getAngle, so that the boundaries match
+        inRange = numpy.sqrt(dx * dx + dy * dy) <= viewDistance
+
+        deltaAngle = numpy.degrees(numpy.arctan2(dy, dx)) - angle
+        deltaAngle = numpy.where(deltaAngle > 180, deltaAngle - 360,
+            numpy.where(deltaAngle < -180, deltaAngle + 360, deltaAngle))
+
+        candidates = inRange & (numpy.abs(deltaAngle) <= fov)
+
+        # A bot does not see itself
+        for (i, bot) in enumerate(self.bots):
+            j = self._columns.get(id(bot))
+            if j is not None:
+                candidates[i, j] = False
+
+        (rows, columns) = numpy.nonzero(candidates)
+
+        visibility = numpy.full(len(rows), VisibilityTable.PARTIAL)
+
+        if engine.visibilityTable is not None:
+            visibility = engine.visibilityTable.lookupAll(
+                (botsData[rows, 0] // Map.BLOCKSIZE).astype(int),
+                (botsData[rows, 1] // Map.BLOCKSIZE).astype(int),
+                (objectsData[columns, 0] // Map.BLOCKSIZE).astype(int),
+                (objectsData[columns, 1] // Map.BLOCKSIZE).astype(int)
+            )
+
+        clear = visibility == VisibilityTable.CLEAR
+        self.seen[rows[clear], columns[clear]] = True
+
+        partial = visibility == VisibilityTable.PARTIAL
+
+        for (i, j) in zip(rows[partial].tolist(), columns[partial].tolist()):
+            (bot, gameObject) = (self.bots[i], self.objects[j])
+            self.seen[i, j] = not engine.viewBlocked(bot.x, bot.y, gameObject.x, gameObject.y)
+
+    def sees(self, bot, gameObject):
+        """
+        Returns:
+            seen (bool) : Whether bot sees gameObject, False if any of them is not in the matrix.
+        """
+        i = self._rows.get(id(bot))
+        j = self._columns.get(id(gameObject))
+
+        if i is None or j is None:
+            return False
+
+        return bool(self.seen[i, j])
+
+    def seenBy(self, bot):
+        """
+        Returns:
+            objects (list(GameObject)) : The objects seen by bot, in the order of the columns.
+        """
+        i = self._rows.get(id(bot))
+
+        if i is None:
+            return []
+
+        return [self.objects[j] for j in numpy.flatnonzero(self.seen[i]).tolist()]
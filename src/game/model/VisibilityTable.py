@@ -0,0 +1,281 @@
+import hashlib
+import os
+import os.path
+import zipfile
+
+import numpy
+
+class VisibilityTable:
+    """
+    Potentially visible set of a map : for each block, which blocks around it are visible from it.
+
+    Blocks only see each other through transparent blocks, and the map never changes, so this is computed once per
+    map. For a block A and a block B at most radius blocks away along each axis, the table tells whether :
+        CLEAR : every segment from a point of A to a point of B only crosses transparent blocks.
+            No opaque block overlaps the convex hull of A and B.
+        HIDDEN : no such segment does. A or B is opaque, or a column (or row) of opaque blocks between them
+            spans every row (or column) the segments can cross.
+        PARTIAL : it depends on the points, a ray has to be cast.
+
+    Both answers are exact for the block traversal of PhysicsEngine.traverseBlocks, blocks out of the map being opaque.
+
+    Attributes:
+        radius (int) : Largest distance between two blocks of the table along an axis, in blocks.
+        clear (numpy.ndarray) : For each block [x, y], bitset of the blocks [x + dx, y + dy] that are CLEAR.
+            Bit (dx + radius) * (2 * radius + 1) + (dy + radius), in big endian order (see numpy.packbits).
+        hidden (numpy.ndarray) : Same as clear, for the blocks that are HIDDEN.
+    """
+
+    PARTIAL = 0
+    CLEAR = 1
+    HIDDEN = 2
+
+    VERSION = 1
+    """
+    Changes whenever the way the table is computed changes, so that older cache files are computed again.
+    """
+
+    CACHE_DIRECTORY = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "ia-ctf")
+    """
+    Where the tables of the maps are kept between games, see CachePath.
+    """
+
+    def __init__(self, opaque, radius):
+        """
+        Computes the table.
+
+        Parameters:
+            opaque (numpy.ndarray) : Boolean array, True for the blocks [x, y] that can not be seen through.
+            radius (int) : Largest distance between two blocks of the table along an axis, in blocks.
+        """
+        self.radius = radius
+
+        (width, height) = opaque.shape
+        side = 2 * radius + 1
+
+        self.clear = numpy.zeros((width, height, (side * side + 7) // 8), dtype = numpy.uint8)
+        self.hidden = numpy.zeros_like(self.clear)
+
+        # Blocks out of the map are opaque, padding avoids any bound check
+        padded = numpy.pad(opaque, radius, constant_values = True)
+
+        # opaqueCount[x, y] is the number of opaque padded blocks [< x, < y]
+        opaqueCount = numpy.zeros((width + 2 * radius + 1, height + 2 * radius + 1), dtype = numpy.int32)
+        opaqueCount[1:, 1:] = padded.cumsum(axis = 0).cumsum(axis = 1)
+
+        def shifted(dx, dy):
+            return padded[radius + dx : radius + dx + width, radius + dy : radius + dy + height]
+
+        def allOpaque(x0, x1, y0, y1):
+            """
+            For each block [x, y], whether the blocks [x + x0 .. x + x1, y + y0 .. y + y1] are all opaque.
+            """
+            (x0, x1, y0, y1) = (x0 + radius, x1 + radius + 1, y0 + radius, y1 + radius + 1)
+            count = (opaqueCount[x1 : x1 + width, y1 : y1 + height] - opaqueCount[x0 : x0 + width, y1 : y1 + height]
+                - opaqueCount[x1 : x1 + width, y0 : y0 + height] + opaqueCount[x0 : x0 + width, y0 : y0 + height])
+            return count == (x1 - x0) * (y1 - y0)
+
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                blocked = numpy.zeros((width, height), dtype = bool)
+                for (i, j) in VisibilityTable.hullBlocks(dx, dy):
+                    blocked |= shifted(i, j)
+
+                (minX, maxX) = (min(0, dx), max(0, dx))
+                (minY, maxY) = (min(0, dy), max(0, dy))
+
+                hidden = opaque | shifted(dx, dy)
+                for i in range(minX + 1, maxX):
+                    hidden |= allOpaque(i, i, minY, maxY)
+                for j in range(minY + 1, maxY):
+                    hidden |= allOpaque(minX, maxX, j, j)
+
+                bit = (dx + radius) * side + (dy + radius)
+                mask = numpy.uint8(1 << (7 - bit % 8))
+
+                self.clear[:, :, bit // 8] |= numpy.where(blocked, 0, mask).astype(numpy.uint8)
+                self.hidden[:, :, bit // 8] |= numpy.where(hidden, mask, 0).astype(numpy.uint8)
+
+    @staticmethod
+    def hullBlocks(dx, dy):
+        """
+        Lists the blocks overlapping the convex hull of the block [0, 0] and the block [dx, dy], where a segment
+        between them can go.
+
+        Only blocks sharing some area with the hull are listed : the traversal never enters a block that the
+        segment only touches on a corner or a side.
+
+        Returns:
+            blocks (list((i, j))) : Coordinates of the blocks, relative to [0, 0].
+        """
+        corners = [(0, 0), (1, 0), (0, 1), (1, 1)]
+        hull = VisibilityTable.convexHull(corners + [(x + dx, y + dy) for (x, y) in corners])
+
+        edges = list(zip(hull, hull[1:] + hull[:1]))
+        axes = [(1, 0), (0, 1)] + [(y1 - y2, x2 - x1) for ((x1, y1), (x2, y2)) in edges]
+
+        blocks = list()
+
+        for i in range(min(0, dx) - 1, max(0, dx) + 2):
+            for j in range(min(0, dy) - 1, max(0, dy) + 2):
+                square = [(i, j), (i + 1, j), (i, j + 1), (i + 1, j + 1)]
+
+                separated = False
+                for (ax, ay) in axes:
+                    hullProjection = [x * ax + y * ay for (x, y) in hull]
+                    squareProjection = [x * ax + y * ay for (x, y) in square]
+
+                    # Touching is not overlapping
+                    if max(hullProjection) <= min(squareProjection) or max(squareProjection) <= min(hullProjection):
+                        separated = True
+                        break
+
+                if not separated:
+                    blocks.append((i, j))
+
+        return blocks
+
+    @staticmethod
+    def convexHull(points):
+        """
+        Returns:
+            hull (list((x, y))) : The vertices of the convex hull of points, counterclockwise (monotone chain).
+        """
+        points = sorted(set(points))
+
+        def cross(o, a, b):
+            return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+        lower = list()
+        for point in points:
+            while len(lower) >= 2 and cross(lower[-2], lower[-1], point) <= 0:
+                lower.pop()
+            lower.append(point)
+
+        upper = list()
+        for point in reversed(points):
+            while len(upper) >= 2 and cross(upper[-2], upper[-1], point) <= 0:
+                upper.pop()
+            upper.append(point)
+
+        return lower[:-1] + upper[:-1]
+
+    @staticmethod
+    def load(map_, distance, cachePath = None):
+        """
+        Gets the table of a map, from cachePath if it was computed for the same blocks, else computes it and
+        writes it there. The file is replaced at once, so that games starting on the same map at the same time never
+        read it half written, and a file that can not be read is computed again.
+
+        Parameters:
+            map_ (Map) : The map, with its blocks.
+            distance (int) : Largest distance at which objects have to be seen, in real coordinates.
+            cachePath (string) : File in which the table is kept between games, None to always compute it.
+
+        Returns:
+            table (VisibilityTable) : The table of this map.
+        """
+        opaque = numpy.array([[not block.transparent for block in blockline] for blockline in map_.blocks], dtype = bool)
+
+        # Two points at most distance apart are in blocks at most this far apart along each axis
+        radius = int(distance // map_.BLOCKSIZE) + 1
+
+        key = hashlib.sha1(numpy.packbits(opaque).tobytes()
+            + "{}x{} {} {}".format(opaque.shape[0], opaque.shape[1], radius, VisibilityTable.VERSION).encode()).hexdigest()
+
+        if cachePath is not None and os.path.isfile(cachePath):
+            try:
+                # Opened here, so that it is closed even when numpy can not read it
+                with open(cachePath, "rb") as cacheFile, numpy.load(cacheFile) as cache:
+                    if str(cache["key"]) == key:
+                        table = VisibilityTable.__new__(VisibilityTable)
+                        (table.radius, table.clear, table.hidden) = (radius, cache["clear"], cache["hidden"])
+                        return table
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+                # Unreadable, computed again below
+                pass
+
+        table = VisibilityTable(opaque, radius)
+
+        if cachePath is not None:
+            temporaryPath = "{}.{}.tmp".format(cachePath, os.getpid())
+
+            try:
+                os.makedirs(os.path.dirname(cachePath) or ".", exist_ok = True)
+
+                with open(temporaryPath, "wb") as cacheFile:
+                    numpy.savez_compressed(cacheFile, key = key, clear = table.clear, hidden = table.hidden)
+
+                os.replace(temporaryPath, cachePath)
+            except OSError:
+                print("Could not write the visibility table in {}".format(cachePath))
+
+                if os.path.exists(temporaryPath):
+                    os.remove(temporaryPath)
+
+        return table
+
+    @staticmethod
+    def CachePath(mapFile):
+        """
+        Returns:
+            cachePath (string) : File of CACHE_DIRECTORY in which the table of a map file is kept, named after the map
+                and where it is, so that maps of the same name do not replace each other's table.
+        """
+        name = os.path.splitext(os.path.basename(mapFile))[0]
+        location = hashlib.sha1(os.path.abspath(mapFile).encode()).hexdigest()[:8]
+
+        return os.path.join(VisibilityTable.CACHE_DIRECTORY, "{}-{}.pvs".format(name, location))
+
+    def lookup(self, blockX, blockY, targetBlockX, targetBlockY):
+        """
+        Parameters:
+            blockX, blockY (int) : Coordinates of the block seeing, in blocks.
+            targetBlockX, targetBlockY (int) : Coordinates of the block seen, in blocks.
+
+        Returns:
+            visibility (int) : CLEAR, HIDDEN or PARTIAL, PARTIAL as well when the blocks are too far apart for the table.
+        """
+        (dx, dy) = (targetBlockX - blockX, targetBlockY - blockY)
+
+        if abs(dx) > self.radius or abs(dy) > self.radius:
+            return VisibilityTable.PARTIAL
+
+        bit = (dx + self.radius) * (2 * self.radius + 1) + (dy + self.radius)
+        shift = 7 - bit % 8
+
+        # item() gives a plain int, much faster than indexing the array
+        if (self.clear.item(blockX, blockY, bit // 8) >> shift) & 1:
+            return VisibilityTable.CLEAR
+
+        if (self.hidden.item(blockX, blockY, bit // 8) >> shift) & 1:
+            return VisibilityTable.HIDDEN
+
+        return VisibilityTable.PARTIAL
+
+    def lookupAll(self, blockX, blockY, targetBlockX, targetBlockY):
+        """
+        Same as lookup, for many pairs of blocks at once.
+
+        Parameters:
+            blockX, blockY (numpy.ndarray) : Coordinates of the blocks seeing, in blocks.
+            targetBlockX, targetBlockY (numpy.ndarray) : Coordinates of the blocks seen, in blocks, same shape.
+
+        Returns:
+            visibility (numpy.ndarray) : CLEAR, HIDDEN or PARTIAL for each pair of blocks.
+        """
+        (dx, dy) = (targetBlockX - blockX, targetBlockY - blockY)
+        near = (numpy.abs(dx) <= self.radius) & (numpy.abs(dy) <= self.radius)
+
+        # Pairs too far apart read any bit, they are PARTIAL anyway
+        bit = ((numpy.clip(dx, -self.radius, self.radius) + self.radius) * (2 * self.radius + 1)
+            + numpy.clip(dy, -self.radius, self.radius) + self.radius)
+        shift = 7 - bit % 8
+
+        clear = (self.clear[blockX, blockY, bit // 8] >> shift) & 1
+        hidden = (self.hidden[blockX, blockY, bit // 8] >> shift) & 1
+
+        visibility = numpy.where(clear == 1, VisibilityTable.CLEAR,
+            numpy.where(hidden == 1, VisibilityTable.HIDDEN, VisibilityTable.PARTIAL))
+
+        return numpy.where(near, visibility, VisibilityTable.PARTIAL)
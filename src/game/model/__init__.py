@@ -1,2 +1,7 @@
 from .Model import Model
-from .GameModel import GameModel
\ No newline at end of file
+from .GameModel import GameModel
+from .Replay import *
+from .SharedMemory import *
+from .PlayerPool import *
+from .Network import *
+from .ForkServer import *
\ No newline at end of file
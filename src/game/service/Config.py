@@ -27,6 +27,13 @@ class Config:
                 'TimeRate' : 1,
                 'InvalidResponsesKick' : 50,
                 'Ruleset' : "Default",
+                'PlayerTransport' : "Queue",
+                'PlayerConnectTimeoutSeconds' : 60,
+            },
+            'Metrics' : {
+                'Path' : "",
+                'IntervalSeconds' : 10,
+                'WindowSize' : 1000,
             },
         }
 
@@ -120,6 +127,42 @@ class Config:
         """
         return Config.config.parser["Gameplay"]["Ruleset"]
 
+    @staticmethod
+    def PlayerTransport():
+        """
+        How polling data is sent to the players : "Queue" (pickled) or "SharedMemory" (fixed layout, not pickled).
+        """
+        return Config.config.parser["Gameplay"]["PlayerTransport"]
+
+    @staticmethod
+    def PlayerConnectTimeoutSeconds():
+        """
+        How long a game waits for a remote player to connect, and then to initialize, in seconds.
+        """
+        return float(Config.config.parser["Gameplay"]["PlayerConnectTimeoutSeconds"])
+
+    @staticmethod
+    def MetricsPath():
+        """
+        File in which the measures of the games are written periodically, in Prometheus text format or CSV when it
+        ends with .csv. Empty to not write them.
+        """
+        return Config.config.parser["Metrics"]["Path"]
+
+    @staticmethod
+    def MetricsIntervalSeconds():
+        """
+        Time between two writes of the measures of the games, in seconds.
+        """
+        return float(Config.config.parser["Metrics"]["IntervalSeconds"])
+
+    @staticmethod
+    def MetricsWindowSize():
+        """
+        Number of latest values of a measure used for its percentiles.
+        """
+        return int(Config.config.parser["Metrics"]["WindowSize"])
+
     @staticmethod
     def SetConfigValue(section, attribute, value):
         """
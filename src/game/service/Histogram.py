@@ -0,0 +1,38 @@
+from collections import deque
+import math
+
+class Histogram:
+    """
+    Distribution of the latest values of a measure, for percentiles, and totals since it was created.
+
+    Attributes:
+        samples (deque) : The latest values, at most windowSize of them.
+        count (int) : Number of values added since the creation.
+        sum (double) : Sum of the values added since the creation.
+    """
+
+    def __init__(self, windowSize = 1000):
+        self.samples = deque(maxlen = windowSize)
+        self.count = 0
+        self.sum = 0
+
+    def add(self, value):
+        self.samples.append(value)
+        self.count += 1
+        self.sum += value
+
+    def percentiles(self, *ranks):
+        """
+        Parameters:
+            ranks (double) : Percentile ranks between 0 and 100.
+
+        Returns:
+            values (list) : The value of each percentile among the latest values (nearest rank), None when there are
+                none.
+        """
+        if not self.samples:
+            return [None for rank in ranks]
+
+        ordered = sorted(self.samples)
+
+        return [ordered[min(max(math.ceil(len(ordered) * rank / 100) - 1, 0), len(ordered) - 1)] for rank in ranks]
@@ -0,0 +1,260 @@
+from service.Config import Config
+from service.Histogram import Histogram
+from contextlib import contextmanager
+import os
+import time
+
+class Metrics:
+    """
+    Measures taken while games are played, to watch a host running many of them : how each player answers, and how
+    long each phase of a tick takes. They are read with snapshot, and written periodically in a file when a path is
+    given.
+
+    Players are named after the module of their class, so that the measures of a player add up over the matches of a
+    tournament. Durations are in real milliseconds, even in a headless game.
+
+    Attributes:
+        windowSize (int) : Number of latest values kept by each histogram for its percentiles.
+        path (string) : File the measures are written in, in Prometheus text format, or CSV when it ends with .csv.
+            None to not write them.
+        intervalSeconds (double) : Time between two writes of the file.
+        players (dict) : For each player, "latency", "cpu" and "serialization" histograms, and "responses", "misses",
+            "late", "overBudget" and "invalid" counters.
+        phases (dict(Histogram)) : Duration of each phase of GameModel.tick.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    PREFIX = "iactf_"
+
+    def __init__(self, windowSize = 1000, path = None, intervalSeconds = 10):
+        self.windowSize = windowSize
+        self.path = path
+        self.intervalSeconds = intervalSeconds
+
+        self.players = dict()
+        self.phases = dict()
+
+        self._lastWrite = time.monotonic()
+
+    @staticmethod
+    def FromConfig():
+        """
+        Returns:
+            metrics (Metrics) : Following the Metrics section of the Config.
+        """
+        return Metrics(Config.MetricsWindowSize(), Config.MetricsPath() or None, Config.MetricsIntervalSeconds())
+
+    def _player(self, player):
+        if player not in self.players:
+            self.players[player] = {
+                "latency": Histogram(self.windowSize),
+                "cpu": Histogram(self.windowSize),
+                "serialization": Histogram(self.windowSize),
+                "responses": 0,
+                "misses": 0,
+                "late": 0,
+                "overBudget": 0,
+                "invalid": 0,
+            }
+
+        return self.players[player]
+
+    def recordResponse(self, player, latencyMs, late = False, cpuMs = None):
+        """
+        A response was received from a player.
+
+        Parameters:
+            latencyMs (double) : Time between the polling data being sent and the response being received.
+            late (bool) : Whether it came after the time given to the player.
+            cpuMs (double) : CPU time the player spent on the response, None when it was not measured.
+        """
+        measures = self._player(player)
+        measures["responses"] += 1
+
+        if latencyMs is not None:
+            measures["latency"].add(latencyMs)
+
+        if cpuMs is not None:
+            measures["cpu"].add(cpuMs)
+
+        if late:
+            measures["late"] += 1
+
+    def recordMiss(self, player):
+        """
+        A player did not answer in time for a turn.
+        """
+        self._player(player)["misses"] += 1
+
+    def recordOverBudget(self, player):
+        """
+        A response of a player was dropped because it took more than its think time.
+        """
+        self._player(player)["overBudget"] += 1
+
+    def recordInvalid(self, player, count = 1):
+        """
+        Entries of a response of a player were rejected, see ResponseDecoder.
+        """
+        self._player(player)["invalid"] += count
+
+    def recordSerialization(self, player, durationMs):
+        """
+        Time spent building the polling data of a player and sending it.
+        """
+        self._player(player)["serialization"].add(durationMs)
+
+    def recordPhase(self, phase, durationMs):
+        if phase not in self.phases:
+            self.phases[phase] = Histogram(self.windowSize)
+
+        self.phases[phase].add(durationMs)
+
+    @contextmanager
+    def time(self, phase):
+        """
+        Records the duration of the block it surrounds as a phase of a tick.
+        """
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.recordPhase(phase, (time.perf_counter() - start) * 1000)
+
+    def snapshot(self):
+        """
+        Returns:
+            measures (dict) : {
+                "players": { "<player>": {
+                    "latency": { "count", "sum", "p50", "p95", "p99" },
+                    "cpu": { ... },
+                    "serialization": { ... },
+                    "responses": <count>, "misses": <count>, "late": <count>, "overBudget": <count>,
+                    "invalid": <count>
+                }, ... },
+                "phases": { "<phase>": { "count", "sum", "p50", "p95", "p99" }, ... }
+            }
+        """
+        return {
+            "players": {
+                player: {
+                    name: Metrics._summary(value) if isinstance(value, Histogram) else value
+                    for (name, value) in measures.items()
+                }
+                for (player, measures) in self.players.items()
+            },
+            "phases": { phase: Metrics._summary(histogram) for (phase, histogram) in self.phases.items() },
+        }
+
+    @staticmethod
+    def _summary(histogram):
+        summary = { "count": histogram.count, "sum": histogram.sum }
+
+        for (rank, value) in zip(Metrics.PERCENTILES, histogram.percentiles(*Metrics.PERCENTILES)):
+            summary["p{}".format(rank)] = value
+
+        return summary
+
+    def toPrometheus(self):
+        """
+        Returns:
+            text (string) : The measures in Prometheus text exposition format, percentiles as summary quantiles.
+        """
+        snapshot = self.snapshot()
+        lines = list()
+
+        def summary(name, description, label, summaries):
+            lines.append("# HELP {}{} {}".format(Metrics.PREFIX, name, description))
+            lines.append("# TYPE {}{} summary".format(Metrics.PREFIX, name))
+
+            for (value, measures) in summaries:
+                labels = '{}="{}"'.format(label, Metrics._escape(value))
+
+                for rank in Metrics.PERCENTILES:
+                    quantile = measures["p{}".format(rank)]
+                    lines.append('{}{}{{{},quantile="{}"}} {}'.format(Metrics.PREFIX, name, labels, rank / 100,
+                        "NaN" if quantile is None else quantile))
+
+                lines.append("{}{}_sum{{{}}} {}".format(Metrics.PREFIX, name, labels, measures["sum"]))
+                lines.append("{}{}_count{{{}}} {}".format(Metrics.PREFIX, name, labels, measures["count"]))
+
+        def counter(name, description, key):
+            lines.append("# HELP {}{} {}".format(Metrics.PREFIX, name, description))
+            lines.append("# TYPE {}{} counter".format(Metrics.PREFIX, name))
+
+            for (player, measures) in snapshot["players"].items():
+                lines.append('{}{}{{player="{}"}} {}'.format(Metrics.PREFIX, name, Metrics._escape(player), measures[key]))
+
+        players = snapshot["players"].items()
+
+        summary("player_latency_ms", "Time for a player to answer polling data.", "player",
+            [(player, measures["latency"]) for (player, measures) in players])
+        summary("player_cpu_ms", "CPU time spent by a player on a response, when measured.", "player",
+            [(player, measures["cpu"]) for (player, measures) in players])
+        summary("player_serialization_ms", "Time to build and send the polling data of a player.", "player",
+            [(player, measures["serialization"]) for (player, measures) in players])
+        counter("player_responses_total", "Responses received from a player.", "responses")
+        counter("player_misses_total", "Turns a player did not answer in time.", "misses")
+        counter("player_late_total", "Responses received after the time given to the player.", "late")
+        counter("player_over_budget_total", "Responses dropped for taking more than the think time.", "overBudget")
+        counter("player_invalid_total", "Entries of the responses of a player that were rejected.", "invalid")
+        summary("tick_phase_ms", "Duration of a phase of a game tick.", "phase", snapshot["phases"].items())
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    def toCsv(self):
+        """
+        Returns:
+            text (string) : The measures in CSV, one line per histogram or counter, with a header.
+        """
+        snapshot = self.snapshot()
+        columns = ["count", "sum"] + ["p{}".format(rank) for rank in Metrics.PERCENTILES]
+        lines = [",".join(["measure", "name"] + columns)]
+
+        def row(measure, name, values):
+            lines.append(",".join([measure, '"{}"'.format(str(name).replace('"', '""'))] + values))
+
+        for (player, measures) in snapshot["players"].items():
+            for measure in ("latency", "cpu", "serialization"):
+                row(measure, player, ["" if measures[measure][column] is None else str(measures[measure][column]) for column in columns])
+
+            for measure in ("responses", "misses", "late", "overBudget", "invalid"):
+                row(measure, player, [str(measures[measure])] + [""] * (len(columns) - 1))
+
+        for (phase, measures) in snapshot["phases"].items():
+            row("phase", phase, ["" if measures[column] is None else str(measures[column]) for column in columns])
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path = None):
+        """
+        Writes the measures in a file, replaced at once so that it is never read half written.
+
+        Parameters:
+            path (string) : The file, path by default. Prometheus text format, or CSV when it ends with .csv.
+        """
+        path = path or self.path
+
+        if path is None:
+            return
+
+        temporaryPath = "{}.{}.tmp".format(path, os.getpid())
+
+        with open(temporaryPath, "w") as file:
+            file.write(self.toCsv() if path.endswith(".csv") else self.toPrometheus())
+
+        os.replace(temporaryPath, path)
+        self._lastWrite = time.monotonic()
+
+    def tick(self):
+        """
+        Writes the measures in the file when intervalSeconds passed since they were last written.
+        """
+        if self.path is not None and time.monotonic() - self._lastWrite >= self.intervalSeconds:
+            self.write()
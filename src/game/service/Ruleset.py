@@ -20,6 +20,10 @@ class Ruleset:
                 'StartCountdownSeconds' : 3,
                 'ThinkTimeMs' : 16,
                 'BotShootCooldown': 1000,
+                'MaxDurationSeconds': 0,
+                'WallSliding': 0,
+                'ThinkTimeCpu': 0,
+                'ThinkWallCapMs': 100,
             },
         }
 
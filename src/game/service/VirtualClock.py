@@ -0,0 +1,26 @@
+
+class VirtualClock:
+    """
+    A clock that only moves forward when told to.
+
+    Share a single instance between every VirtualTimeManager of a game so they all agree on the current time.
+
+    Attributes:
+        timeMs (float) : The current time in milliseconds.
+    """
+
+    def __init__(self, startMs = 0):
+        self.timeMs = startMs
+
+    def Advance(self, ms):
+        """
+        Moves the clock forward by ms milliseconds. Negative values are ignored.
+        """
+        if ms > 0:
+            self.timeMs += ms
+
+    def Set(self, timeMs):
+        """
+        Moves the clock to an absolute time in milliseconds, as long as it is not in the past.
+        """
+        self.Advance(timeMs - self.timeMs)
@@ -0,0 +1,46 @@
+from service.TimeManager import TimeManager
+from service.Config import Config
+
+class VirtualTimeManager(TimeManager):
+    """
+    A TimeManager reading its time from a VirtualClock instead of the system clock.
+
+    Methods that would sleep advance the clock instead, which lets a headless game run as fast as the machine allows.
+
+    Attributes:
+        clock (VirtualClock) : The clock shared by every object of a game.
+    """
+
+    def __init__(self, clock):
+        self._clock = clock
+
+    def GetTimeMs(self):
+        """
+        Get the time of the virtual clock in milliseconds.
+
+        Returns:
+            time (int) : Time in milliseconds.
+        """
+        return int(round(self._clock.timeMs))
+
+    def NextFrame(self):
+        """
+        Advance the clock to the next frame depending on the Framerate found in Config.
+
+        Returns:
+            deltaTime (int) : Time delta in milliseconds since last call to Mark() or StartTimer().
+        """
+        msWait = 1000 / Config.Framerate()
+
+        deltaTime = self.PeekDeltaTimeMs()
+        if deltaTime < msWait:
+            self._clock.Advance(msWait - deltaTime)
+            deltaTime = msWait
+
+        return deltaTime
+
+    def Sleep(self, ms):
+        """
+        Advance the clock by a time in milliseconds
+        """
+        self._clock.Advance(ms)
@@ -1,3 +1,7 @@
 from .TimeManager import TimeManager
+from .VirtualClock import VirtualClock
+from .VirtualTimeManager import VirtualTimeManager
 from .Config import Config
-from .Ruleset import Ruleset
\ No newline at end of file
+from .Ruleset import Ruleset
+from .Histogram import Histogram
+from .Metrics import Metrics
\ No newline at end of file
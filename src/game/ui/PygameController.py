@@ -15,24 +15,31 @@ class PygameController(Controller):
 
     def tick(self, deltaTime):
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                # terminate player processes
-                sys.exit()
-        
-            elif event.type == pygame.MOUSEMOTION:
-                self._model.mouseCoords = pygame.mouse.get_pos()
-                (x,y) = (self._model.mouseCoords[0],self._model.mouseCoords[1])
-                self.current_mousex = int(x//self._view.get_mult_factor())
-                self.current_mousey = int(y//self._view.get_mult_factor())
+            self.handleEvent(event)
 
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_a:
-                    self._view.debug_switch(PygameView.DEBUG_COLLISIONMAP)
-                if event.key == pygame.K_z:
-                    self._view.debug_switch(PygameView.DEBUG_CELL_COORDS)
-                if event.key == pygame.K_s:
-                    self._view.debug_switch(PygameView.DEBUG_SEEN)
-                # if event.key == pygame.K_e:
-                #     self._view.debug_switch(PygameView.DEBUG_VERTICES)
-                # if event.key == pygame.K_r:
-                #     self._view.debug_switch(PygameView.DEBUG_CORNERS)
\ No newline at end of file
+    def handleEvent(self, event):
+        """
+        Reacts to one pygame event.
+        """
+        if event.type == pygame.QUIT:
+            # terminate player processes
+            self._model.stop()
+            sys.exit()
+    
+        elif event.type == pygame.MOUSEMOTION:
+            self._model.mouseCoords = pygame.mouse.get_pos()
+            (x,y) = (self._model.mouseCoords[0],self._model.mouseCoords[1])
+            self.current_mousex = int(x//self._view.get_mult_factor())
+            self.current_mousey = int(y//self._view.get_mult_factor())
+
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_a:
+                self._view.debug_switch(PygameView.DEBUG_COLLISIONMAP)
+            if event.key == pygame.K_z:
+                self._view.debug_switch(PygameView.DEBUG_CELL_COORDS)
+            if event.key == pygame.K_s:
+                self._view.debug_switch(PygameView.DEBUG_SEEN)
+            # if event.key == pygame.K_e:
+            #     self._view.debug_switch(PygameView.DEBUG_VERTICES)
+            # if event.key == pygame.K_r:
+            #     self._view.debug_switch(PygameView.DEBUG_CORNERS)
\ No newline at end of file
@@ -7,6 +7,8 @@ from pygame.locals import *
 
 from math import (ceil, floor, radians, cos, sin)
 
+import numpy
+
 # Implements View using pygame
 class PygameView(View):
     """
@@ -109,7 +111,7 @@ class PygameView(View):
         display_debug = False
 
         if self.debug[PygameView.DEBUG_COLLISIONMAP]:
-            self.displayCollisionMap("RegularBot")
+            self.displayCollisionMap("RegularBot", 36)
             display_debug = True
             debug_message += "Collision map (a) :  ON  "
         else:
@@ -295,56 +297,57 @@ class PygameView(View):
             self.countdownEnd = True
             self._refreshMap = True
             
-    def displayCollisionMap(self, name):
+    def displayCollisionMap(self, name, padding):
         """
-        Displays a collision map.
+        Displays a collision map, computed the first time it is displayed : the game itself does not use it.
 
         Parameters:
             name (string) : The identifier of this collision map. Example: "RegularBot"
+            padding (int) : The distance to keep from solid blocks. Example: the radius of a RegularBot
         """
         try:
 
             self._window.blit(self.collisionSurface, (0, 0))
         except:
+            if name not in self._model.getEngine().collisionsMaps:
+                self._model.getEngine().createCollisionMap(name, padding)
+
             collisionMap = self._model.getEngine().collisionsMaps[name]
             divider = self._model.getEngine().collisionsMapsDividers[name]
 
             self.collisionSurface = pygame.Surface(self._windowRect, pygame.SRCALPHA)
 
-            (x,y) = (0,0)
-            for line in collisionMap:
-                for dot in line:
-                    if dot:
-
-                        currentRect = pygame.Rect(
-                            int(x * self._cellSize // divider),
-                            int(y * self._cellSize // divider),
-                            round(self._cellSize / divider),
-                            round(self._cellSize / divider)
-                        )
-                        
-                        (r, g, b, a) = (255,0,0,60)
+            (r, g, b, a) = (255,0,0,60)
 
-                        pygame.draw.rect(self.collisionSurface, pygame.Color(r, g, b, a), currentRect)
-                    y += 1
-                x += 1
-                y = 0
-            
+            for (x, y) in numpy.argwhere(collisionMap):
+                currentRect = pygame.Rect(
+                    int(x * divider * self._multFactor),
+                    int(y * divider * self._multFactor),
+                    round(divider * self._multFactor),
+                    round(divider * self._multFactor)
+                )
+
+                pygame.draw.rect(self.collisionSurface, pygame.Color(r, g, b, a), currentRect)
 
     def displaySeen(self):
         """
         DEBUG: Dislpays a line when a bot sees an ennemy bot
         """
+        visibility = self._model.getVisibility()
+
+        if visibility is None:
+            return
+
         for bot1 in self._model.getBots(1).values():
             for bot2 in self._model.getBots(2).values():
-                if(self._model.getEngine().sees(bot1,bot2)):
+                if(visibility.sees(bot1,bot2)):
                     pygame.draw.line(
                         self._window,
                         pygame.Color(255,0,0,255),
                         (bot1.x * self.get_mult_factor(), bot1.y * self.get_mult_factor()),
                         (bot2.x * self.get_mult_factor(), bot2.y * self.get_mult_factor()),
                     )
-                if(self._model.getEngine().sees(bot2,bot1)):
+                if(visibility.sees(bot2,bot1)):
                     pygame.draw.line(
                         self._window,
                         pygame.Color(0,0,255,255),
@@ -563,4 +566,11 @@ class PygameView(View):
 
     def debug_switch(self, debugmode):
         self.debug[debugmode] = not self.debug[debugmode]
-        self._refreshMap = True
\ No newline at end of file
+        self._refreshMap = True
+
+    def refresh(self):
+        """
+        Draws the whole map again at the next tick, needed when the bots jump elsewhere (when watching a timeline).
+        """
+        self.shoots = list()
+        self._refreshMap = True
@@ -0,0 +1,49 @@
+from ui.PygameController import PygameController
+
+import pygame
+
+# Implements Controller
+class TimelineController(PygameController):
+    """
+    Controls a TimelineModel being watched : the usual debug keys, and keys to move in the game.
+
+    Space pauses, left and right go back or forward SEEK_MS, up and down change the speed,
+    home and end go to the start or the end, and 0 to 9 go to 0% to 90% of the game.
+    """
+
+    SEEK_MS = 5000
+
+    def handleEvent(self, event):
+        super().handleEvent(event)
+
+        if event.type != pygame.KEYDOWN:
+            return
+
+        model = self._model
+
+        if event.key == pygame.K_SPACE:
+            model.playing = not model.playing
+            return
+
+        if event.key == pygame.K_UP:
+            model.speed = min(model.speed * 2, 64)
+            return
+
+        if event.key == pygame.K_DOWN:
+            model.speed = max(model.speed / 2, 1 / 8)
+            return
+
+        if event.key == pygame.K_LEFT:
+            model.seekTime(model.timeMs - TimelineController.SEEK_MS)
+        elif event.key == pygame.K_RIGHT:
+            model.seekTime(model.timeMs + TimelineController.SEEK_MS)
+        elif event.key == pygame.K_HOME:
+            model.seek(0)
+        elif event.key == pygame.K_END:
+            model.seek(model.getReader().framesCount - 1)
+        elif pygame.K_0 <= event.key <= pygame.K_9:
+            model.seek((event.key - pygame.K_0) * model.getReader().framesCount // 10)
+        else:
+            return
+
+        self._view.refresh()
@@ -2,4 +2,5 @@ from .Controller import Controller
 from .PygameController import PygameController
 from .PygameView import PygameView
 from .View import View
-from .PygameFactory import PygameFactory
\ No newline at end of file
+from .PygameFactory import PygameFactory
+from .TimelineController import TimelineController
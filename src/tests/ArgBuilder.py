@@ -8,6 +8,12 @@ SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.
 sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
 
 from model.ArgBuilder.DictBuilder import DictBuilder
+from model.ArgBuilder.DeltaDictBuilder import DeltaDictBuilder
+from model.ArgBuilder.BinaryBuilder import BinaryBuilder
+from domain.PollingView import PollingView
+from domain.BinaryPolling import BinaryPolling
+from domain.BinaryResponse import BinaryResponse
+from domain.GameObject.Flag import Flag
 from service import *
 from domain.GameObject.Bot.RegularBot import RegularBot
 
@@ -82,4 +88,125 @@ class TestDictBuilder(unittest.TestCase):
                 if parameter not in result["bots"][i].keys():
                     self.fail("Parameter {} wasn't set in bot number {}.".format(parameter, i))
 
-        
\ No newline at end of file
+        
+
+
+class TestDeltaDictBuilder(unittest.TestCase):
+
+    def __init__(self, methodName):
+        super().__init__(methodName)
+        Config.Initialize()
+        Ruleset.Initialize()
+
+    def build(self, builder, bots, seen):
+        builder.beginArgument()
+
+        for (botId, bot) in enumerate(bots):
+            builder.addBot(bot, botId, seen[botId])
+
+        builder.addMissedTicks(0)
+        builder.endArgument()
+
+        return builder.getResult()
+
+    def test_rebuild(self):
+        bots = [RegularBot(1, 100 * i, 50) for i in range(5)]
+        enemies = [RegularBot(2, 10 * i, 20) for i in range(3)]
+        flag = Flag(2, 300, 400)
+
+        (full, delta, view) = (DictBuilder(), DeltaDictBuilder(), PollingView())
+
+        seenByTick = [
+            [[enemies[0], flag], [], [], [], []],
+            [[enemies[0], flag], [], [], [], []],
+            [[enemies[1]], [enemies[0]], [], [], [flag]],
+            [[], [enemies[0]], [], [], [flag]],
+        ]
+
+        for (tick, seen) in enumerate(seenByTick):
+            if tick == 2:
+                bots[0].move(5, 5)
+                enemies[0].health -= 10
+            if tick == 3:
+                enemies[0].move(1, 0)
+
+            expected = self.build(full, bots, seen)
+            changes = self.build(delta, bots, seen)
+            rebuilt = view.update(changes)
+
+            # Nothing changed, nothing sent
+            if tick == 1:
+                assert(changes["bots"] == {})
+
+            assert(rebuilt["bots"].keys() == expected["bots"].keys())
+
+            for botId in expected["bots"]:
+                (expectedBot, rebuiltBot) = (dict(expected["bots"][botId]), dict(rebuilt["bots"][botId]))
+                key = lambda gameObject: gameObject["currentPosition"]
+                assert(sorted(expectedBot.pop("seen"), key = key) == sorted(rebuiltBot.pop("seen"), key = key))
+                assert(expectedBot == rebuiltBot)
+
+        # Full polling data is left as it is
+        assert(view.update(expected) is expected)
+
+
+class TestBinaryBuilder(unittest.TestCase):
+
+    def __init__(self, methodName):
+        super().__init__(methodName)
+        Config.Initialize()
+        Ruleset.Initialize()
+
+    def build(self, builder, bots, seen):
+        builder.beginArgument()
+        builder.addFlag(2, (300, 400))
+
+        for (botId, bot) in enumerate(bots):
+            builder.addBot(bot, "1_{}".format(botId), seen[botId])
+
+        builder.addMissedTicks(3)
+        builder.endArgument()
+
+        return builder.getResult()
+
+    def test_decode(self):
+        bots = [RegularBot(1, 100 * i, 50) for i in range(5)]
+        enemy = RegularBot(2, 10, 20)
+        enemy.health -= 10
+        flag = Flag(2, 300, 400)
+        seen = [[enemy, flag], [], [flag], [], [enemy]]
+
+        expected = self.build(DictBuilder(), bots, seen)
+        polling = BinaryPolling(self.build(BinaryBuilder(64), bots, seen))
+
+        assert(polling.toDict() == expected)
+
+        # Views read the buffer when accessed
+        bot = polling.bot("1_0")
+        assert(bot.x == 0 and bot.y == 50)
+        assert(bot.seen[0].type == "RegularBot" and bot.seen[0].life == enemy.health)
+        assert(not bot.seen[1].isBot and bot.seen[1].currentPosition == (flag.x, flag.y))
+        assert(polling.flags == [(2, 300, 400)])
+
+        with self.assertRaises(Exception):
+            BinaryPolling(bytes(64))
+
+    def test_reuse(self):
+        builder = BinaryBuilder()
+        bots = [RegularBot(1, 100 * i, 50) for i in range(5)]
+
+        self.build(builder, bots, [[]] * 5)
+        bots[0].move(5, 5)
+        polling = BinaryPolling(self.build(builder, bots, [[]] * 5))
+
+        assert(polling.bot("1_0").currentPosition == (bots[0].x, bots[0].y, bots[0].angle, bots[0].speed))
+
+    def test_response(self):
+        response = { "bots": {
+            "1_0": { "targetPosition": (10, 20, 1), "actions": 3 },
+            "1_4": { "targetPosition": (0.5, 0, 0), "actions": 0 },
+        }}
+        encoder = BinaryResponse(8)
+
+        assert(BinaryResponse.decode(encoder.encode(response)) == response)
+        assert(BinaryResponse.decode(encoder.encode({})) == {})
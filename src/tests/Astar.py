@@ -0,0 +1,101 @@
+import sys
+import os
+
+import random
+import unittest
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from ai.pathFinding.aStar.Astar import Astar
+from ai.pathFinding.aStar.NodeAstar import NodeAstar
+from ai.pathFinding.base.Graph import Graph
+from ai.pathFinding.base.GridGraph import GridGraph
+from ai.pathFinding.MapAnalysis import MapAnalysis
+from domain.Map.RegularMap import RegularMap
+from domain.Map import Map
+
+MAP_FILE = os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT, "maps/map_01.txt"))
+
+def distances(mapData, solid, start):
+    """
+    Length of the shortest path from start to every cell, by breadth-first search.
+    """
+    distances = { start: 0 }
+    frontier = [start]
+
+    while frontier:
+        (x, y) = frontier.pop(0)
+
+        for (dx, dy) in ((1, 0), (0, 1), (-1, 0), (0, -1)):
+            cell = (x + dx, y + dy)
+
+            if 0 <= cell[0] < mapData["blockWidth"] and 0 <= cell[1] < mapData["blockHeight"] and cell not in solid and cell not in distances:
+                distances[cell] = distances[(x, y)] + 1
+                frontier.append(cell)
+
+    return distances
+
+class TestAstar(unittest.TestCase):
+
+    def test_getPath(self):
+        mapData = RegularMap.loadMapData(MAP_FILE)
+        RegularMap(mapData)
+
+        finder = Astar(MapAnalysis.Get(mapData).graph)
+
+        solid = { (x, y) for x in range(mapData["blockWidth"]) for y in range(mapData["blockHeight"])
+            if isinstance(mapData["blocks"][x][y], Astar.SOLID) }
+        free = sorted({ (x, y) for x in range(mapData["blockWidth"]) for y in range(mapData["blockHeight"]) } - solid)
+
+        center = lambda cell: (cell[0] * Map.BLOCKSIZE + Map.BLOCKSIZE // 2, cell[1] * Map.BLOCKSIZE + Map.BLOCKSIZE // 2)
+
+        randomState = random.Random(3)
+
+        for i in range(20):
+            (start, goal) = (randomState.choice(free), randomState.choice(free))
+            path = finder.getPath(center(start), center(goal))
+            shortest = distances(mapData, solid, start)
+
+            if goal not in shortest:
+                assert(path is None)
+                continue
+
+            # Shortest, from the start to the goal, one free cell at a time
+            assert(path[0] == start and path[-1] == goal)
+            assert(len(path) == shortest[goal] + 1)
+
+            for (cell, nextCell) in zip(path, path[1:]):
+                assert(abs(cell[0] - nextCell[0]) + abs(cell[1] - nextCell[1]) == 1)
+                assert(nextCell not in solid)
+
+    def test_gridGraph(self):
+        mapData = RegularMap.loadMapData(MAP_FILE)
+        RegularMap(mapData)
+
+        graph = GridGraph(mapData)
+        stored = GridGraph.FromStored(graph.storeGraph())
+
+        assert((stored.width, stored.height) == (mapData["blockWidth"], mapData["blockHeight"]))
+        assert(stored.walkable == graph.walkable and stored.costs == graph.costs)
+
+        # (1, 1) is in the corner of the walls around the map
+        assert(graph.neighbors(graph.index(1, 1)) == [graph.index(1, 2), graph.index(2, 1)])
+
+        # Same paths as on a graph with a node per block
+        nodes = [NodeAstar(x, y, mapData["blocks"][x][y]) for y in range(mapData["blockHeight"]) for x in range(mapData["blockWidth"])]
+        nodes.reverse()
+
+        (gridFinder, nodesFinder) = (Astar(graph), Astar(Graph(nodes, [], None)))
+
+        center = lambda cell: (cell[0] * Map.BLOCKSIZE + Map.BLOCKSIZE // 2, cell[1] * Map.BLOCKSIZE + Map.BLOCKSIZE // 2)
+        free = [graph.cell(index) for index in range(graph.width * graph.height) if graph.walkable[index]]
+
+        randomState = random.Random(4)
+
+        for i in range(10):
+            (start, goal) = (center(randomState.choice(free)), center(randomState.choice(free)))
+
+            assert(gridFinder.searchGrid(*[(point[0] // Map.BLOCKSIZE, point[1] // Map.BLOCKSIZE) for point in (start, goal)])
+                == nodesFinder.searchNodes(*nodesFinder.getNodeStartGoal(start, goal)))
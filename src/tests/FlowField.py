@@ -0,0 +1,75 @@
+import sys
+import os
+
+import math
+import unittest
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from ai.pathFinding.aStar.Astar import Astar
+from ai.pathFinding.base.GridGraph import GridGraph
+from ai.pathFinding.flowField.FlowField import FlowField
+from ai.pathFinding.flowField.FlowFields import FlowFields
+from domain.Map.RegularMap import RegularMap
+from domain.Map import Map
+
+MAP_FILE = os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT, "maps/map_01.txt"))
+
+def loadMap():
+    mapData = RegularMap.loadMapData(MAP_FILE)
+    RegularMap(mapData)
+
+    return (mapData, GridGraph(mapData))
+
+def pathCost(graph, path):
+    return sum(graph.costs[graph.index(*cell)] for cell in path[1:])
+
+class TestFlowField(unittest.TestCase):
+
+    def test_fields(self):
+        (mapData, graph) = loadMap()
+        fields = FlowFields(graph, mapData)
+
+        for (kind, team) in ((kind, team) for kind in FlowFields.KINDS for team in (1, 2)):
+            field = fields.get(kind, team)
+            blocks = { (block.x // Map.BLOCKSIZE, block.y // Map.BLOCKSIZE) for block in mapData[kind][team] }
+
+            assert(set(field.targets) == blocks)
+
+            for target in field.targets:
+                assert(field.distance(target) == 0 and field.nextCell(target) == target)
+
+    def test_shortest(self):
+        (mapData, graph) = loadMap()
+        finder = Astar(graph)
+
+        target = (mapData["flagZones"][1][0].x // Map.BLOCKSIZE, mapData["flagZones"][1][0].y // Map.BLOCKSIZE)
+
+        # Every cell costing the same, then a cell costing more that paths go around when they can
+        for cost in (1, 6):
+            graph.setCost(10, 4, cost)
+            field = FlowField(graph, [target])
+
+            for index in range(graph.width * graph.height):
+                cell = graph.cell(index)
+
+                if not graph.walkable[index]:
+                    assert(field.nextCell(cell) is None and field.path(cell) is None)
+                    continue
+
+                path = field.path(cell)
+                shortest = finder.searchGrid(cell, target)
+
+                if shortest is None:
+                    assert(path is None and field.distance(cell) == math.inf)
+                    continue
+
+                # As cheap as the path of Astar, one free cell at a time
+                assert(path[0] == cell and path[-1] == target)
+                assert(field.distance(cell) == pathCost(graph, path) == pathCost(graph, shortest))
+
+                for (step, nextStep) in zip(path, path[1:]):
+                    assert(abs(step[0] - nextStep[0]) + abs(step[1] - nextStep[1]) == 1)
+                    assert(graph.walkable[graph.index(*nextStep)])
@@ -2,6 +2,7 @@ import sys
 import os
 import io
 
+import time
 import unittest
 
 PACKAGE_PARENT = '../game'
@@ -10,9 +11,14 @@ sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
 
 from domain.Player import Player
 from model.GameModel import GameModel
+from model.PlayerPool import PlayerPool
 from service.Config import Config
+from service.Metrics import Metrics
 from service.Ruleset import Ruleset
 from service.TimeManager import TimeManager
+from service.VirtualClock import VirtualClock
+
+MAP_FILE = os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT, "maps/map_01.txt"))
 
 class myPlayer(Player):
 
@@ -22,6 +28,46 @@ class myPlayer(Player):
     def poll(self, pollingData):
         pass
 
+class BurningPlayer(Player):
+    """
+    Computes for longer than the think time.
+    """
+
+    def __init__(self, map, rules, team):
+        pass
+
+    def poll(self, pollingData):
+        end = time.process_time() + 0.06
+
+        while time.process_time() < end:
+            pass
+
+        return {}
+
+class SleepingPlayer(Player):
+    """
+    Takes longer than the think time on the wall clock, without computing.
+    """
+
+    def __init__(self, map, rules, team):
+        pass
+
+    def poll(self, pollingData):
+        time.sleep(0.06)
+
+        return {}
+
+class CrashingPlayer(Player):
+    """
+    Its process dies on the first polling, without answering.
+    """
+
+    def __init__(self, map, rules, team):
+        pass
+
+    def poll(self, pollingData):
+        os._exit(1)
+
 class TestGameModel(unittest.TestCase):
 
     def __init__(self, methodName):
@@ -75,4 +121,81 @@ class TestGameModel(unittest.TestCase):
         # restore timemanager for other tests
         TimeManager.GetTimeMs = TimeManager.oldGetTimeMs
 
-        assert(True)
\ No newline at end of file
+        assert(True)
+class TestThinkTime(unittest.TestCase):
+
+    def test_cpuBudget(self):
+        Config.Initialize()
+        Ruleset.Initialize()
+
+        ruleset = Ruleset.GetRuleset()
+        saved = { key: ruleset[key] for key in ("ThinkTimeMs", "ThinkTimeCpu", "ThinkWallCapMs") }
+
+        ruleset["ThinkTimeMs"] = "20"
+        ruleset["ThinkTimeCpu"] = "1"
+        ruleset["ThinkWallCapMs"] = "1000"
+
+        transport = Config.config.parser["Gameplay"]["PlayerTransport"]
+        save_stdout = sys.stdout
+
+        try:
+            # Each player in its process, then both in the workers of a pool, then through shared memory
+            for (pool, playerTransport) in ((None, "Queue"), (PlayerPool(2), "Queue"), (None, "SharedMemory")):
+                Config.config.parser["Gameplay"]["PlayerTransport"] = playerTransport
+
+                metrics = Metrics()
+                model = GameModel(BurningPlayer, SleepingPlayer, MAP_FILE, clock = VirtualClock(), seed = 1, pool = pool, metrics = metrics)
+
+                sys.stdout = io.StringIO()
+
+                try:
+                    while model.turn < 3:
+                        model.tick(20)
+                finally:
+                    sys.stdout = save_stdout
+                    model.stop()
+
+                    if pool is not None:
+                        pool.close()
+
+                # Both answered the polling of turn 2 within the wall-clock cap
+                assert(model.teamsData["1"] is None)
+                assert(model.teamsData["2"] == {})
+
+                measures = metrics.snapshot()["players"]["GameModel"]
+
+                assert(measures["overBudget"] == 1)
+                assert(measures["cpu"]["count"] == 4 and measures["cpu"]["p99"] >= 60)
+        finally:
+            sys.stdout = save_stdout
+            Config.config.parser["Gameplay"]["PlayerTransport"] = transport
+
+            for (key, value) in saved.items():
+                ruleset[key] = value
+
+    def test_waitForPlayers(self):
+        Config.Initialize()
+        Ruleset.Initialize()
+
+        transport = Config.config.parser["Gameplay"]["PlayerTransport"]
+        Config.config.parser["Gameplay"]["PlayerTransport"] = "Queue"
+
+        try:
+            # Both answer at once, then one dies instead : either way there is nothing left to wait for
+            for (Player2, answered) in ((myPlayer, { "1", "2" }), (CrashingPlayer, { "1" })):
+                model = GameModel(myPlayer, Player2, MAP_FILE)
+
+                try:
+                    for playerProcess in model._playerProcesses.values():
+                        playerProcess.setData({})
+                        playerProcess.execute()
+
+                    start = time.perf_counter()
+                    model.waitForPlayers(5000)
+
+                    assert(time.perf_counter() - start < 2)
+                    assert(model._answered == answered)
+                finally:
+                    model.stop()
+        finally:
+            Config.config.parser["Gameplay"]["PlayerTransport"] = transport
@@ -0,0 +1,92 @@
+import sys
+import os
+
+import random
+import unittest
+
+from array import array
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from ai.pathFinding.aStar.Astar import Astar
+from ai.pathFinding.base.Graph import Graph
+from ai.pathFinding.base.GridGraph import GridGraph
+from ai.pathFinding.jumpPoint.JumpPointSearch import JumpPointSearch
+from domain.Map.RegularMap import RegularMap
+from domain.Map import Map
+
+MAP_FILE = os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT, "maps/map_01.txt"))
+
+def loadGraph():
+    mapData = RegularMap.loadMapData(MAP_FILE)
+    RegularMap(mapData)
+
+    return GridGraph(mapData)
+
+def center(cell):
+    return (cell[0] * Map.BLOCKSIZE + Map.BLOCKSIZE // 2, cell[1] * Map.BLOCKSIZE + Map.BLOCKSIZE // 2)
+
+class TestJumpPointSearch(unittest.TestCase):
+
+    def test_getPath(self):
+        graph = loadGraph()
+        (jps, astar) = (JumpPointSearch(graph), Astar(graph))
+
+        free = [graph.cell(index) for index in range(graph.width * graph.height) if graph.walkable[index]]
+        (jpsExpanded, astarExpanded) = (0, 0)
+
+        randomState = random.Random(5)
+
+        for i in range(50):
+            (start, goal) = (randomState.choice(free), randomState.choice(free))
+
+            path = jps.getPath(center(start), center(goal))
+            shortest = astar.getPath(center(start), center(goal))
+
+            (jpsExpanded, astarExpanded) = (jpsExpanded + jps.expanded, astarExpanded + astar.expanded)
+
+            if shortest is None:
+                assert(path is None)
+                continue
+
+            # As short as the path of Astar, one free cell at a time
+            assert(path[0] == start and path[-1] == goal)
+            assert(len(path) == len(shortest))
+
+            for (cell, nextCell) in zip(path, path[1:]):
+                assert(abs(cell[0] - nextCell[0]) + abs(cell[1] - nextCell[1]) == 1)
+                assert(graph.walkable[graph.index(*nextCell)])
+
+        # The corridors are crossed in a few jumps
+        assert(jpsExpanded * 4 < astarExpanded)
+
+    def test_costs(self):
+        graph = loadGraph()
+        jps = JumpPointSearch(graph)
+
+        assert(jps.isUniform())
+
+        # Searched by Astar once a cell costs more
+        graph.setCost(10, 4, 20)
+
+        path = jps.getPath(center((10, 3)), center((10, 5)))
+
+        assert(not jps.isUniform())
+        assert((10, 4) not in path)
+
+        with self.assertRaises(Exception):
+            JumpPointSearch(Graph([], [], None))
+
+    def test_singleColumn(self):
+        # Moving up or down a column of width 1 is moving by 1 cell index, like moving sideways in a wider grid
+        graph = GridGraph(None)
+        (graph.width, graph.height) = (1, 12)
+        graph.walkable = bytearray([1]) * 12
+        graph.costs = array("d", [1]) * 12
+
+        jps = JumpPointSearch(graph)
+
+        assert(jps.getPath(center((0, 5)), center((0, 1))) == [(0, y) for y in range(5, 0, -1)])
+        assert(jps.getPath(center((0, 1)), center((0, 11))) == [(0, y) for y in range(1, 12)])
@@ -0,0 +1,55 @@
+import sys
+import os
+
+import unittest
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from service.Histogram import Histogram
+from service.Metrics import Metrics
+
+class TestMetrics(unittest.TestCase):
+
+    def test_percentiles(self):
+        histogram = Histogram(100)
+
+        assert(histogram.percentiles(50) == [None])
+
+        for value in range(1, 201):
+            histogram.add(value)
+
+        # Only the latest values count for percentiles, every value for totals
+        assert(histogram.percentiles(50, 95, 99, 100) == [150, 195, 199, 200])
+        assert(histogram.count == 200 and histogram.sum == 200 * 201 // 2)
+
+    def test_snapshot(self):
+        metrics = Metrics(10)
+
+        metrics.recordResponse("ai.a", 4)
+        metrics.recordResponse("ai.a", 12, late = True, cpuMs = 3)
+        metrics.recordMiss("ai.a")
+        metrics.recordOverBudget("ai.a")
+        metrics.recordInvalid("ai.a", 2)
+        metrics.recordSerialization("ai.a", 0.5)
+
+        with metrics.time("physics"):
+            pass
+
+        snapshot = metrics.snapshot()
+        player = snapshot["players"]["ai.a"]
+
+        assert(player["responses"] == 2 and player["late"] == 1 and player["misses"] == 1)
+        assert(player["latency"]["p50"] == 4 and player["latency"]["p99"] == 12)
+        assert(player["cpu"]["count"] == 1 and player["overBudget"] == 1 and player["invalid"] == 2)
+        assert(snapshot["phases"]["physics"]["count"] == 1)
+
+        prometheus = metrics.toPrometheus()
+        assert('iactf_player_latency_ms{player="ai.a",quantile="0.5"} 4' in prometheus)
+        assert('iactf_player_misses_total{player="ai.a"} 1' in prometheus)
+        assert('iactf_player_over_budget_total{player="ai.a"} 1' in prometheus)
+
+        csv = metrics.toCsv().splitlines()
+        assert(csv[0] == "measure,name,count,sum,p50,p95,p99")
+        assert('latency,"ai.a",2,16,4,12,12' in csv)
@@ -0,0 +1,121 @@
+import sys
+import os
+
+import multiprocessing
+import unittest
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from ai.pathFinding.aStar.Astar import Astar
+from ai.pathFinding.base.GridGraph import GridGraph
+from ai.pathFinding.MapAnalysis import MapAnalysis
+from ai.pathFinding.PathCache import PathCache
+from ai.pathFinding.SharedPathCache import SharedPathCache
+from domain.Map.RegularMap import RegularMap
+from domain.Map import Map
+
+MAP_FILE = os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT, "maps/map_01.txt"))
+
+def loadGraph():
+    mapData = RegularMap.loadMapData(MAP_FILE)
+    RegularMap(mapData)
+
+    return GridGraph(mapData)
+
+def center(cell):
+    return (cell[0] * Map.BLOCKSIZE + Map.BLOCKSIZE // 2, cell[1] * Map.BLOCKSIZE + Map.BLOCKSIZE // 2)
+
+def findPaths(graph, cache, cells):
+    finder = Astar(graph, cache = cache)
+
+    for (start, goal) in cells:
+        finder.getPath(center(start), center(goal))
+
+class TestPathCache(unittest.TestCase):
+
+    def test_lru(self):
+        graph = loadGraph()
+        cache = PathCache(capacity = 2)
+
+        for goal in ((2, 1), (3, 1), (4, 1)):
+            cache.put(graph, (1, 1), goal, [(1, 1), goal])
+
+        # The oldest path was evicted
+        assert(len(cache) == 2 and cache.evictions == 1)
+        assert(cache.get(graph, (1, 1), (2, 1)) is PathCache.MISS)
+
+        # Used last, (3, 1) stays when (5, 1) comes in
+        assert(cache.get(graph, (1, 1), (3, 1)) == [(1, 1), (3, 1)])
+        cache.put(graph, (1, 1), (5, 1), None)
+
+        assert(cache.get(graph, (1, 1), (3, 1)) is not PathCache.MISS)
+        assert(cache.get(graph, (1, 1), (4, 1)) is PathCache.MISS)
+        assert(cache.get(graph, (1, 1), (5, 1)) is None)
+
+        assert((cache.hits, cache.misses) == (3, 2))
+
+    def test_getPath(self):
+        graph = loadGraph()
+        finder = Astar(graph)
+
+        path = finder.getPath(center((1, 1)), center((6, 1)))
+
+        # The caller gets its own copy
+        path.insert(1, (0, 0))
+        assert(finder.getPath(center((1, 1)), center((6, 1))) == [(x, 1) for x in range(1, 7)])
+
+        # A path crossing a cell whose cost changed is searched again
+        graph.setCost(3, 1, 10)
+        finder.getPath(center((1, 1)), center((6, 1)))
+
+        assert(finder.cacheStats()["hits"] == 1)
+        assert(finder.cacheStats()["invalidations"] == 1)
+
+    def test_shared(self):
+        graph = loadGraph()
+        cache = SharedPathCache(graph, slots = 64)
+
+        free = [graph.cell(index) for index in range(graph.width * graph.height) if graph.walkable[index]]
+        cells = [(free[i], free[-i - 1]) for i in range(10)]
+
+        process = multiprocessing.get_context("fork").Process(target = findPaths, args = (graph, cache, cells))
+        process.start()
+        process.join()
+
+        # Found in the other process
+        finder = Astar(graph)
+
+        for (start, goal) in cells:
+            assert(cache.get(graph, start, goal) == finder.getPath(center(start), center(goal)))
+
+        assert(cache.hits == len(cells))
+
+        # Not a path from its start to its goal
+        (start, goal) = cells[0]
+        cache.put(graph, start, goal, [start, goal])
+
+        assert(cache.get(graph, start, goal) is SharedPathCache.MISS)
+
+        # Not used once the graph of the process changed
+        graph.setCost(*goal, 2)
+
+        assert(cache.get(graph, *cells[1]) is SharedPathCache.MISS)
+        assert(cache.invalidations == 1)
+
+    def test_teams(self):
+        mapData = RegularMap.loadMapData(MAP_FILE)
+        RegularMap(mapData)
+
+        analysis = MapAnalysis(mapData)
+        graph = analysis.graph
+
+        # The paths of a team are not seen by the other one
+        free = [graph.cell(index) for index in range(graph.width * graph.height) if graph.walkable[index]]
+        (start, goal) = (free[0], free[-1])
+
+        findPaths(graph, analysis.paths[1], [(start, goal)])
+
+        assert(analysis.paths[1].get(graph, start, goal) is not SharedPathCache.MISS)
+        assert(analysis.paths[2].get(graph, start, goal) is SharedPathCache.MISS)
@@ -0,0 +1,325 @@
+import sys
+import os
+
+import tempfile
+import unittest
+
+import numpy
+
+from math import hypot
+from random import Random
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from domain.Map import Map, RegularMap
+from domain.GameObject.Bot import RegularBot
+from model.PhysicsEngine import PhysicsEngine
+from model.VisibilityTable import VisibilityTable
+from service.Config import Config
+from service.Physics import Physics, PythonPhysics
+from service.Ruleset import Ruleset
+
+class TestPhysicsEngine(unittest.TestCase):
+
+    def __init__(self, methodName):
+        super().__init__(methodName)
+        Config.Initialize()
+        Ruleset.Initialize()
+        Physics.SetInstance(PythonPhysics())
+
+        self.map = RegularMap(RegularMap.loadMapData(os.path.join(SCRIPT_DIR, PACKAGE_PARENT, 'maps/map_01.txt')))
+        self.engine = PhysicsEngine(Ruleset.GetRuleset(), self.map)
+
+    def test_dilate(self):
+        cells = numpy.zeros((7, 6), dtype = bool)
+        cells[3, 2] = True
+
+        grown = PhysicsEngine.dilate(cells, 2)
+
+        assert(grown.shape == cells.shape)
+        assert(grown[1:6, 0:5].all())                   # Square of side 2 * padding + 1
+        assert(grown.sum() == 25)
+        assert(not grown[0, 2] and not grown[3, 5])     # Nothing further
+        assert(cells.sum() == 1)                        # Input left untouched
+
+        assert(PhysicsEngine.dilate(cells, 0).sum() == 1)
+        assert(PhysicsEngine.dilate(cells, 50).all())   # Padding larger than the array
+
+    def test_createCollisionMap(self):
+        self.engine.createCollisionMap("RegularBot", 36)
+
+        collisionMap = self.engine.collisionsMaps["RegularBot"]
+        divider = self.engine.collisionsMapsDividers["RegularBot"]
+        cellsPerBlock = Map.BLOCKSIZE // divider
+        padding = 36 // cellsPerBlock
+
+        assert(collisionMap.dtype == bool)
+        assert(collisionMap.flags["C_CONTIGUOUS"])
+        assert(collisionMap.shape == (self.map.blockWidth * cellsPerBlock, self.map.blockHeight * cellsPerBlock))
+
+        for x in range(self.map.blockWidth):
+            for y in range(self.map.blockHeight):
+                cells = collisionMap[x * cellsPerBlock : (x + 1) * cellsPerBlock, y * cellsPerBlock : (y + 1) * cellsPerBlock]
+
+                if self.map.blocks[x][y].solid:
+                    assert(cells.all())
+                else:
+                    # The middle of a block can only be blocked by the padding of a solid neighbour
+                    neighbours = [
+                        self.map.blocks[nx][ny].solid
+                        for nx in range(max(x - 1, 0), min(x + 2, self.map.blockWidth))
+                        for ny in range(max(y - 1, 0), min(y + 2, self.map.blockHeight))
+                    ]
+                    if not any(neighbours):
+                        assert(not cells.any())
+
+        # A cell just out of a solid block is blocked, at padding + 1 it is not, unless an other block is near
+        (x, y) = next((x, y) for x in range(1, self.map.blockWidth - 1) for y in range(self.map.blockHeight)
+            if self.map.blocks[x][y].solid and not self.map.blocks[x + 1][y].solid and not self.map.blocks[x + 2][y].solid)
+
+        edge = (x + 1) * cellsPerBlock
+        assert(collisionMap[edge + padding - 1, y * cellsPerBlock + cellsPerBlock // 2])
+        assert(not collisionMap[edge + padding, y * cellsPerBlock + cellsPerBlock // 2])
+
+    def clearance(self, x, y):
+        """
+        Distance from (x, y) to the closest solid block (or the border of the map), by brute force.
+        """
+        size = Map.BLOCKSIZE
+        closest = min(x, y, self.map.blockWidth * size - x, self.map.blockHeight * size - y)
+
+        for blockX in range(self.map.blockWidth):
+            for blockY in range(self.map.blockHeight):
+                if self.map.blocks[blockX][blockY].solid:
+                    dx = max(blockX * size - x, 0, x - (blockX + 1) * size)
+                    dy = max(blockY * size - y, 0, y - (blockY + 1) * size)
+                    closest = min(closest, hypot(dx, dy))
+
+        return closest
+
+    def test_checkCollision(self):
+        radius = 36
+        random = Random(4)
+        (width, height) = (self.map.blockWidth * Map.BLOCKSIZE, self.map.blockHeight * Map.BLOCKSIZE)
+
+        (freeX, freeY) = (None, None)
+        while freeX is None or self.clearance(freeX, freeY) <= radius:
+            (freeX, freeY) = (random.uniform(0, width), random.uniform(0, height))
+
+        # Staying still is always possible
+        assert(self.engine.checkCollision(freeX, freeY, freeX, freeY, radius, freeX, freeY) == (freeX, freeY))
+
+        # Going into a wall stops against it
+        (x, y) = self.engine.checkCollision(freeX, freeY, freeX - 10000, freeY, radius)
+        assert(y == freeY and freeX - 10000 < x < freeX)
+        assert(abs(self.clearance(x, y) - radius) < 1e-6)
+
+        # Stopping at the cap
+        assert(self.engine.checkCollision(freeX, freeY, freeX + 10, freeY, radius, freeX + 5, freeY) == (freeX + 5, freeY))
+
+        # Sliding goes on along the wall, never closer to it
+        (slideX, slideY) = self.engine.checkCollision(freeX, freeY, freeX - 10000, freeY + 30, radius, slide = True)
+        assert(slideY > y)
+        assert(self.clearance(slideX, slideY) > radius - 1e-6)
+
+        # Wherever it goes, the circle never overlaps a block and stops on the segment
+        for i in range(300):
+            (targetX, targetY) = (freeX + random.uniform(-300, 300), freeY + random.uniform(-300, 300))
+            slide = random.random() < 0.5
+            (x, y) = self.engine.checkCollision(freeX, freeY, targetX, targetY, radius, slide = slide)
+
+            assert(self.clearance(x, y) > radius - 1e-6)
+
+            if not slide:
+                assert(abs(Physics.distance(freeX, x, freeY, y) + Physics.distance(x, targetX, y, targetY)
+                    - Physics.distance(freeX, targetX, freeY, targetY)) < 1e-6)
+
+            if (x, y) != (targetX, targetY) and not slide:
+                assert(abs(self.clearance(x, y) - radius) < 1e-6)
+
+            (freeX, freeY) = (x, y)
+
+    def test_sweepCircleRect(self):
+        # Side : the center stops radius away from it
+        (t, normal) = PhysicsEngine.sweepCircleRect(0, 50, 100, 0, 10, 50, 0, 100, 100)
+        assert(abs(t - 0.4) < 1e-9 and normal == (-1, 0))
+
+        # Corner : the circle touches the corner itself
+        (t, normal) = PhysicsEngine.sweepCircleRect(0, -5, 100, 0, 10, 50, 0, 100, 100)
+        assert(abs(Physics.distance(t * 100, 50, -5, 0) - 10) < 1e-9)
+        assert(normal[0] < 0 and normal[1] < 0)
+
+        # Passing by, moving away or too short
+        assert(PhysicsEngine.sweepCircleRect(0, -20, 100, 0, 10, 50, 0, 100, 100) is None)
+        assert(PhysicsEngine.sweepCircleRect(45, 50, -100, 0, 10, 50, 0, 100, 100) is None)
+        assert(PhysicsEngine.sweepCircleRect(0, 50, 30, 0, 10, 50, 0, 100, 100) is None)
+
+        # Already touching, going further in
+        assert(PhysicsEngine.sweepCircleRect(45, 50, 10, 0, 10, 50, 0, 100, 100) == (0.0, (-1.0, 0.0)))
+
+    def test_traverseBlocks(self):
+        size = Map.BLOCKSIZE
+        random = Random(0)
+
+        for i in range(200):
+            (x, y) = (random.uniform(0, 10 * size), random.uniform(0, 10 * size))
+            (targetX, targetY) = (random.uniform(0, 10 * size), random.uniform(0, 10 * size))
+
+            blocks = list(self.engine.traverseBlocks(x, y, targetX, targetY))
+
+            assert(blocks[0] == (int(x // size), int(y // size), 0.0))
+            assert(blocks[-1][:2] == (int(targetX // size), int(targetY // size)))
+
+            for ((blockX, blockY, t), (nextX, nextY, nextT)) in zip(blocks, blocks[1:]):
+                assert(abs(nextX - blockX) <= 1 and abs(nextY - blockY) <= 1 and (nextX, nextY) != (blockX, blockY))
+                assert(t <= nextT <= 1)
+
+                # The entry point is on the border of the block entered
+                (entryX, entryY) = (x + nextT * (targetX - x), y + nextT * (targetY - y))
+                if nextX != blockX:
+                    assert(abs(entryX - max(blockX, nextX) * size) < 1e-6)
+                if nextY != blockY:
+                    assert(abs(entryY - max(blockY, nextY) * size) < 1e-6)
+
+            # Every point of the segment is in one of the blocks
+            crossed = set((blockX, blockY) for (blockX, blockY, t) in blocks)
+            for j in range(101):
+                (pointX, pointY) = (x + j / 100 * (targetX - x), y + j / 100 * (targetY - y))
+                assert((int(pointX // size), int(pointY // size)) in crossed)
+
+    def test_castRay(self):
+        size = Map.BLOCKSIZE
+        random = Random(1)
+        solid = lambda block: block.solid
+
+        (width, height) = (self.map.blockWidth * size, self.map.blockHeight * size)
+
+        for i in range(200):
+            (x, y) = (random.uniform(0, width), random.uniform(0, height))
+            (targetX, targetY) = (random.uniform(0, width), random.uniform(0, height))
+
+            impact = self.engine.castRay(x, y, targetX, targetY, solid)
+
+            # Dense sampling of the segment finds the first solid block
+            firstSolid = None
+            for j in range(2001):
+                (pointX, pointY) = (x + j / 2000 * (targetX - x), y + j / 2000 * (targetY - y))
+                if self.map.blocks[int(pointX // size)][int(pointY // size)].solid:
+                    firstSolid = (pointX, pointY)
+                    break
+
+            if firstSolid is None:
+                continue
+
+            assert(impact is not None and impact[1].solid)
+            assert(hypot(impact[0][0] - x, impact[0][1] - y) <= hypot(firstSolid[0] - x, firstSolid[1] - y) + 1e-6)
+            assert(self.engine.getImpactPoint(x, y, targetX, targetY) == impact[0])
+
+        # Leaving the map stops the ray
+        assert(self.engine.castRay(size / 2, size / 2, -size, size / 2, lambda block: False) == ((0, size / 2), None))
+        assert(self.engine.castRay(size / 2, size / 2, size / 2, size / 2, lambda block: False) is None)
+
+        # Through the corner of a block, straight to the diagonal one
+        assert([(blockX, blockY) for (blockX, blockY, t) in self.engine.traverseBlocks(size / 2, size / 2, size * 2.5, size * 2.5)] == [(0, 0), (1, 1), (2, 2)])
+
+    def test_hullBlocks(self):
+        assert(VisibilityTable.hullBlocks(0, 0) == [(0, 0)])
+        assert(VisibilityTable.hullBlocks(2, 0) == [(0, 0), (1, 0), (2, 0)])
+        assert(VisibilityTable.hullBlocks(1, 1) == [(0, 0), (0, 1), (1, 0), (1, 1)])
+        assert(sorted(VisibilityTable.hullBlocks(-1, -2)) == [(-1, -2), (-1, -1), (-1, 0), (0, -2), (0, -1), (0, 0)])
+
+    def test_visibilityTable(self):
+        size = Map.BLOCKSIZE
+        random = Random(2)
+
+        table = VisibilityTable.load(self.map, 400)
+        (width, height) = (self.map.blockWidth * size, self.map.blockHeight * size)
+
+        counts = [0, 0, 0]
+
+        for i in range(5000):
+            # Points on the corners of blocks are the hardest cases
+            (x, y) = (random.randrange(0, width, size // 2), random.randrange(0, height, size // 2))
+            if random.random() < 0.5:
+                (x, y) = (random.uniform(0, width), random.uniform(0, height))
+
+            (targetX, targetY) = (x + random.randrange(-4, 5) * size // 2, y + random.randrange(-4, 5) * size // 2)
+            if random.random() < 0.5:
+                (targetX, targetY) = (x + random.uniform(-400, 400), y + random.uniform(-400, 400))
+
+            if not (0 <= targetX < width and 0 <= targetY < height):
+                continue
+
+            visibility = table.lookup(int(x // size), int(y // size), int(targetX // size), int(targetY // size))
+            counts[visibility] += 1
+
+            if visibility == VisibilityTable.CLEAR:
+                assert(not self.engine.viewBlocked(x, y, targetX, targetY))
+            elif visibility == VisibilityTable.HIDDEN:
+                assert(self.engine.viewBlocked(x, y, targetX, targetY))
+
+        # Most cases are answered by the table
+        assert(counts[VisibilityTable.PARTIAL] < (counts[VisibilityTable.CLEAR] + counts[VisibilityTable.HIDDEN]) / 4)
+
+    def test_visibilityTableCache(self):
+        table = VisibilityTable.load(self.map, 400)
+
+        with tempfile.TemporaryDirectory() as directory:
+            cachePath = os.path.join(directory, "map.pvs")
+
+            VisibilityTable.load(self.map, 400, cachePath)
+
+            with open(cachePath, "rb") as cacheFile:
+                content = cacheFile.read()
+
+            # Half written by another game : computed again, and the file replaced
+            for length in (0, 10, len(content) // 2, len(content) - 1):
+                with open(cachePath, "wb") as cacheFile:
+                    cacheFile.write(content[:length])
+
+                loaded = VisibilityTable.load(self.map, 400, cachePath)
+
+                assert(numpy.array_equal(loaded.clear, table.clear) and numpy.array_equal(loaded.hidden, table.hidden))
+
+                with open(cachePath, "rb") as cacheFile:
+                    assert(cacheFile.read() == content)
+
+            assert(os.listdir(directory) == ["map.pvs"])
+
+        # Kept out of the maps, one file for each of them
+        paths = [VisibilityTable.CachePath(mapFile) for mapFile in ("maps/map_01.txt", "maps/map_02.txt", "other/map_01.txt")]
+
+        assert(all(os.path.dirname(path) == VisibilityTable.CACHE_DIRECTORY for path in paths))
+        assert(len(set(paths)) == 3 and os.path.basename(paths[0]).startswith("map_01-"))
+
+    def test_computeVisibility(self):
+        random = Random(3)
+        (width, height) = (self.map.blockWidth * Map.BLOCKSIZE, self.map.blockHeight * Map.BLOCKSIZE)
+
+        bots = list()
+        for i in range(40):
+            bot = RegularBot(1 + i % 2, random.uniform(0, width), random.uniform(0, height))
+            bot.angle = random.uniform(-180, 540)
+            bots.append(bot)
+
+        objects = bots + [gameObject for category in self.map.objects.values() for gameObject in category]
+
+        for table in (None, VisibilityTable.load(self.map, 400)):
+            self.engine.visibilityTable = table
+            visibility = self.engine.computeVisibility(bots, objects)
+
+            assert(visibility.seen.shape == (len(bots), len(objects)))
+
+            for (i, bot) in enumerate(bots):
+                assert(not visibility.sees(bot, bot))
+
+                for gameObject in objects:
+                    if gameObject is not bot:
+                        assert(visibility.sees(bot, gameObject) == self.engine.sees(bot, gameObject))
+
+                assert(visibility.seenBy(bot) == [gameObject for gameObject in objects if visibility.sees(bot, gameObject)])
+
+        assert(visibility.seen.any())
+        assert(not self.engine.computeVisibility([], objects).seen.any())
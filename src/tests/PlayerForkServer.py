@@ -0,0 +1,87 @@
+import sys
+import os
+
+import random
+import time
+import unittest
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from model.ForkServer import PlayerForkServer
+
+MAP_FILE = os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT, "maps/map_01.txt"))
+
+class PreparedPlayer:
+    prepared = dict()
+
+    @classmethod
+    def prepare(cls, map):
+        cls.prepared[id(map)] = os.getpid()
+
+    def __init__(self, map, rules, team):
+        if rules["BotsCount"] == "0":
+            raise Exception("Can not initialize")
+
+        self.team = team
+        self.preparedBy = PreparedPlayer.prepared.get(id(map))
+
+    def poll(self, pollingData):
+        if pollingData == "exit":
+            os._exit(0)
+
+        return (self.team, self.preparedBy, os.getpid(), pollingData, random.random())
+
+class TestPlayerForkServer(unittest.TestCase):
+
+    def test_createPlayer(self):
+        server = PlayerForkServer(mapFiles = [MAP_FILE])
+
+        try:
+            players = [server.createPlayer(PreparedPlayer, MAP_FILE, { "BotsCount": 5 }, team, seed = 42) for team in (1, 2)]
+            responses = list()
+
+            for (i, player) in enumerate(players):
+                player.send(i)
+                player.send(i + 10)
+
+                responses.append([player.results.recv()[0] for poll in range(2)])
+
+            for (team, player, (first, second)) in zip((1, 2), players, responses):
+                # The map was prepared by the server before forking, the player found it in its process
+                assert(first[:4] == (team, server.process.pid, player.pid, team - 1))
+                assert(second[3] == team + 9)
+
+            # Each player draws as if it was alone in its process
+            assert(responses[0][0][4] == responses[1][0][4])
+
+            for player in players:
+                player.kill()
+                player.join(5)
+                assert(not player.alive())
+
+            assert(server.createPlayer(PreparedPlayer, MAP_FILE, { "BotsCount": 0 }, 1) is None)
+        finally:
+            server.close()
+
+    def test_exitedPlayer(self):
+        server = PlayerForkServer(mapFiles = [MAP_FILE])
+
+        try:
+            player = server.createPlayer(PreparedPlayer, MAP_FILE, { "BotsCount": 5 }, 1)
+            assert(player.alive())
+
+            # Gone before the game is over : seen through its pidfd, whoever gets its pid afterwards
+            player.send("exit")
+
+            start = time.monotonic()
+            player.join(5)
+
+            assert(time.monotonic() - start < 5)
+            assert(not player.alive() and player.pidfd == -1)
+
+            player.kill()
+            player.join()
+        finally:
+            server.close()
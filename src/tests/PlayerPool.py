@@ -0,0 +1,125 @@
+import sys
+import os
+
+import random
+import time
+import unittest
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from model.PlayerPool import PlayerPool, PooledPlayerProcess
+
+class EchoPlayer:
+    def __init__(self, map, rules, team):
+        if map == "broken":
+            raise Exception("Can not initialize")
+        if map == "exit":
+            # Like a native crash, or the OOM killer
+            os._exit(1)
+
+        self.team = team
+        self.botsCount = rules["BotsCount"]
+
+    def poll(self, pollingData):
+        if pollingData == "raise":
+            raise Exception("Can not answer")
+
+        return (self.team, self.botsCount, pollingData, random.random())
+
+class TestPlayerPool(unittest.TestCase):
+
+    def test_matches(self):
+        pool = PlayerPool(2, maxMatches = 2)
+
+        try:
+            pids = set()
+            draws = list()
+
+            for i in range(3):
+                matchId = pool.newMatch()
+                players = [pool.createPlayer(matchId, teamId, EchoPlayer, None, { "BotsCount": 5 }, seed = 42) for teamId in ("1", "2")]
+
+                # The two teams of a match compute at the same time
+                assert(players[0].worker is not players[1].worker)
+
+                for player in players:
+                    pool.poll(player, i)
+
+                for player in players:
+                    ((team, botsCount, data, draw), cpuTime) = pool.receive(player.worker, (player.matchId, player.teamId), "result", 5000)
+                    assert(cpuTime >= 0)
+                    assert((team, botsCount, data) == (int(player.teamId), "5", i))
+                    draws.append(draw)
+
+                    pids.add(player.worker.process.pid)
+
+                for player in players:
+                    pool.removePlayer(player)
+
+            # Each player draws as if it was alone in its process
+            assert(len(set(draws)) == 1)
+
+            # Workers are reused for 2 matches, then replaced
+            assert(len(pids) == 4)
+
+            assert(pool.createPlayer(pool.newMatch(), "1", EchoPlayer, "broken", {}) is None)
+        finally:
+            pool.close()
+
+    def test_deadWorker(self):
+        pool = PlayerPool(2)
+
+        try:
+            start = time.monotonic()
+
+            # Failed like an initialization that raised, instead of waiting forever
+            assert(pool.createPlayer(pool.newMatch(), "1", EchoPlayer, "exit", {}) is None)
+            assert(time.monotonic() - start < 5)
+
+            # A worker that died between matches is replaced
+            matchId = pool.newMatch()
+            player = pool.createPlayer(matchId, "1", EchoPlayer, None, { "BotsCount": 1 })
+            pid = player.worker.process.pid
+
+            pool.removePlayer(player)
+
+            player.worker.process.kill()
+            player.worker.process.join()
+
+            players = [pool.createPlayer(pool.newMatch(), teamId, EchoPlayer, None, { "BotsCount": 1 }) for teamId in ("1", "2")]
+
+            for player in players:
+                assert(player is not None and player.worker.process.is_alive())
+                assert(player.worker.process.pid != pid)
+
+                pool.poll(player, 0)
+                assert(pool.receive(player.worker, (player.matchId, player.teamId), "result", 5000)[0][2] == 0)
+        finally:
+            pool.close()
+
+    def test_crashedPlayer(self):
+        pool = PlayerPool(2)
+
+        try:
+            player = pool.createPlayer(pool.newMatch(), "1", EchoPlayer, None, { "BotsCount": 1 })
+            process = PooledPlayerProcess(None, "1", player)
+
+            process.setData("raise")
+            process.execute()
+
+            # Given up at once, instead of waiting for a response that will never come
+            start = time.monotonic()
+
+            assert(not process.wait(5000))
+            assert(time.monotonic() - start < 2)
+
+            assert(not process.wait(5000))
+            assert(time.monotonic() - start < 2)
+
+            # Removed from its worker, that keeps hosting the others
+            assert(not player.worker.hosted and not player.worker.crashed)
+            assert(player.worker.process.is_alive())
+        finally:
+            pool.close()
@@ -0,0 +1,97 @@
+import sys
+import os
+
+import asyncio
+import tempfile
+import threading
+import time
+import unittest
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from model.Network import Framing, PlayerServer, SocketPlayerProcess
+from queue import Empty
+
+async def echoClient(address):
+    """
+    Answers each polling data with the polling data itself.
+    """
+    (kind, arguments) = Framing.parseAddress(address)
+    (reader, writer) = await asyncio.open_unix_connection(*arguments)
+
+    writer.write(Framing.encode({ "type": "hello", "name": "echo" }))
+
+    while True:
+        message = await Framing.read(reader)
+
+        if message is None:
+            break
+
+        writer.write(Framing.encode({ "type": "response", "sequence": message["sequence"], "data": message["data"] }))
+        await writer.drain()
+
+    writer.close()
+
+class TestPlayerServer(unittest.TestCase):
+
+    def test_parseAddress(self):
+        assert(Framing.parseAddress("unix:/tmp/game.sock") == ("unix", ("/tmp/game.sock",)))
+        assert(Framing.parseAddress("localhost:5000") == ("tcp", ("localhost", 5000)))
+        assert(Framing.parseAddress(":5000") == ("tcp", ("127.0.0.1", 5000)))
+
+    def test_exchange(self):
+        address = "unix:" + os.path.join(tempfile.mkdtemp(), "game.sock")
+        server = PlayerServer(address)
+
+        thread = threading.Thread(target = asyncio.run, args = (echoClient(address),))
+        thread.start()
+
+        player = server.accept(5)
+        assert(player.name == "echo")
+
+        for sequence in range(1, 4):
+            player.send({ "type": "poll", "sequence": sequence, "data": { "bots": { "1_0": (sequence, 2) } } })
+
+            response = player.receive("response", 5)
+            assert(response["sequence"] == sequence)
+            assert(response["data"] == { "bots": { "1_0": [sequence, 2] } })
+
+        # The client stops once the game closes the connection
+        player.close()
+        thread.join(5)
+        assert(not thread.is_alive())
+
+        # Nothing more to wait for
+        start = time.monotonic()
+        self.assertRaises(Empty, player.receive, "response", 5)
+        assert(time.monotonic() - start < 1)
+
+        server.close()
+        assert(server._loop.is_closed())
+        assert(not os.path.exists(address[len("unix:"):]))
+
+    def test_lateResponse(self):
+        address = "unix:" + os.path.join(tempfile.mkdtemp(), "game.sock")
+        server = PlayerServer(address)
+
+        thread = threading.Thread(target = asyncio.run, args = (echoClient(address),))
+        thread.start()
+
+        model = type("Model", (), { "teamsData": dict() })()
+        process = SocketPlayerProcess(model, "1", server.accept(5))
+
+        try:
+            # Polled again before the first response was received : only the answer to the last polling data is kept
+            for data in ("old", "new"):
+                process.setData(data)
+                process.execute()
+
+            assert(process.wait(5000))
+            assert(process.check() and model.teamsData["1"] == "new")
+            assert(not process.wait(100))
+        finally:
+            process.kill()
+            thread.join(5)
+            server.close()
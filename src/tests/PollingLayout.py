@@ -0,0 +1,101 @@
+import sys
+import os
+
+import time
+import unittest
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from model.SharedMemory import PollingLayout, SharedPlayerProcess
+
+class LatePlayer:
+    """
+    Takes its time on each polling data, telling which one it answered.
+    """
+
+    def poll(self, pollingData):
+        time.sleep(0.3)
+
+        return { "bots": { "1_0": { "targetPosition": (pollingData["missedTicks"], 0, 0), "actions": 0 } } }
+
+def pollingData(missedTicks):
+    return { "bots": { "1_0": { "currentPosition": (0.0, 0.0, 0.0, 0.0), "life": 0.0, "flag": 0, "cooldown": 0.0, "seen": [] } },
+        "events": {}, "missedTicks": missedTicks }
+
+class TestPollingLayout(unittest.TestCase):
+
+    def __init__(self, methodName):
+        super().__init__(methodName)
+        self.layout = PollingLayout(["1_0", "1_1"], ["Flag", "HPBoost", "RegularBot"], 4, 2)
+        self.buffer = bytearray(self.layout.size)
+
+    def test_polling(self):
+        pollingData = {
+            "bots": {
+                "1_1": {
+                    "currentPosition": (10.5, 20.25, 90.0, 3.0),
+                    "life": 100.0,
+                    "flag": 2,
+                    "cooldown": 1234.0,
+                    "seen": [
+                        { "type": "RegularBot", "currentPosition": (1.0, 2.0, 3.0, 4.0), "life": 50.0, "flag": 0, "cooldown": 5.0 },
+                        { "type": "HPBoost", "currentPosition": (7.0, 8.0) },
+                    ],
+                },
+                "1_0": { "currentPosition": (0.0, 0.0, 0.0, 0.0), "life": 0.0, "flag": 0, "cooldown": 0.0, "seen": [] },
+            },
+            "events": { "flags": [{ "team": 1, "position": (300.0, 400.0) }] },
+            "missedTicks": 3,
+        }
+
+        sequence = self.layout.writePolling(self.buffer, pollingData)
+        assert(sequence == 2)
+        assert(self.layout.readPolling(self.buffer) == (2, pollingData))
+
+        # Without flag events, there is no flags entry
+        pollingData["events"] = {}
+        assert(self.layout.writePolling(self.buffer, pollingData) == 4)
+        assert(self.layout.readPolling(self.buffer) == (4, pollingData))
+
+    def test_response(self):
+        response = { "bots": { "1_0": { "targetPosition": (1.0, 2.0, 3.0), "actions": 3 } } }
+
+        assert(self.layout.writeResponse(self.buffer, 2, response) == 2)
+        assert(self.layout.readResponse(self.buffer) == (2, 2, response, None))
+
+        assert(self.layout.writeResponse(self.buffer, 4, {}, 1.5) == 4)
+        assert(self.layout.readResponse(self.buffer) == (4, 4, {}, 1.5))
+
+        # Whatever does not follow the format is not a response
+        for invalid in (None, [], { "bots": { "1_7": { "targetPosition": (1, 2, 3), "actions": 0 } } },
+                { "bots": { "1_0": { "targetPosition": (1, 2), "actions": 0 } } }):
+            self.layout.writeResponse(self.buffer, 6, invalid)
+            assert(self.layout.readResponse(self.buffer)[2] is None)
+
+        # Polling data and response do not overlap
+        assert(self.layout.sequence(self.buffer, self.layout.pollingOffset) == 0)
+
+    def test_lateResponse(self):
+        model = type("Model", (), { "teamsData": dict() })()
+        process = SharedPlayerProcess(model, "1", LatePlayer(), self.layout)
+        process.start()
+
+        try:
+            # Polled again while the player computes its first response : that one is dropped, it answered older data
+            process.setData(pollingData(1))
+            process.execute()
+
+            time.sleep(0.1)
+
+            process.setData(pollingData(2))
+            process.execute()
+
+            assert(process.wait(5000))
+            assert(process.check())
+            assert(model.teamsData["1"]["bots"]["1_0"]["targetPosition"] == (2, 0, 0))
+
+            assert(not process.wait(100) and not process.check())
+        finally:
+            process.kill()
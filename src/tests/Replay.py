@@ -0,0 +1,173 @@
+import sys
+import os
+
+import io
+import random
+import tempfile
+import unittest
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from domain.Player import Player
+from model.GameModel import GameModel
+from model.Replay import ReplayEncoding, ReplayReader, ReplayRecorder
+from service.Config import Config
+from service.Physics import Physics, PythonPhysics
+from service.Ruleset import Ruleset
+from service.VirtualClock import VirtualClock
+from service.VirtualTimeManager import VirtualTimeManager
+
+MAP_FILE = os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT, "maps/map_01.txt"))
+
+class WanderingPlayer(Player):
+    """
+    Sends each bot somewhere else now and then, drawn from the random module that the game seeds.
+    """
+
+    def __init__(self, map, rules, team):
+        pass
+
+    def poll(self, pollingData):
+        response = { "bots": {} }
+
+        for botId in pollingData["bots"].keys():
+            if random.random() < 0.2:
+                response["bots"][botId] = { "targetPosition": (random.randint(0, 2000), random.randint(0, 1000), 100), "actions": random.randint(0, 1) }
+
+        return response
+
+class SloppyPlayer(Player):
+    """
+    Answers whatever comes to its mind : lists for tuples, bots that are not its own, values that are not numbers.
+    """
+
+    def __init__(self, map, rules, team):
+        pass
+
+    def poll(self, pollingData):
+        botIds = sorted(pollingData["bots"].keys())
+        choice = random.randint(0, 4)
+
+        if choice == 0:
+            return None
+        if choice == 1:
+            return [botIds]
+        if choice == 2:
+            return { "bots": botIds }
+
+        response = { "bots": {}, "comment": "sloppy" }
+
+        for botId in botIds:
+            response["bots"][botId] = { "targetPosition": [random.randint(0, 2000), random.random() * 1000, 100], "actions": 0 }
+
+        response["bots"][botIds[0]]["targetPosition"][2] = "fast"
+        response["bots"]["9_9"] = { "targetPosition": (0, 0, 0), "actions": 1 }
+
+        return response
+
+def playGame(seed, path, Player1 = WanderingPlayer, Player2 = WanderingPlayer):
+    """
+    Plays a short headless game, written in a replay file.
+
+    Returns:
+        model (GameModel) : The game, in its final state.
+    """
+    clock = VirtualClock()
+    model = GameModel(Player1, Player2, MAP_FILE, clock = clock, seed = seed, recorders = [ReplayRecorder(path)])
+
+    stopwatch = VirtualTimeManager(clock)
+    stopwatch.StartTimer()
+
+    try:
+        while not model.game_over:
+            deltaTime = stopwatch.NextFrame()
+            stopwatch.Mark()
+
+            model.tick(deltaTime)
+    finally:
+        model.stop()
+
+    return model
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self):
+        Config.Initialize()
+        Ruleset.Initialize()
+        Physics.SetInstance(PythonPhysics())
+
+        ruleset = Ruleset.GetRuleset()
+        self.saved = { key: ruleset[key] for key in ("MaxDurationSeconds", "ThinkTimeCpu", "ThinkWallCapMs") }
+
+        # The think time is measured on the CPU, so that a busy host does not make a player miss a turn
+        ruleset["MaxDurationSeconds"] = "2"
+        ruleset["ThinkTimeCpu"] = "1"
+        ruleset["ThinkWallCapMs"] = "2000"
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.save_stdout = sys.stdout
+        sys.stdout = io.StringIO()
+
+    def tearDown(self):
+        sys.stdout = self.save_stdout
+        self.directory.cleanup()
+
+        ruleset = Ruleset.GetRuleset()
+        for (key, value) in self.saved.items():
+            ruleset[key] = value
+
+    def test_replay(self):
+        path = os.path.join(self.directory.name, "game.replay")
+        model = playGame(7, path)
+
+        reader = ReplayReader(path)
+        replayed = reader.replay()
+
+        assert(reader.header["seed"] == 7)
+        assert(replayed.turn == model.turn and model.turn > 1)
+        assert(replayed.winner == model.winner)
+
+        bots = model.getAllBots()
+        assert(any(bot.x != 0 or bot.y != 0 for bot in bots.values()))
+
+        for (botId, bot) in replayed.getAllBots().items():
+            assert(ReplayEncoding.getBotValues(bot) == ReplayEncoding.getBotValues(bots[botId]))
+
+    def test_seed(self):
+        paths = [os.path.join(self.directory.name, "game{}.replay".format(i)) for i in range(3)]
+
+        for (path, seed) in zip(paths, (7, 7, 8)):
+            playGame(seed, path)
+
+        content = list()
+        for path in paths:
+            with open(path, "rb") as replayFile:
+                content.append(replayFile.read())
+
+        assert(content[0] == content[1])
+        assert(content[0] != content[2])
+
+    def test_sloppyResponses(self):
+        path = os.path.join(self.directory.name, "game.replay")
+        model = playGame(7, path, SloppyPlayer)
+
+        # Written as the game decoded them : replayed the same way, and the ruleset of the game put back afterwards
+        ruleset = Ruleset.GetRuleset()
+        ruleset["MaxDurationSeconds"] = "5"
+
+        positions = list()
+        replayed = ReplayReader(path).replay(onTick = lambda model: positions.append([(bot.x, bot.y) for bot in model.getBots(1).values()]))
+
+        assert(ruleset["MaxDurationSeconds"] == "5")
+        assert(replayed.turn == model.turn)
+
+        # The orders that were valid moved the bots
+        assert(positions[0] != positions[-1])
+
+        bots = model.getAllBots()
+        for (botId, bot) in replayed.getAllBots().items():
+            assert(ReplayEncoding.getBotValues(bot) == ReplayEncoding.getBotValues(bots[botId]))
+
+        assert(model.getMetrics().snapshot()["players"]["Replay"]["invalid"] > 0)
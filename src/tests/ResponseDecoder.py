@@ -0,0 +1,61 @@
+import sys
+import os
+
+import unittest
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from model.ResponseDecoder import ResponseDecoder
+
+class TestResponseDecoder(unittest.TestCase):
+
+    def test_decode(self):
+        decoder = ResponseDecoder(["1_0", "1_1", "1_2"])
+
+        rejected = decoder.decode({ "bots": {
+            "1_2": { "targetPosition": (10, 20.5, 100), "actions": 1 },
+            "1_0": { "targetPosition": [30, 40, 50], "actions": 3 },
+        }})
+
+        assert(rejected == 0)
+        assert(decoder.rows == [2, 0])
+        assert(list(decoder.given) == [True, False, True])
+        assert(decoder.order(2) == (10.0, 20.5, 100.0, 1))
+        assert(decoder.order(0) == (30.0, 40.0, 50.0, 3))
+
+        # Nothing is given when the player does not answer or passes its turn
+        for response in (None, {}):
+            assert(decoder.decode(response) == 0)
+            assert(decoder.rows == [] and not decoder.given.any())
+
+    def test_reject(self):
+        decoder = ResponseDecoder(["1_0", "1_1"])
+
+        rejected = decoder.decode({ "bots": {
+            "2_0": { "targetPosition": (1, 2, 3), "actions": 0 },
+            "1_0": { "targetPosition": (1, 2), "actions": 0 },
+            "1_1": { "targetPosition": (1, 2, 3), "actions": 0 },
+            0: { "targetPosition": (1, 2, 3), "actions": 0 },
+        }})
+
+        # The valid entry is kept
+        assert(rejected == 3)
+        assert(decoder.rows == [1])
+
+        for order in (
+            { "targetPosition": (1, float("nan"), 3), "actions": 0 },
+            { "targetPosition": (1, "2", 3), "actions": 0 },
+            { "targetPosition": (1, 2, 3), "actions": 1.5 },
+            { "targetPosition": (1, 2, 3), "actions": -1 },
+            { "targetPosition": (1, 2, 3) },
+            "order",
+        ):
+            assert(decoder.decode({ "bots": { "1_0": order } }) == 1)
+            assert(decoder.rows == [])
+
+        for response in ("response", { "orders": {} }, { "bots": [] }):
+            assert(decoder.decode(response) == 1)
+
+        assert(decoder.rejected == 3 + 6 + 3)
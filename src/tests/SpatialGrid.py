@@ -0,0 +1,78 @@
+import sys
+import os
+
+import unittest
+
+from random import Random
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from domain.GameObject import GameObject
+from domain.GameObject.Bot import RegularBot
+from domain.GameObject.Flag import Flag
+from domain.Map import Map, SpatialGrid
+
+class TestSpatialGrid(unittest.TestCase):
+
+    def __init__(self, methodName):
+        super().__init__(methodName)
+        Map.BLOCKSIZE = 100
+
+    def test_queryRadius(self):
+        random = Random(0)
+        grid = SpatialGrid(100)
+
+        objects = [GameObject(random.uniform(-500, 1500), random.uniform(-500, 1500)) for i in range(300)]
+        for gameObject in objects:
+            grid.insert(gameObject)
+
+        for i in range(50):
+            (x, y, radius) = (random.uniform(0, 1000), random.uniform(0, 1000), random.uniform(0, 400))
+
+            expected = [gameObject for gameObject in objects if (gameObject.x - x) ** 2 + (gameObject.y - y) ** 2 <= radius ** 2]
+            found = grid.queryRadius(x, y, radius)
+
+            assert(len(found) == len(expected))
+            assert(set(map(id, found)) == set(map(id, expected)))
+
+    def test_move(self):
+        grid = SpatialGrid(100)
+
+        bot = RegularBot(1, 50, 50)
+        flag = Flag(2, 500, 500)
+
+        grid.insert(bot)
+        grid.insert(flag)
+
+        assert(grid.queryRadius(50, 50, 10) == [bot])
+
+        # Moving objects keep the grid up to date, with what they hold
+        bot.pickUp(flag)
+        assert(grid.queryRadius(50, 50, 10) == [bot, flag])
+
+        bot.move(1000, 0)
+        assert(grid.queryRadius(50, 50, 10) == [])
+        assert(grid.queryRadius(1050, 50, 10) == [bot, flag])
+
+        grid.remove(bot)
+        assert(grid.queryRadius(1050, 50, 10) == [flag])
+        assert(bot.grid is None)
+
+        # The flag it holds is still followed
+        bot.move(-1000, 0)
+        assert(grid.queryRadius(50, 50, 10) == [flag])
+
+    def test_queryCells(self):
+        grid = SpatialGrid(100)
+
+        near = GameObject(250, 150)
+        far = GameObject(250, 450)
+        for gameObject in (near, far):
+            grid.insert(gameObject)
+
+        assert(grid.queryCells([(2, 1)]) == [near])
+        assert(grid.queryCells([(0, 0), (1, 0)], 100) == [near])
+        assert(grid.queryCells([(0, 0), (1, 0), (2, 0)], 250) == [near])
+        assert(grid.queryCells([(2, 2)], 101) == [near, far])
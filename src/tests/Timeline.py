@@ -0,0 +1,180 @@
+import sys
+import os
+
+import io
+import random
+import shutil
+import tempfile
+import unittest
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from domain.Player import Player
+from model.GameModel import GameModel
+from model.Replay import Recorder, TimelineFormat, TimelineModel, TimelineReader, TimelineRecorder
+from service.Config import Config
+from service.Physics import Physics, PythonPhysics
+from service.Ruleset import Ruleset
+from service.VirtualClock import VirtualClock
+from service.VirtualTimeManager import VirtualTimeManager
+
+MAP_FILE = os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT, "maps/map_01.txt"))
+
+class WanderingPlayer(Player):
+    """
+    Sends each bot somewhere else now and then, shooting sometimes.
+    """
+
+    def __init__(self, map, rules, team):
+        pass
+
+    def poll(self, pollingData):
+        response = { "bots": {} }
+
+        for botId in pollingData["bots"].keys():
+            if random.random() < 0.2:
+                response["bots"][botId] = { "targetPosition": (random.randint(0, 2000), random.randint(0, 1000), 100), "actions": random.randint(0, 1) }
+
+        return response
+
+class StateRecorder(Recorder):
+    """
+    Keeps the state of the game at the end of each tick, as the game played it.
+    """
+
+    def __init__(self):
+        self.states = list()
+
+    def endTick(self, model):
+        self.states.append(state(model))
+
+def state(model):
+    """
+    Returns:
+        state (tuple) : What a timeline frame holds of the turn, bots and flags of a model.
+    """
+    bots = [(bot.x, bot.y, bot.angle, bot.speed, bot.health) for bot in model.getAllBots().values()]
+    flags = [(flag.x, flag.y, bool(flag.held)) for flag in model.getMap().flags]
+
+    return (int(model.turn), bots, flags)
+
+class TestTimeline(unittest.TestCase):
+
+    def setUp(self):
+        Config.Initialize()
+        Ruleset.Initialize()
+        Physics.SetInstance(PythonPhysics())
+
+        ruleset = Ruleset.GetRuleset()
+        self.saved = ruleset["MaxDurationSeconds"]
+        ruleset["MaxDurationSeconds"] = "2"
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "game.timeline")
+
+        # A headless game, written in a timeline with a keyframe every 16 ticks
+        clock = VirtualClock()
+        self.played = StateRecorder()
+        model = GameModel(WanderingPlayer, WanderingPlayer, MAP_FILE, clock = clock, seed = 3,
+            recorders = [TimelineRecorder(self.path, 16), self.played])
+
+        stopwatch = VirtualTimeManager(clock)
+        stopwatch.StartTimer()
+
+        save_stdout = sys.stdout
+        sys.stdout = io.StringIO()
+
+        try:
+            while not model.game_over:
+                deltaTime = stopwatch.NextFrame()
+                stopwatch.Mark()
+
+                model.tick(deltaTime)
+        finally:
+            sys.stdout = save_stdout
+            model.stop()
+
+    def tearDown(self):
+        self.directory.cleanup()
+        Ruleset.GetRuleset()["MaxDurationSeconds"] = self.saved
+
+    def test_seek(self):
+        model = TimelineModel(TimelineReader(self.path))
+        reader = model.getReader()
+
+        try:
+            assert(reader.framesCount == len(self.played.states) and reader.framesCount > 3 * 16)
+
+            # Read in order, the frames are the ticks played
+            for tick in range(reader.framesCount):
+                model.seek(tick)
+                assert(state(model) == self.played.states[tick])
+
+            # Read in any order, the same
+            ticks = list(range(reader.framesCount))
+            random.Random(5).shuffle(ticks)
+
+            for tick in ticks:
+                model.seek(tick)
+                assert(state(model) == self.played.states[tick])
+
+                # Found by its time as well, the last frame played at or before it
+                timeMs = reader.timeMs(tick)
+                assert(reader.tickAt(timeMs) == tick)
+
+                if tick + 1 < reader.framesCount:
+                    assert(reader.tickAt((timeMs + reader.timeMs(tick + 1)) / 2) == tick)
+
+            # The game ends on its last frame only
+            model.seek(reader.framesCount - 2)
+            assert(not model.game_over)
+
+            model.seek(reader.framesCount - 1)
+            assert(model.game_over and model.winner is None)
+        finally:
+            model.stop()
+
+    def test_unclosed(self):
+        closed = TimelineReader(self.path)
+
+        # Cut where the game could have stopped : in the middle of a frame, without the index
+        unclosedPath = os.path.join(self.directory.name, "unclosed.timeline")
+        shutil.copyfile(self.path, unclosedPath)
+
+        indexSize = len(closed.keyframeTimes) * 8 + TimelineFormat.FOOTER.size
+        with open(unclosedPath, "r+b") as timelineFile:
+            timelineFile.truncate(os.path.getsize(self.path) - indexSize - closed.format.frameSize // 2)
+
+        unclosed = TimelineReader(unclosedPath)
+
+        try:
+            assert(unclosed.framesCount == closed.framesCount - 1)
+            assert(list(unclosed.keyframeTimes) == list(closed.keyframeTimes)[:(unclosed.framesCount + 15) // 16])
+
+            for tick in (0, 16, unclosed.framesCount - 1):
+                assert(unclosed.frame(tick).tolist() == closed.frame(tick).tolist())
+        finally:
+            unclosed.close()
+            closed.close()
+
+    def test_empty(self):
+        closed = TimelineReader(self.path)
+
+        # Stopped before the first tick : the header only
+        emptyPath = os.path.join(self.directory.name, "empty.timeline")
+        shutil.copyfile(self.path, emptyPath)
+
+        indexSize = len(closed.keyframeTimes) * 8 + TimelineFormat.FOOTER.size
+        with open(emptyPath, "r+b") as timelineFile:
+            timelineFile.truncate(os.path.getsize(self.path) - indexSize - closed.framesCount * closed.format.frameSize)
+
+        closed.close()
+        empty = TimelineReader(emptyPath)
+
+        try:
+            assert(empty.framesCount == 0)
+            self.assertRaisesRegex(Exception, "empty", TimelineModel, empty)
+        finally:
+            empty.close()
@@ -0,0 +1,59 @@
+import sys
+import os
+
+import unittest
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from Tournament import Tournament
+
+class PairedTournament(Tournament):
+    """
+    A Tournament whose matches are not played : the player listed first always wins.
+    """
+
+    def _play(self, matches):
+        for (roundNumber, mapFile, red, blue) in matches:
+            self.results.append({ "round": roundNumber, "map": mapFile, "red": red, "blue": blue, "winner": 1 if red < blue else 2,
+                "durationMs": 0, "turns": 0, "redMissedTicks": 0, "blueMissedTicks": 0, "wallSeconds": 0 })
+
+class TestTournament(unittest.TestCase):
+
+    def test_roundRobin(self):
+        tournament = PairedTournament(["a", "b", "c"], ["map1", "map2"])
+        tournament.roundRobin()
+
+        # Each player against each other on each map, with both colors
+        matches = [(result["map"], result["red"], result["blue"]) for result in tournament.results]
+
+        assert(len(matches) == 12 and len(set(matches)) == 12)
+        assert(all(red != blue for (mapFile, red, blue) in matches))
+
+        assert([line["player"] for line in tournament.standings()] == ["a", "b", "c"])
+        assert(tournament.points(0) == 8 and tournament.points(2) == 0)
+
+    def test_swiss(self):
+        tournament = PairedTournament(["a", "b", "c", "d", "e"], ["map1", "map2"])
+        tournament.swiss(5)
+
+        byes = list()
+
+        for roundNumber in range(1, 6):
+            results = [result for result in tournament.results if result["round"] == roundNumber]
+            players = [player for result in results for player in (result["red"], result["blue"]) if player is not None]
+
+            # Everybody plays once a round, one player is left out
+            assert(sorted(players) == list(range(5)))
+            assert(len(results) == 3 and all(result["map"] == "map{}".format(2 - roundNumber % 2) for result in results))
+
+            byes += [result["red"] for result in results if result["blue"] is None]
+
+        # Not always the last of the standings : each player is left out once
+        assert(sorted(byes) == list(range(5)))
+
+        # Paired with players not met yet, while there are some
+        firstRounds = [frozenset((result["red"], result["blue"])) for result in tournament.results
+            if result["round"] <= 2 and result["blue"] is not None]
+        assert(len(set(firstRounds)) == len(firstRounds))
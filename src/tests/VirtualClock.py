@@ -0,0 +1,87 @@
+import sys
+import os
+
+import io
+import time
+import unittest
+
+PACKAGE_PARENT = '../game'
+SCRIPT_DIR = os.path.dirname(os.path.realpath(os.path.join(os.getcwd(), os.path.expanduser(__file__))))
+sys.path.append(os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT)))
+
+from domain.Player import Player
+from model.GameModel import GameModel
+from service.Config import Config
+from service.Physics import Physics, PythonPhysics
+from service.Ruleset import Ruleset
+from service.VirtualClock import VirtualClock
+from service.VirtualTimeManager import VirtualTimeManager
+
+MAP_FILE = os.path.normpath(os.path.join(SCRIPT_DIR, PACKAGE_PARENT, "maps/map_01.txt"))
+
+class IdlePlayer(Player):
+
+    def __init__(self, map, rules, team):
+        pass
+
+    def poll(self, pollingData):
+        return {}
+
+class TestVirtualClock(unittest.TestCase):
+
+    def test_timeManager(self):
+        Config.Initialize()
+
+        clock = VirtualClock(1000)
+        stopwatch = VirtualTimeManager(clock)
+        stopwatch.StartTimer()
+
+        # Never goes back
+        clock.Advance(-10)
+        clock.Set(500)
+        assert(stopwatch.GetTimeMs() == 1000)
+
+        # The next frame is waited for by moving the clock
+        frameMs = 1000 / Config.Framerate()
+        assert(stopwatch.NextFrame() == frameMs and clock.timeMs == 1000 + frameMs)
+
+        stopwatch.Mark()
+        stopwatch.Sleep(3 * frameMs)
+        assert(stopwatch.NextFrame() == 3 * frameMs)
+
+    def test_headlessGame(self):
+        Config.Initialize()
+        Ruleset.Initialize()
+        Physics.SetInstance(PythonPhysics())
+
+        ruleset = Ruleset.GetRuleset()
+        saved = ruleset["MaxDurationSeconds"]
+        ruleset["MaxDurationSeconds"] = "30"
+
+        clock = VirtualClock()
+        model = GameModel(IdlePlayer, IdlePlayer, MAP_FILE, clock = clock)
+
+        stopwatch = VirtualTimeManager(clock)
+        stopwatch.StartTimer()
+
+        save_stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        start = time.perf_counter()
+
+        try:
+            while not model.game_over:
+                deltaTime = stopwatch.NextFrame()
+                stopwatch.Mark()
+
+                model.tick(deltaTime)
+        finally:
+            sys.stdout = save_stdout
+            model.stop()
+            ruleset["MaxDurationSeconds"] = saved
+
+        # Nobody captured a flag : a draw, once the countdown and the whole duration passed on the game clock only
+        durationMs = (int(ruleset["StartCountdownSeconds"]) + 30) * 1000
+
+        assert(model.winner is None)
+        assert(durationMs <= model.stopwatch.PeekDeltaTimeMs() < durationMs + 100)
+        assert(time.perf_counter() - start < 15)
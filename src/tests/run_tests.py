@@ -3,8 +3,24 @@
 import unittest
 
 from behavior_trees import TestBehaviorTree
-from ArgBuilder import TestDictBuilder
+from ArgBuilder import TestDictBuilder, TestDeltaDictBuilder, TestBinaryBuilder
 from PythonPhysics import TestPythonPhysics
-from GameModel import TestGameModel
+from GameModel import TestGameModel, TestThinkTime
+from PhysicsEngine import TestPhysicsEngine
+from SpatialGrid import TestSpatialGrid
+from PollingLayout import TestPollingLayout
+from PlayerPool import TestPlayerPool
+from PlayerForkServer import TestPlayerForkServer
+from ResponseDecoder import TestResponseDecoder
+from Astar import TestAstar
+from PathCache import TestPathCache
+from FlowField import TestFlowField
+from JumpPointSearch import TestJumpPointSearch
+from Metrics import TestMetrics
+from PlayerServer import TestPlayerServer
+from Replay import TestReplay
+from VirtualClock import TestVirtualClock
+from TournamentPairing import TestTournament
+from Timeline import TestTimeline
 
 unittest.main()
\ No newline at end of file